@@ -0,0 +1,5 @@
+import sys
+
+from architectures.cli import main
+
+sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+This module contains the catalog of provider services, used to find services without importing every provider module.
+
+Available Functions:
+- get_manifest
+- lookup
+- lazy_loader
+- build_index
+- search
+
+Details for each can be found in the docstrings for the respective function.
+"""
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import re
+import sys
+import threading
+from typing import Iterable, Union
+
+# The services of each provider by service type, written by scripts/generate_providers.py
+_MANIFEST_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "providers", "manifest.json")
+
+# The search index of every service, written by scripts/generate_providers.py
+_INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "index.json")
+
+_PROVIDERS_MODULE = "architectures.providers"
+
+# The manifest is read the first time a service is looked up, and the index the first time one is searched for
+_MANIFEST = {}
+_INDEX = {}
+_MANIFEST_LOCK = threading.Lock()
+
+# Services match a query when they share at least this fraction of its trigrams
+_MIN_SIMILARITY = 0.5
+
+# Split class names such as CloudSearch into words as well as labels and service types
+_WORD_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def get_manifest() -> dict:
+    """Return the services of each provider without importing any provider module.
+
+    Returns
+    -------
+    dict
+        The icon and default label of each service, by provider, service type and class name
+    """
+    if not _MANIFEST:
+        with _MANIFEST_LOCK:
+            if not _MANIFEST:
+                with open(_MANIFEST_FILE, "r", encoding="utf-8") as f:
+                    _MANIFEST.update(json.load(f)["providers"])
+    return _MANIFEST
+
+
+def lookup(*names: str) -> type:
+    """Return the node class of a provider service, importing only the module that defines it.
+
+    Parameters
+    ----------
+    *names : str
+        The provider, service type and service, such as "aws", "compute", "Batch", or the same joined by dots
+
+    Returns
+    -------
+    type
+        The node class of the service
+    """
+    parts = ".".join(names).split(".")
+    if len(parts) != 3 or parts[2] not in get_manifest().get(parts[0], {}).get(parts[1], {}):
+        raise ValueError(f"Unknown service: {'.'.join(names)}")
+
+    provider, service_type, service = parts
+    module = importlib.import_module(f"{_PROVIDERS_MODULE}.{provider}.{service_type}")
+    return getattr(module, service)
+
+
+def lazy_loader(module_name: str) -> tuple:
+    """Return the __getattr__ and __dir__ functions that let a provider package import its modules on first use.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the package, either architectures.providers or one of its provider packages
+
+    Returns
+    -------
+    tuple
+        The __getattr__ and __dir__ functions of the package
+    """
+    path = module_name[len(_PROVIDERS_MODULE):].strip(".").split(".") if module_name != _PROVIDERS_MODULE else []
+
+    def children() -> dict:
+        entries = get_manifest()
+        for part in path:
+            entries = entries.get(part, {})
+        return entries
+
+    def __getattr__(name: str) -> object:
+        if name.startswith("_") or name not in children():
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        return importlib.import_module(f"{module_name}.{name}")
+
+    def __dir__() -> list:
+        return sorted(set(vars(sys.modules[module_name])) | set(children()))
+
+    return __getattr__, __dir__
+
+
+def build_index(services: Iterable[Union[list, tuple]]) -> dict:
+    """Build the search index of a list of services.
+
+    Each word of a service is padded with two spaces in front and one behind before it is split
+    into trigrams, so the first trigrams of a word also match the prefixes of a query.
+
+    Parameters
+    ----------
+    services : Iterable[list, tuple]
+        The provider, service type, class name, default label and icon hash of each service
+
+    Returns
+    -------
+    dict
+        The services sorted by name and the positions of the services containing each trigram
+    """
+    services = sorted(list(service) for service in services)
+    trigrams = {}
+    for position, service in enumerate(services):
+        for trigram in sorted(_get_trigrams(" ".join(service[:4]))):
+            trigrams.setdefault(trigram, []).append(position)
+
+    return {"services": services, "trigrams": dict(sorted(trigrams.items()))}
+
+
+def search(query: str, limit: Union[None, int] = 10, provider: Union[None, str] = None) -> list:
+    """Find services whose names, labels or service types are like a query.
+
+    The search only reads the prebuilt index, so no provider module is imported.
+
+    Parameters
+    ----------
+    query : str
+        The words to search for, which may be misspelled or cut short
+    limit : int
+        The maximum number of results (defaults to 10, or all results if None)
+    provider : str
+        Only return the services of this provider (defaults to all providers)
+
+    Returns
+    -------
+    list
+        The name, provider, service type, class name, label, icon hash and score of each match, best first
+    """
+    query_trigrams = _get_trigrams(query)
+    if not query_trigrams:
+        return []
+
+    index = _get_index()
+    services = index["services"]
+    counts = {}
+    for trigram in query_trigrams:
+        for position in index["trigrams"].get(trigram, ()):
+            counts[position] = counts.get(position, 0) + 1
+
+    words = set(_get_words(query))
+    results = []
+    for position, count in counts.items():
+        score = count / len(query_trigrams)
+        service_provider, service_type, service, label, icon_hash = services[position]
+        if score < _MIN_SIMILARITY or (provider and service_provider != provider):
+            continue
+        # Prefer services named exactly like the query, then services with the fewest other words
+        exact = words == set(_get_words(f"{service} {label}"))
+        results.append(({
+            "name": f"{service_provider}.{service_type}.{service}",
+            "provider": service_provider,
+            "service_type": service_type,
+            "service": service,
+            "label": label,
+            "icon_hash": icon_hash,
+            "score": round(score, 4),
+        }, (-score, not exact, len(label), position)))
+
+    results.sort(key=lambda result: result[1])
+    return [result for result, _ in results[:limit]]
+
+
+def _get_index() -> dict:
+    if not _INDEX:
+        with _MANIFEST_LOCK:
+            if not _INDEX:
+                with open(_INDEX_FILE, "r", encoding="utf-8") as f:
+                    _INDEX.update(json.load(f))
+    return _INDEX
+
+
+def _get_words(text: str) -> list:
+    return [word.lower() for word in _WORD_PATTERN.findall(text)]
+
+
+def _get_trigrams(text: str) -> set:
+    trigrams = set()
+    for word in _get_words(text):
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
@@ -0,0 +1,323 @@
+"""
+This module contains the architectures command line interface.
+
+Available Commands:
+- render
+- search
+- serve
+- watch
+
+Available Functions:
+- main
+- discover_scripts
+- run_script
+- render_scripts
+
+Details for each can be found in the docstrings for the respective function.
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import runpy
+import sys
+import sysconfig
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Union
+
+import architectures
+
+
+def discover_scripts(paths: Iterable[str], pattern: str = "*.py") -> list:
+    """Return the diagram scripts found in a list of files and directories.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        Script files or directories to search recursively
+    pattern : str
+        The file name pattern used to find scripts in directories (defaults to *.py)
+
+    Returns
+    -------
+    list
+        The sorted paths of the scripts
+    """
+    scripts = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = [d for d in dirs if not d.startswith((".", "__"))]
+                for file in files:
+                    if fnmatch.fnmatch(file, pattern) and not file.startswith("__"):
+                        scripts.add(os.path.join(root, file))
+        elif os.path.isfile(path):
+            scripts.add(path)
+        else:
+            raise FileNotFoundError(f"No such file or directory: {path}")
+
+    return sorted(scripts)
+
+
+def run_script(script: str, output_directory: Union[None, str] = None, keep_modules: bool = False) -> dict:
+    """Run a diagram script without showing the output and time it.
+
+    Modules imported from the user's own code are forgotten once the script has run, so
+    scripts in different directories that import a helper of the same name each get their own.
+
+    Parameters
+    ----------
+    script : str
+        The path of the script
+    output_directory : str
+        The directory to write output files to (defaults to the current directory)
+    keep_modules : bool
+        Keep the modules imported by the script, for callers that track them themselves (defaults to False)
+
+    Returns
+    -------
+    dict
+        The script path, whether or not it succeeded, the run time in seconds, the error if it failed,
+        and the output files of the graphs it rendered
+    """
+    # Import here so the search command doesn't pay for the core modules
+    from architectures.core import get_render_log, set_render_log
+
+    # Record the graphs the script renders, in the render log of the caller if there is one
+    owns_render_log = get_render_log() is None
+    if owns_render_log:
+        set_render_log({})
+    render_log = get_render_log()
+    previous = dict(render_log)
+    modules = set(sys.modules)
+
+    environ = os.environ.copy()
+    os.environ["ARCHITECTURES_SHOW"] = "false"
+    if output_directory:
+        os.environ["ARCHITECTURES_OUTPUT_DIRECTORY"] = output_directory
+
+    # Run the script the same way the interpreter would
+    script = os.path.abspath(script)
+    argv = sys.argv
+    path = sys.path[:]
+    sys.argv = [script]
+    sys.path.insert(0, os.path.dirname(script))
+
+    start = time.perf_counter()
+    result = {"script": script, "success": True, "seconds": 0.0, "error": None, "output_files": []}
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        # Scripts may exit early, which is only a failure with a non-zero exit code
+        if e.code not in (0, None):
+            result["success"] = False
+            result["error"] = traceback.format_exc()
+    except Exception:
+        result["success"] = False
+        result["error"] = traceback.format_exc()
+    finally:
+        result["seconds"] = round(time.perf_counter() - start, 4)
+        sys.argv = argv
+        sys.path[:] = path
+        os.environ.clear()
+        os.environ.update(environ)
+
+        result["output_files"] = sorted({
+            os.path.abspath(output_file)
+            for path, entry in render_log.items() if entry is not previous.get(path)
+            for output_file in entry["output_files"]
+        })
+        if owns_render_log:
+            set_render_log(None)
+        if not keep_modules:
+            for name in set(sys.modules) - modules:
+                if _is_user_module(name):
+                    sys.modules.pop(name, None)
+
+    return result
+
+
+def render_scripts(scripts: Iterable[str], jobs: Union[None, int] = None,
+                   output_directory: Union[None, str] = None
+                   ) -> list:
+    """Run diagram scripts in parallel using a pool of worker processes.
+
+    Parameters
+    ----------
+    scripts : Iterable[str]
+        The paths of the scripts
+    jobs : int
+        The number of worker processes (defaults to the number of CPUs)
+    output_directory : str
+        The directory to write output files to (defaults to the current directory)
+
+    Returns
+    -------
+    list
+        The result of each script in the same order as the scripts
+    """
+    scripts = list(scripts)
+    if output_directory:
+        output_directory = os.path.abspath(output_directory)
+
+    if jobs == 1:
+        results = {script: run_script(script, output_directory) for script in scripts}
+    else:
+        results = {}
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(run_script, script, output_directory): script for script in scripts}
+            for future in as_completed(futures):
+                script = futures[future]
+                try:
+                    results[script] = future.result()
+                except Exception:
+                    # The worker process itself failed, for example if it crashed
+                    results[script] = {
+                        "script": os.path.abspath(script),
+                        "success": False,
+                        "seconds": 0.0,
+                        "error": traceback.format_exc(),
+                        "output_files": [],
+                    }
+
+    results = [results[script] for script in scripts]
+
+    # Scripts that write the same output file overwrite each other, so neither output can be trusted
+    writers = {}
+    for result in results:
+        for output_file in result["output_files"]:
+            writers.setdefault(output_file, []).append(result)
+    for output_file, duplicates in writers.items():
+        if len(duplicates) > 1:
+            names = ", ".join(os.path.relpath(result["script"]) for result in duplicates)
+            for result in duplicates:
+                result["success"] = False
+                result["error"] = (result["error"] or "") + f"{output_file} is written by more than one script: {names}\n"
+
+    return results
+
+
+def _is_user_module(name: str) -> bool:
+    """
+    Whether or not a module was loaded from the user's own code rather than a library.
+    """
+    path = getattr(sys.modules.get(name), "__file__", None)
+    if not path:
+        return False
+    path = os.path.abspath(path)
+
+    library_paths = {sysconfig.get_paths()[key] for key in ("stdlib", "platstdlib", "purelib", "platlib")}
+    library_paths.add(os.path.dirname(os.path.abspath(architectures.__file__)))
+    return not any(path.startswith(os.path.abspath(library_path) + os.sep) for library_path in library_paths)
+
+
+def _render_command(args: argparse.Namespace) -> int:
+    scripts = discover_scripts(args.paths, args.pattern)
+
+    start = time.perf_counter()
+    results = render_scripts(scripts, jobs=args.jobs, output_directory=args.output_directory)
+    seconds = round(time.perf_counter() - start, 4)
+
+    failures = [result for result in results if not result["success"]]
+    for result in results:
+        status = "ok" if result["success"] else "FAILED"
+        print(f"{status:<6} {result['seconds']:>8.2f}s  {os.path.relpath(result['script'])}")
+    for result in failures:
+        print(f"\n{os.path.relpath(result['script'])}\n{result['error']}", file=sys.stderr)
+    print(f"\nRendered {len(results) - len(failures)} of {len(results)} scripts in {seconds:.2f}s.")
+
+    if args.summary:
+        summary = {
+            "scripts": len(results),
+            "failures": len(failures),
+            "seconds": seconds,
+            "results": results,
+        }
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    return 1 if failures else 0
+
+
+def _search_command(args: argparse.Namespace) -> int:
+    # Import here so the render command doesn't pay for the search index
+    from architectures.catalog import search
+
+    results = search(" ".join(args.query), limit=args.limit, provider=args.provider)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        width = max((len(result["name"]) for result in results), default=0)
+        for result in results:
+            print(f"{result['name']:<{width}}  {result['label']}")
+    return 0 if results else 1
+
+
+def _serve_command(args: argparse.Namespace) -> int:
+    # Import here so the render command doesn't pay for the server modules
+    from architectures.render import RenderCache
+    from architectures.server import serve
+
+    cache = RenderCache(args.cache_directory) if args.cache_directory else None
+    print(f"Serving diagrams on http://{args.host}:{args.port}/render", file=sys.stderr)
+    serve(args.host, args.port, workers=args.workers, max_queue=args.max_queue,
+          timeout=args.timeout, cache=cache, allow_source=args.allow_source)
+    return 0
+
+
+def _watch_command(args: argparse.Namespace) -> int:
+    # Import here so the render command doesn't pay for the watch modules
+    from architectures.watch import watch
+
+    watch(args.script, output_directory=args.output_directory, port=args.port, host=args.host,
+          interval=args.interval, debounce=args.debounce)
+    return 0
+
+
+def main(argv: Union[None, list] = None) -> int:
+    """
+    Run the architectures command line interface.
+    """
+    parser = argparse.ArgumentParser(prog="architectures", description="Tools for creating architecture as code using Python.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    render_parser = subparsers.add_parser("render", help="Render diagram scripts in parallel.")
+    render_parser.add_argument("paths", nargs="+", help="Diagram scripts or directories containing them.")
+    render_parser.add_argument("-j", "--jobs", type=int, default=None, help="The number of scripts to run at once (defaults to the number of CPUs).")
+    render_parser.add_argument("-p", "--pattern", default="*.py", help="The file name pattern used to find scripts in directories.")
+    render_parser.add_argument("-o", "--output-directory", default=None, help="The directory to write output files to.")
+    render_parser.add_argument("-s", "--summary", default=None, help="A file to write a JSON summary of the run to.")
+    render_parser.set_defaults(func=_render_command)
+
+    search_parser = subparsers.add_parser("search", help="Find provider services by name.")
+    search_parser.add_argument("query", nargs="+", help="The words to search for.")
+    search_parser.add_argument("-p", "--provider", default=None, help="Only show the services of this provider.")
+    search_parser.add_argument("-n", "--limit", type=int, default=10, help="The maximum number of services to show.")
+    search_parser.add_argument("--json", action="store_true", help="Show the results as JSON.")
+    search_parser.set_defaults(func=_search_command)
+
+    serve_parser = subparsers.add_parser("serve", help="Run a local diagram render server.")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="The address to listen on.")
+    serve_parser.add_argument("--port", type=int, default=8000, help="The port to listen on.")
+    serve_parser.add_argument("-w", "--workers", type=int, default=None, help="The number of renders to run at once (defaults to the number of CPUs).")
+    serve_parser.add_argument("-q", "--max-queue", type=int, default=64, help="The number of jobs that can wait for a worker before new jobs are rejected.")
+    serve_parser.add_argument("-t", "--timeout", type=float, default=60.0, help="The default number of seconds a job may take.")
+    serve_parser.add_argument("-c", "--cache-directory", default=None, help="The directory of the shared render cache (defaults to the ARCHITECTURES_RENDER_CACHE environment variable).")
+    serve_parser.add_argument("--allow-source", action="store_true", help="Render raw DOT source, which can read files on the server (only for trusted clients).")
+    serve_parser.set_defaults(func=_serve_command)
+
+    watch_parser = subparsers.add_parser("watch", help="Render a diagram script again whenever it changes.")
+    watch_parser.add_argument("script", help="The diagram script.")
+    watch_parser.add_argument("-o", "--output-directory", default=None, help="The directory to write output files to.")
+    watch_parser.add_argument("--port", type=int, default=None, help="Serve a page showing the latest output on this port.")
+    watch_parser.add_argument("--host", default="127.0.0.1", help="The address the page is served on.")
+    watch_parser.add_argument("-i", "--interval", type=float, default=0.5, help="The number of seconds between checks for changes.")
+    watch_parser.add_argument("-d", "--debounce", type=float, default=0.3, help="The number of seconds files must stay unchanged before rendering.")
+    watch_parser.set_defaults(func=_watch_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
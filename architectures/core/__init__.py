@@ -2,6 +2,7 @@
 This module contains all core classes required for drawing diagrams.
 
 Available Classes:
+- StateIndex
 - Graph
 - Cluster
 - Node
@@ -15,27 +16,38 @@ Available Functions:
 - set_cluster
 - get_state
 - set_state
+- get_state_index
+- get_render_log
+- set_render_log
 - update_state
 - search_state
 - wrap_text
+- quote
+- attr_list
 - get_node_obj
 
 Details for each can be found in the docstrings for the respective class or function.
 """
 from __future__ import annotations
 
+import asyncio
 import contextvars
+import functools
 import os
-from pathlib import Path
-from typing import Any, Union
+import re
+from typing import Any, Iterator, Union
 
-from graphviz import Digraph
+from graphviz import Digraph, view
 
+from architectures.render import (COSMETIC_ATTRIBUTES, RenderCache, inline_svg_file, inline_svg_images, pipe_lines,
+                                  pipe_lines_async, read_layout, render_lines, render_lines_async, write_lines)
+from architectures.icons import IconCache, resolve_icon
 from architectures.themes import Default
 
 __graph = contextvars.ContextVar("graph")
 __cluster = contextvars.ContextVar("cluster")
 __state = contextvars.ContextVar("state")
+__render_log = contextvars.ContextVar("render_log")
 
 
 def get_graph() -> Union[None, Graph]:
@@ -72,9 +84,118 @@ def set_cluster(cluster: Cluster) -> None:
     __cluster.set(cluster)
 
 
-def get_state() -> Union[None, dict]:
+def get_render_log() -> Union[None, dict]:
     """
-    Get the current node to cluster mapping.
+    Get the current render log.
+    """
+    try:
+        return __render_log.get()
+    except LookupError:
+        return None
+
+
+def set_render_log(render_log: Union[None, dict]) -> None:
+    """
+    Set the current render log.
+
+    While a render log is set, every graph rendered records its source and output files in it by
+    output path, and graphs whose source has not changed since they were last rendered are skipped.
+    """
+    __render_log.set(render_log)
+
+
+class StateIndex():
+    """
+    Index the containment hierarchy of a graph by object id.
+
+    Every object keeps a pointer to its parent and containers keep an ordered list of
+    their children, so adding an object is O(1) and listing the contents of a cluster
+    is O(children) regardless of how large the rest of the graph is.
+    """
+
+    def __init__(self, root: Graph) -> None:
+        """
+        :param root: The graph at the top of the hierarchy.
+        """
+        self.root = root
+        self._objects = {id(root): root}
+        self._parents = {id(root): None}
+        self._children = {id(root): []}
+
+    def __contains__(self, obj: Any) -> bool:
+        return id(obj) in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def add(self, parent: Union[Graph, Cluster], child: Union[Cluster, Node]) -> None:
+        """
+        Add a cluster or node to the children of a graph or cluster.
+        """
+        parent_id = id(parent)
+        if parent_id not in self._children:
+            raise KeyError(f"{parent} is not a container in the current state")
+
+        child_id = id(child)
+        self._objects[child_id] = child
+        self._parents[child_id] = parent
+        self._children[parent_id].append(child)
+        if isinstance(child, Cluster):
+            self._children.setdefault(child_id, [])
+
+    def parent(self, obj: Union[Cluster, Node]) -> Union[None, Graph, Cluster]:
+        """
+        Return the graph or cluster that directly contains the object.
+        """
+        return self._parents[id(obj)]
+
+    def children(self, obj: Union[Graph, Cluster]) -> list:
+        """
+        Return the clusters and nodes directly contained in the object, in creation order.
+        """
+        return list(self._children.get(id(obj), []))
+
+    def to_dict(self, obj: Union[None, Graph, Cluster] = None) -> dict:
+        """
+        Return the hierarchy below the object (the root by default) as a nested dictionary
+        in the form {container: [node, {cluster: [...]}, ...]}.
+        """
+        if obj is None:
+            obj = self.root
+
+        items = []
+        for child in self._children.get(id(obj), []):
+            if id(child) in self._children:
+                items.append(self.to_dict(child))
+            else:
+                items.append(child)
+
+        return {obj: items}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> StateIndex:
+        """
+        Build an index from a nested dictionary as returned by to_dict.
+        """
+        (root, items), = state.items()
+        index = cls(root)
+
+        def _add(parent, items):
+            for item in items:
+                if isinstance(item, dict):
+                    (child, child_items), = item.items()
+                    index.add(parent, child)
+                    _add(child, child_items)
+                else:
+                    index.add(parent, item)
+
+        _add(root, items)
+        return index
+
+
+def get_state_index() -> Union[None, StateIndex]:
+    """
+    Get the containment index for the current graph.
     """
     try:
         return __state.get()
@@ -82,48 +203,79 @@ def get_state() -> Union[None, dict]:
         return None
 
 
-def set_state(state: dict) -> None:
+def get_state() -> Union[None, dict]:
+    """
+    Get the current node to cluster mapping.
+
+    The nested dictionary is built on demand from the containment index.
+    """
+    index = get_state_index()
+    if index is None:
+        return None
+    return index.to_dict()
+
+
+def set_state(state: Union[None, dict, StateIndex]) -> None:
     """
     Set a node to cluster mapping.
     """
+    if isinstance(state, dict):
+        state = StateIndex.from_dict(state)
+    # Graphs add their objects to their own index, so an index set for a graph replaces it
+    if state is not None and isinstance(state.root, Graph):
+        state.root._state = state
     __state.set(state)
 
 
-def update_state(state: dict, target_key: Union[Cluster, Node], target_value: Union[dict, Node]) -> dict:
+def update_state(state: Union[dict, StateIndex], target_key: Union[Graph, Cluster], target_value: Union[dict, Cluster, Node]) -> StateIndex:
     """
-    Create a map of all resources hierarchial relationship as a nested dictionary.
+    Add a cluster or node to the children of the target graph or cluster.
+
+    A cluster given as a nested dict in the form {cluster: [...]} is added with everything it contains.
     """
     if isinstance(state, dict):
-        for k, v in state.items():
-            if k is target_key:
-                v.append(target_value)
-            else:
-                if isinstance(v, list):
-                    for i in v:
-                        update_state(i, target_key, target_value)
+        state = StateIndex.from_dict(state)
+
+    if isinstance(target_value, dict):
+        if len(target_value) != 1:
+            raise ValueError(f"Expected a single {{cluster: [...]}} item, got {len(target_value)} keys")
+        (target_value, items), = target_value.items()
+        if not isinstance(target_value, Cluster):
+            raise TypeError(f"Only clusters can contain other items, got {type(target_value).__name__}")
+        state.add(target_key, target_value)
+        for item in items:
+            update_state(state, target_value, item)
+    else:
+        state.add(target_key, target_value)
 
-        return {k: v}
+    return state
 
 
-def search_state(search_dict: dict, search_key: Cluster, output: list = None) -> list:
+def search_state(search_dict: Union[dict, StateIndex], search_key: Union[Graph, Cluster], output: list = None) -> list:
     """
-    Search nested dicts and lists for the search_value (key)
-    and return the corresponding value.
+    Return the items directly below the search_key.
+
+    Items are read from a StateIndex without copying the hierarchy below them, while clusters
+    in a nested dict are returned as the nested dicts they are stored as.
     """
     if output is None:
         output = []
-    
+
+    if isinstance(search_dict, StateIndex):
+        output.extend(search_dict.children(search_key))
+        return output
+
     for k, v in search_dict.items():
-        if k is not search_key and isinstance(v, list):
+        if k is search_key:
+            output.extend(v)
+        elif isinstance(v, list):
             for item in v:
                 if isinstance(item, dict):
                     search_state(item, search_key, output)
-        else:
-            for item in v:
-                output.append(item)
 
     return output
 
+
 def wrap_text(text: str, max_length: int = 16) -> str:
     """Return a new label with wrapped text.
 
@@ -160,6 +312,102 @@ def wrap_text(text: str, max_length: int = 16) -> str:
         return text
 
 
+_ID_PATTERN = re.compile(r"([a-zA-Z_][a-zA-Z0-9_]*|-?(\.[0-9]+|[0-9]+(\.[0-9]*)?))$")
+_HTML_PATTERN = re.compile(r"<.*>$", re.DOTALL)
+_UNESCAPED_QUOTE_PATTERN = re.compile(r'(?<!\\)"')
+_DOT_KEYWORDS = {"node", "edge", "graph", "digraph", "subgraph", "strict"}
+
+# Characters replaced when deriving object ids from labels
+_NON_ID_PATTERN = re.compile(r"[^a-z0-9]+")
+_MAX_ID_LENGTH = 64
+
+# Graphviz defaults for edge attributes that are reset explicitly when connecting objects
+_DEFAULT_EDGE_ATTRS = {"ltail": "", "lhead": ""}
+
+# Graphviz defaults used to size icons when the theme doesn't set them
+_DEFAULT_NODE_WIDTH = 0.75
+_DEFAULT_DPI = 96.0
+
+# The Graphviz command used to draw a graph from a cached layout without laying it out again
+_POSITIONED_ENGINE = "neato"
+_POSITIONED_OPTIONS = ("-n2",)
+
+
+def quote(identifier: Any) -> str:
+    """Return a DOT identifier, quoting it if needed.
+
+    Parameters
+    ----------
+    identifier : Any
+        The identifier or attribute value
+
+    Returns
+    -------
+    str
+        The identifier as it should appear in DOT source
+    """
+    identifier = str(identifier)
+    if _HTML_PATTERN.match(identifier):
+        return identifier
+    if not _ID_PATTERN.match(identifier) or identifier.lower() in _DOT_KEYWORDS:
+        return '"' + _UNESCAPED_QUOTE_PATTERN.sub(r'\\"', identifier) + '"'
+    return identifier
+
+
+def attr_list(label: Union[None, str] = None, attrs: Union[None, dict] = None) -> str:
+    """Return a DOT attribute list such as ' [label=A color=red]'.
+
+    Parameters
+    ----------
+    label : str
+        The label, emitted first when given
+    attrs : dict
+        Other attributes, skipping any set to None
+
+    Returns
+    -------
+    str
+        The attribute list, or an empty string if there are no attributes
+    """
+    items = [f"label={quote(label)}"] if label is not None else []
+    if attrs:
+        items += [f"{quote(k)}={quote(v)}" for k, v in attrs.items() if v is not None]
+    if not items:
+        return ""
+    return " [" + " ".join(items) + "]"
+
+
+def _layout_attrs(attrs: dict, positions: Union[None, dict] = None, layout_only: bool = False) -> dict:
+    """
+    Return attributes without the cosmetic ones when computing a layout, or with the positions from a layout added.
+    """
+    if layout_only:
+        return {k: v for k, v in attrs.items() if k.lower() not in COSMETIC_ATTRIBUTES}
+    if positions:
+        return attrs | positions
+    return attrs
+
+
+async def _run_blocking(func: Any, *args: Any) -> Any:
+    """
+    Run a function that reads or writes files in the default executor, keeping the current context such as the render log.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(context.run, func, *args))
+
+
+def _get_remaining(deadline: Union[None, float]) -> Union[None, float]:
+    """
+    Return the seconds left before an event loop time, raising asyncio.TimeoutError if it has passed.
+    """
+    if deadline is None:
+        return None
+    remaining = deadline - asyncio.get_running_loop().time()
+    if remaining <= 0:
+        raise asyncio.TimeoutError()
+    return remaining
+
+
 def get_node_obj(obj: Union[Cluster, Node]) -> Node:
     """Return the most central Node in a Cluster.
 
@@ -174,19 +422,8 @@ def get_node_obj(obj: Union[Cluster, Node]) -> Node:
         The most centrally located Node object
     """
     if isinstance(obj, Cluster):
-        state = get_state()
-        values = search_state(state, obj)
-        if any(isinstance(x, Node) for x in values):
-            node_list = [item for item in values if isinstance(item, Node)]
-            count = len(node_list)
-            center_node_index = round(count/2) - 1
-            obj = node_list[center_node_index]
-        else:
-            for item in values:
-                if isinstance(item, dict):
-                    for k, v in item.items():
-                        return get_node_obj(k)
-    
+        obj = obj.center_node
+
     return obj
 
 
@@ -195,24 +432,49 @@ class Graph():
     Create and set default settings for a graph and its clusters, nodes, and edges.
     """
     def __init__(self, name: str = "My Architecture",
-                 output_file_format: str = "png",
+                 output_file_format: Union[str, list] = "png",
                  theme: Any = None, show: bool = True,
+                 save_source: bool = False,
+                 cache: Union[None, RenderCache] = None,
+                 render_on_exit: bool = True,
+                 output_directory: Union[None, str] = None,
+                 icon_cache: Union[None, IconCache] = None,
+                 inline_images: bool = False,
                  **attrs: Any
                  ) -> None:
         """
         :param str name: The name of the graph.
-        :param str output_file_format: The format of the output file.
+        :param output_file_format: The format of the output file, or a list of formats rendered from a single layout.
         :param theme: The base theme to apply to the graph and its clusters, nodes, and edges.
         :param bool show: Flag used to determine whether or not the graph will render.
+        :param bool save_source: Flag used to determine whether or not the DOT source is also written to a file.
+        :param RenderCache cache: The cache used to skip rendering unchanged graphs (defaults to the ARCHITECTURES_RENDER_CACHE environment variable).
+        :param bool render_on_exit: Flag used to determine whether or not output files are rendered when the graph context exits.
+        :param str output_directory: The directory to write output files to (defaults to the ARCHITECTURES_OUTPUT_DIRECTORY environment variable or the current directory).
+        :param IconCache icon_cache: The cache of icons resized to fit the nodes (defaults to the ARCHITECTURES_ICON_CACHE environment variable).
+        :param bool inline_images: Flag used to determine whether or not icons are embedded in SVG output so it doesn't depend on the icon files.
         """
 
         # Set graph and output file name
         self.name = name
         self.output_file_name = "-".join(self.name.split()).lower()
         self.output_file_format = output_file_format
+        self.output_directory = output_directory or os.environ.get("ARCHITECTURES_OUTPUT_DIRECTORY") or None
+        self.engine = "dot"
+
+        # Record the graph contents so the DOT source is only generated when rendering
+        self.graph_attr = {}
+        self.node_attr = {}
+        self.edge_attr = {}
+        self._body = []
+        self._edges = []
 
-        # Create the graph
-        self.dot = Digraph(name=self.name, filename=self.output_file_name, engine="dot")
+        # Track generated ids so an unchanged diagram always produces the same source
+        self._ids = set()
+        self._id_counts = {}
+
+        # The render log entry of a render in progress, recorded once the render succeeds
+        self._render_entry = None
 
         # Set the theme
         if theme is None:
@@ -221,58 +483,459 @@ class Graph():
             self.theme = theme
 
         # Set global graph attributes
-        self.dot.graph_attr.update(self.theme.graph_attrs)
-        self.dot.graph_attr.update(attrs)
-        self.dot.graph_attr["label"] = self.name
+        self.graph_attr.update(self.theme.graph_attrs)
+        self.graph_attr.update(attrs)
+        self.graph_attr["label"] = self.name
 
         # Set global node attributes
-        self.dot.node_attr.update(self.theme.node_attrs)
+        self.node_attr.update(self.theme.node_attrs)
 
         # Set global edge attributes
-        self.dot.edge_attr.update(self.theme.edge_attrs)
+        self.edge_attr.update(self.theme.edge_attrs)
+
+        # Set option to show architecture diagram, which the ARCHITECTURES_SHOW environment variable can turn off
+        self.show = show and os.environ.get("ARCHITECTURES_SHOW", "true").lower() not in ("0", "false", "no")
+
+        # Set option to keep the DOT source next to the output file
+        self.save_source = save_source
+
+        # Set the cache used to reuse output from unchanged graphs
+        if cache is None:
+            self.cache = RenderCache.from_environment()
+        else:
+            self.cache = cache
 
-        # Set option to show architecture diagram
-        self.show = show
+        # Set option to render output files when the graph context exits
+        self.render_on_exit = render_on_exit
 
-        # Set initial state to just the Graph
-        set_state({self: []})
+        # Set option to embed icons in SVG output
+        self.inline_images = inline_images
 
-    # def __str__(self) -> str:
-    #     return str(self.dot)
+        # Set the cache used to draw icons at the size of the nodes
+        if icon_cache is None:
+            self.icon_cache = IconCache.from_environment()
+        else:
+            self.icon_cache = icon_cache
+
+        # Set initial state to just the Graph, kept on the graph so several graphs can be built side by side
+        self._state = StateIndex(self)
+        set_state(self._state)
+
+    def __str__(self) -> str:
+        return self.source
 
     def __enter__(self) -> Graph:
         set_graph(self)
+        set_state(self._state)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        self.render()
-        # Remove the graphviz file leaving only the image.
-        os.remove(self.output_file_name)
+        if self.render_on_exit:
+            self.render()
         set_graph(None)
 
+    async def __aenter__(self) -> Graph:
+        set_graph(self)
+        set_state(self._state)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if self.render_on_exit:
+                await self.render_async()
+        finally:
+            set_graph(None)
+
+    @property
+    def output_file_formats(self) -> list:
+        """
+        The formats to render the graph to.
+        """
+        if isinstance(self.output_file_format, str):
+            return [self.output_file_format]
+        return list(self.output_file_format)
+
+    @property
+    def output_files(self) -> list:
+        """
+        The paths of the files created when rendering, one for each output format.
+        """
+        return [
+            f"{self.output_path}.{output_file_format.split(':')[0]}"
+            for output_file_format in self.output_file_formats
+        ]
+
+    @property
+    def output_path(self) -> str:
+        """
+        The path of the output files without an extension.
+        """
+        if self.output_directory:
+            return os.path.join(self.output_directory, self.output_file_name)
+        return self.output_file_name
+
+    @property
+    def source(self) -> str:
+        """
+        The DOT source for the graph.
+        """
+        return "".join(self._iter_source())
+
     def node(self, name: str, label: str, **attrs: Any) -> None:
         """
         Create a node.
+
+        Only attributes that differ from the graph-level node defaults are kept.
         """
-        self.dot.node(name, label=label, **attrs)
+        attrs = self.theme.get_delta_dict(self.node_attr, attrs)
+        self._body.append((name, label, attrs))
 
     def edge(self, start_node: Node, end_node: Node, **attrs: Any) -> None:
         """
         Connect individual or lists of nodes with edges.
+
+        Only attributes that differ from the graph-level edge defaults are kept.
         """
-        self.dot.edge(start_node.id, end_node.id, **attrs)
+        attrs = self.theme.get_delta_dict(_DEFAULT_EDGE_ATTRS | self.edge_attr, attrs)
+        self._edges.append((start_node.id, end_node.id, attrs))
 
-    def subgraph(self, dot: Digraph) -> None:
+    def subgraph(self, dot: Union[Cluster, Digraph]) -> None:
         """
         Create a subgraph for grouping nodes.
         """
-        self.dot.subgraph(dot)
+        self._body.append(dot)
+
+    def new_id(self, prefix: str, label: str = "", parent: Union[None, Cluster] = None) -> str:
+        """
+        Return a stable, unique id for an object in the graph.
+
+        The id is derived from the label and the id of the parent cluster so it does not
+        change between runs.  Objects without a label, or whose id is already taken, are
+        numbered in creation order.
+        """
+        parts = [prefix]
+        if parent is not None:
+            parts.append(parent.id.split("_", 1)[-1])
+        slug = _NON_ID_PATTERN.sub("_", str(label).lower()).strip("_")
+        if slug:
+            parts.append(slug)
+        base = "_".join(parts)[:_MAX_ID_LENGTH].rstrip("_")
+
+        count = self._id_counts.get(base, 0)
+        new_id = base if slug and count == 0 else None
+        while new_id is None or new_id in self._ids:
+            count += 1
+            new_id = base if slug and count == 1 else f"{base}_{count}"
+        self._id_counts[base] = count
+        self._ids.add(new_id)
+
+        return new_id
 
     def render(self) -> None:
         """
         Generate output file.
+
+        The DOT source is streamed straight into the layout process as it is generated, and
+        every output format is written from a single layout.
+        """
+        missing = self._prepare_render()
+        if missing is None:
+            return
+
+        # Lay the graph out once for every format that was not cached
+        source_written = False
+        if missing:
+            missing_formats, missing_files, _ = zip(*missing)
+            if self._reuses_layout():
+                # Draw from the cached layout and keep the saved source free of positions
+                render_lines(self._iter_source(layout=self._get_layout()), list(missing_files), list(missing_formats),
+                             engine=_POSITIONED_ENGINE, options=_POSITIONED_OPTIONS)
+            else:
+                render_lines(self._iter_source(), list(missing_files), list(missing_formats),
+                             engine=self.engine, source_file=self.output_path if self.save_source else None)
+                source_written = True
+
+        self._finish_render(missing, source_written)
+
+    async def render_async(self, timeout: Union[None, float] = None) -> None:
+        """
+        Generate output file without blocking the event loop.
+
+        Reading and writing the cache, the source and SVG output runs in the default executor.
+
+        :param float timeout: The number of seconds to wait for Graphviz before giving up, shared by every step of the render (defaults to no limit).
+        """
+        deadline = None if timeout is None else asyncio.get_running_loop().time() + timeout
+
+        missing = await _run_blocking(self._prepare_render)
+        if missing is None:
+            return
+
+        # Lay the graph out once for every format that was not cached
+        source_written = False
+        if missing:
+            missing_formats, missing_files, _ = zip(*missing)
+            if self._reuses_layout():
+                # Draw from the cached layout and keep the saved source free of positions
+                layout = await self._get_layout_async(deadline)
+                await render_lines_async(self._iter_source(layout=layout), list(missing_files), list(missing_formats),
+                                         engine=_POSITIONED_ENGINE, timeout=_get_remaining(deadline),
+                                         options=_POSITIONED_OPTIONS)
+            else:
+                await render_lines_async(self._iter_source(), list(missing_files), list(missing_formats),
+                                         engine=self.engine, source_file=self.output_path if self.save_source else None,
+                                         timeout=_get_remaining(deadline))
+                source_written = True
+
+        await _run_blocking(self._finish_render, missing, source_written)
+
+    def pipe(self, format: Union[None, str] = None) -> bytes:
+        """
+        Return the rendered graph as bytes without writing any files.
+
+        :param str format: The output format (defaults to the first output file format).
+        """
+        if format is None:
+            format = self.output_file_formats[0]
+        output = pipe_lines(self._iter_source(), format, engine=self.engine)
+        return self._inline_output(output, format)
+
+    async def pipe_async(self, format: Union[None, str] = None, timeout: Union[None, float] = None) -> bytes:
+        """
+        Return the rendered graph as bytes without writing any files or blocking the event loop.
+
+        :param str format: The output format (defaults to the first output file format).
+        :param float timeout: The number of seconds to wait for Graphviz before giving up (defaults to no limit).
+        """
+        if format is None:
+            format = self.output_file_formats[0]
+        output = await pipe_lines_async(self._iter_source(), format, engine=self.engine, timeout=timeout)
+        return await _run_blocking(self._inline_output, output, format)
+
+    def _prepare_render(self) -> Union[None, list]:
+        """
+        Return None if the graph is unchanged since it was last rendered, otherwise copy cached
+        output files into place and return the (format, file, cache key) of the rest.
+        """
+        if self._is_unchanged():
+            return None
+        return self._get_missing_outputs()
+
+    def _finish_render(self, missing: list, source_written: bool) -> None:
+        """
+        Cache the newly rendered output files, write the source if it was not written while
+        rendering, embed icons, record the render in the render log and show the output.
+        """
+        if missing:
+            _, missing_files, missing_keys = zip(*missing)
+            self._cache_outputs(missing_files, missing_keys)
+        if self.save_source and not source_written:
+            write_lines(self._iter_source(), self.output_path)
+
+        self._inline_images()
+        self._log_render()
+
+        if self.show:
+            view(self.output_files[0], quiet=True)
+
+    def _inline_output(self, output: bytes, format: str) -> bytes:
+        """
+        Embed the icons in piped SVG output when inline images are turned on.
+        """
+        if self.inline_images and format.split(":")[0] == "svg":
+            output = inline_svg_images(output.decode("utf-8")).encode("utf-8")
+        return output
+
+    def _inline_images(self) -> None:
+        """
+        Embed the icons in SVG output files when inline images are turned on.
+
+        This runs after outputs are cached so the cache keeps the plain output for every graph.
+        """
+        if not self.inline_images:
+            return
+        for output_file_format, output_file in zip(self.output_file_formats, self.output_files):
+            if output_file_format.split(":")[0] == "svg":
+                inline_svg_file(output_file)
+
+    def _is_unchanged(self) -> bool:
+        """
+        Return whether or not the last render of the graph in the render log is still up to date.
+
+        A graph that changed is removed from the log until it renders successfully, so a failed
+        render is never mistaken for an up to date one.
+        """
+        render_log = get_render_log()
+        self._render_entry = None
+        if render_log is None:
+            return False
+
+        # Files referenced by the graph, such as icons, are compared by their size and modification time
+        files = {}
+        for path in self._iter_files():
+            try:
+                stat = os.stat(path)
+                files[path] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                files[path] = None
+
+        entry = {"source": self.source, "output_files": self.output_files, "files": files}
+        previous = render_log.pop(self.output_path, None)
+        if previous == entry and all(os.path.exists(output_file) for output_file in entry["output_files"]):
+            render_log[self.output_path] = entry
+            return True
+
+        self._render_entry = entry
+        return False
+
+    def _log_render(self) -> None:
+        """
+        Record a successful render in the render log.
+        """
+        render_log = get_render_log()
+        if render_log is not None and self._render_entry is not None:
+            render_log[self.output_path] = self._render_entry
+        self._render_entry = None
+
+    def _get_missing_outputs(self) -> list:
         """
-        self.dot.render(format=self.output_file_format, view=self.show, quiet=True)
+        Copy cached output files into place and return the (format, file, cache key) of the rest.
+        """
+        output_files = self.output_files
+        output_file_formats = self.output_file_formats
+
+        if self.output_directory:
+            os.makedirs(self.output_directory, exist_ok=True)
+
+        # Reuse the output from an earlier render of the same graph when possible
+        if self.cache:
+            keys = self.cache.keys(self._iter_source(), output_file_formats, self.engine, self._iter_files())
+        else:
+            keys = [None] * len(output_file_formats)
+
+        return [
+            (output_file_format, output_file, key)
+            for output_file_format, output_file, key in zip(output_file_formats, output_files, keys)
+            if not (key and self.cache.get(key, output_file))
+        ]
+
+    def _cache_outputs(self, output_files: list, keys: list) -> None:
+        """
+        Add newly rendered output files to the cache.
+        """
+        for output_file, key in zip(output_files, keys):
+            if key:
+                self.cache.put(key, output_file)
+
+    def _reuses_layout(self) -> bool:
+        """
+        Whether or not the graph is drawn from a cached layout.
+        """
+        return bool(self.cache and self.cache.layouts and self._has_positions())
+
+    def _layout_key(self) -> str:
+        return self.cache.key(self._iter_source(layout_only=True), "layout", self.engine, self._iter_files())
+
+    def _get_layout(self) -> dict:
+        """
+        Return the cached layout of the graph, laying it out first if needed.
+        """
+        key = self._layout_key()
+        data = self.cache.read(key)
+        if data is None:
+            data = pipe_lines(self._iter_source(layout_only=True), "json", engine=self.engine)
+            self.cache.write(key, data)
+        return read_layout(data)
+
+    async def _get_layout_async(self, deadline: Union[None, float] = None) -> dict:
+        """
+        Return the cached layout of the graph, laying it out first if needed, without blocking the event loop.
+
+        :param float deadline: The event loop time the layout must finish by (defaults to no limit).
+        """
+        key = self._layout_key()
+        data = await _run_blocking(self.cache.read, key)
+        if data is None:
+            data = await pipe_lines_async(self._iter_source(layout_only=True), "json", engine=self.engine,
+                                          timeout=_get_remaining(deadline))
+            await _run_blocking(self.cache.write, key, data)
+        return read_layout(data)
+
+    def _has_positions(self, body: Union[None, list] = None) -> bool:
+        """
+        Whether or not every object can be given a position from a layout, which is not the case for Digraph subgraphs.
+        """
+        for item in self._body if body is None else body:
+            if isinstance(item, Cluster):
+                if not self._has_positions(item._body):
+                    return False
+            elif not isinstance(item, tuple):
+                return False
+        return True
+
+    def _iter_source(self, layout: Union[None, dict] = None, layout_only: bool = False) -> Iterator[str]:
+        """
+        Generate the lines of DOT source for the graph in a single pass.
+
+        :param dict layout: The positions from read_layout used to draw the graph without laying it out again.
+        :param bool layout_only: Flag used to leave out cosmetic attributes and add edge ids when computing a layout.
+        """
+        yield f"digraph {quote(self.name)} {{\n"
+        for keyword, attrs in (("graph", self.graph_attr), ("node", self.node_attr), ("edge", self.edge_attr)):
+            positions = layout["graph"] if layout and keyword == "graph" else None
+            attrs = _layout_attrs(attrs, positions, layout_only)
+            if attrs:
+                yield f"\t{keyword}{attr_list(attrs=attrs)}\n"
+        yield from self._iter_body(self._body, "\t", self.graph_attr, layout, layout_only)
+        for i, (tail, head, attrs) in enumerate(self._edges):
+            edge_id = f"e{i}"
+            attrs = _layout_attrs(attrs, layout["edges"].get(edge_id) if layout else None, layout_only)
+            if layout_only:
+                attrs["id"] = edge_id
+            yield f"\t{quote(tail)} -> {quote(head)}{attr_list(attrs=attrs)}\n"
+        yield "}\n"
+
+    def _iter_files(self, body: Union[None, list] = None) -> Iterator[str]:
+        """
+        Generate the paths of files referenced by the graph, such as node icons.
+        """
+        if body is None:
+            body = self._body
+            if self.node_attr.get("image"):
+                yield self.node_attr["image"]
+
+        for item in body:
+            if isinstance(item, tuple):
+                name, label, attrs = item
+                if attrs.get("image"):
+                    yield attrs["image"]
+            elif isinstance(item, Cluster):
+                yield from self._iter_files(item._body)
+
+    def _iter_body(self, body: list, indent: str, inherited_attrs: dict,
+                   layout: Union[None, dict] = None, layout_only: bool = False
+                   ) -> Iterator[str]:
+        """
+        Generate DOT lines for the nodes and subgraphs recorded in a graph or cluster.
+
+        Clusters only emit the attributes that differ from those inherited from their parent.
+        """
+        for item in body:
+            if isinstance(item, tuple):
+                name, label, attrs = item
+                attrs = _layout_attrs(attrs, layout["nodes"].get(name) if layout else None, layout_only)
+                yield f"{indent}{quote(name)}{attr_list(label, attrs)}\n"
+            elif isinstance(item, Cluster):
+                graph_attr = self.theme.get_delta_dict(inherited_attrs, item.graph_attr)
+                attrs = _layout_attrs(graph_attr, layout["clusters"].get(item.id) if layout else None, layout_only)
+                yield f"{indent}subgraph {quote(item.id)} {{\n"
+                if attrs:
+                    yield f"{indent}\tgraph{attr_list(attrs=attrs)}\n"
+                yield from self._iter_body(item._body, indent + "\t", inherited_attrs | graph_attr, layout, layout_only)
+                yield f"{indent}}}\n"
+            else:
+                for line in item.__iter__(subgraph=True):
+                    yield indent + line
 
 
 class Cluster():
@@ -288,17 +951,15 @@ class Cluster():
         :param bool hide_border: Determines whether or not a border is shown around the cluster.
         """
 
-        # Set the cluster id
-        self.id = "cluster_" + str(id(self))
-
         #Set the cluster label
         if label == "" and self._default_label:
             self.label = self._default_label
         else:
             self.label = label
 
-        # Create cluster
-        self.dot = Digraph(self.id)
+        # Record the cluster contents so the DOT source is only generated when rendering
+        self.graph_attr = {}
+        self._body = []
 
         # Set global graph and cluster context
         self._graph = get_graph()
@@ -306,61 +967,81 @@ class Cluster():
             raise EnvironmentError("The object is not part of a Graph")
         self._cluster = get_cluster()
 
-        # Set cluster attributes based on the theme using copy to ensure the objects are independent
-        self.dot.graph_attr.update(self._graph.theme.cluster_attrs)
+        # Set the cluster id
+        self.id = self._graph.new_id("cluster", self.label, self._cluster)
 
         # Set cluster depth to allow for logic based on the nesting of clusters
         self._depth = self._cluster._depth + 1 if self._cluster else 0
 
-        # Get background colors from theme
-        _colors = self._graph.theme.colors
-
-        # Set the cluster background color
-        if _colors:
-            _color_index = self._depth % len(_colors)
-            self.dot.graph_attr["bgcolor"] = _colors[_color_index]
+        # Set cluster attributes, including the background color for the depth and hidden border, from the
+        # theme's template using copy to ensure the objects are independent
+        self.graph_attr.update(self._graph.theme.get_cluster_attrs(self._depth, hide_border))
 
         # Update cluster label
-        self.dot.graph_attr["label"] = self.label
-
-        # Make group border invisible
-        if hide_border:
-            self.dot.graph_attr["penwidth"] = "0"
-            self.dot.graph_attr["bgcolor"] = "invis"
+        self.graph_attr["label"] = self.label
 
         # Override any values directly passed from the object
-        self.dot.graph_attr.update(attrs)
+        self.graph_attr.update(attrs)
+
+        # Track the nodes and clusters used to find the most central node for edges
+        self._nodes = []
+        self._center_node = None
+        self._first_cluster = None
+
+        # Add the cluster to its parent in creation order
+        (self._cluster or self._graph).subgraph(self)
 
         # Add Clusters to state
-        state = get_state()
+        self._graph._state.add(self._cluster or self._graph, self)
         if self._cluster:
-            state = update_state(state, self._cluster, {self: []})
-        else:
-            state = update_state(state, self._graph, {self: []})
-        set_state(state)
+            self._cluster._update_center_node(self)
 
     def __enter__(self) -> Cluster:
         set_cluster(self)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        if self._cluster:
-            self._cluster.subgraph(self.dot)
-        else:
-            self._graph.subgraph(self.dot)
         set_cluster(self._cluster)
 
     def node(self, name: str, label: str, **attrs: Any) -> None:
         """
         Create a node in the cluster.
+
+        Only attributes that differ from the graph-level node defaults are kept.
         """
-        self.dot.node(name, label=label, **attrs)
+        attrs = self._graph.theme.get_delta_dict(self._graph.node_attr, attrs)
+        self._body.append((name, label, attrs))
 
-    def subgraph(self, dot: Digraph = Digraph) -> None:
+    def subgraph(self, dot: Union[Cluster, Digraph]) -> None:
         """
         Create a subgraph of the cluster.
         """
-        self.dot.subgraph(dot)
+        self._body.append(dot)
+
+    def _update_center_node(self, obj: Union[Cluster, Node]) -> None:
+        """
+        Update the most central node as nodes and clusters are added to the cluster.
+        """
+        if isinstance(obj, Node):
+            self._nodes.append(obj)
+            center_node_index = round(len(self._nodes)/2) - 1
+            self._center_node = self._nodes[center_node_index]
+        elif self._first_cluster is None:
+            self._first_cluster = obj
+
+    @property
+    def center_node(self) -> Union[Cluster, Node]:
+        """
+        The node used when connecting edges to the cluster.
+
+        This is the most central node directly in the cluster or, if there are none,
+        the center node of the first nested cluster.
+        """
+        if self._center_node is not None:
+            return self._center_node
+        if self._first_cluster is not None:
+            return self._first_cluster.center_node
+        return self
 
 
 class Node():
@@ -385,9 +1066,6 @@ class Node():
         :param str label: Label for a node.
         :param bool hide_node: Determines whether or not a node should act as a hidden node with not width or height.
         """
-        # Generate an ID used to uniquely identify a node
-        self.id = "node_" + str(id(self))
-
         # Set hide_node attribute
         self.hide_node = hide_node
 
@@ -403,6 +1081,9 @@ class Node():
             raise EnvironmentError("The object is not part of a Graph")
         self._cluster = get_cluster()
 
+        # Generate an ID used to uniquely identify a node
+        self.id = self._graph.new_id("node", self.label, self._cluster)
+
         # Set default icon
         if not isinstance(self._graph.theme, Default) and not self._icon:
             self._provider = "general"
@@ -435,6 +1116,14 @@ class Node():
             self.node_attrs["height"] = str(float(self.node_attrs['height']) + padding)
             self.node_attrs["image"] = self._load_icon()
 
+            # Draw a copy of the icon sized for the node rather than scaling the full image
+            if self._graph.icon_cache:
+                self.node_attrs["image"] = self._graph.icon_cache.resize(
+                    self.node_attrs["image"],
+                    float(self.node_attrs.get("width", _DEFAULT_NODE_WIDTH)),
+                    dpi=float(self._graph.graph_attr.get("dpi", _DEFAULT_DPI)),
+                )
+
         # Set the width and height to be 0
         if hide_node:
             self.node_attrs.update({"width":"0", "height":"0"})
@@ -446,16 +1135,15 @@ class Node():
             self._graph.node(self.id, self.label, **self.node_attrs)
 
         # Add Nodes to state
-        state = get_state()
+        self._graph._state.add(self._cluster or self._graph, self)
         if self._cluster:
-            state = update_state(state, self._cluster, self)
-        else:
-            state = update_state(state, self._graph, self)
-        set_state(state)
+            self._cluster._update_center_node(self)
 
     def _load_icon(self) -> str:
-        basedir = Path(os.path.abspath(os.path.dirname(__file__)))
-        return os.path.join(basedir.parent.parent, self._icon_dir, self._icon)
+        """
+        Return the path of the node icon, resolving and checking it only the first time the icon is used.
+        """
+        return resolve_icon(self._icon_dir, self._icon)
 
 class Edge():
     """
@@ -472,8 +1160,6 @@ class Edge():
         :param attrs: Other edge attributes.
         """
 
-        self.id = "edge_" + str(id(self))
-
         self.start_obj = start_obj
         self.end_obj = end_obj
 
@@ -481,7 +1167,9 @@ class Edge():
         self._graph = get_graph()
         if self._graph is None:
             raise EnvironmentError("The object is not part of a Graph")
-        self._state = get_state()
+
+        self.id = self._graph.new_id("edge")
+        self._state = self._graph._state
 
         # Set edge attributes based on the theme using copy to ensure the objects are independent
         self.edge_attrs = self._graph.theme.edge_attrs.copy()
@@ -497,8 +1185,8 @@ class Edge():
 
         # Handle all cases
         for current_start_obj in start_obj_list:
+            start_node = get_node_obj(current_start_obj)
             for current_end_obj in end_obj_list:
-                start_node = get_node_obj(current_start_obj)
                 end_node = get_node_obj(current_end_obj)
 
                 # Cluster to Cluster connections
@@ -536,8 +1224,6 @@ class Flow():
     """
     def __init__(self, objs: list[Union[Cluster, Node]], **attrs: Any) -> None:
 
-        self.id = "flow_" + str(id(self))
-
         self.objs = objs
         self.obj_count = len(self.objs)
 
@@ -546,6 +1232,8 @@ class Flow():
         if self._graph is None:
             raise EnvironmentError("The object is not part of a Graph")
 
+        self.id = self._graph.new_id("flow")
+
         # Set edge attributes based on attributes directly passed from the object
         self.edge_attrs = attrs
 
@@ -0,0 +1,407 @@
+"""
+This module contains the tools used to prepare node icons for rendering.
+
+Available Classes:
+- IconCache
+- IconPack
+
+Available Functions:
+- build_icon_pack
+- register_icon_pack
+- unregister_icon_pack
+- get_icon_packs
+- resolve_icon
+
+Details for each can be found in the docstrings for the respective class or function.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import warnings
+from typing import IO, Iterator, Union
+
+# Icons that are not in a pack are found relative to the directory containing the architectures package
+_ICON_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The pack of bundled icons, built by scripts/pack_icons.py when packaging a release
+_BUNDLED_PACK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons.pack")
+
+# Pack files start with a magic number, the format version and the length of the JSON index
+_PACK_MAGIC = b"ARCHICON"
+_PACK_VERSION = 1
+_PACK_HEADER = struct.Struct(">8sIQ")
+
+# Registered packs, searched in order, and the bundled pack once it has been opened
+_ICON_PACKS = []
+_BUNDLED_PACKS = []
+
+# Icon paths by icon directory and file name, resolved once and shared by every node
+_ICON_PATHS = {}
+_ICON_LOCK = threading.Lock()
+
+
+def build_icon_pack(directory: str, output_file: str) -> dict:
+    """Pack a directory of icons into a single file, storing identical icons once.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of icons, where the path of each icon relative to it becomes its name
+    output_file : str
+        The path of the pack to create
+
+    Returns
+    -------
+    dict
+        The number of icons, the number of distinct icons and the size of the pack in bytes
+    """
+    icons = {}
+    blobs = {}
+    data = []
+    offset = 0
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file in sorted(files):
+            if file.startswith("."):
+                continue
+            path = os.path.join(root, file)
+            with open(path, "rb") as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            icons[os.path.relpath(path, directory).replace(os.sep, "/")] = digest
+            if digest not in blobs:
+                blobs[digest] = [offset, len(content)]
+                data.append(content)
+                offset += len(content)
+
+    index = json.dumps({"icons": icons, "blobs": blobs}, sort_keys=True).encode("utf-8")
+    with _atomic_write(output_file) as f:
+        f.write(_PACK_HEADER.pack(_PACK_MAGIC, _PACK_VERSION, len(index)))
+        f.write(index)
+        f.writelines(data)
+
+    return {"icons": len(icons), "distinct": len(blobs), "size": os.path.getsize(output_file)}
+
+
+def register_icon_pack(pack: Union[str, IconPack], cache_directory: Union[None, str] = None) -> IconPack:
+    """Add a pack of icons that is searched before the packs registered earlier and the bundled icons.
+
+    Parameters
+    ----------
+    pack : str, IconPack
+        The pack, or the path of a pack file built with build_icon_pack
+    cache_directory : str
+        The directory icons are extracted to (defaults to architectures/icons/extracted under the user cache directory)
+
+    Returns
+    -------
+    IconPack
+        The registered pack
+    """
+    if not isinstance(pack, IconPack):
+        pack = IconPack(pack, cache_directory)
+    with _ICON_LOCK:
+        _ICON_PACKS.insert(0, pack)
+        _ICON_PATHS.clear()
+    return pack
+
+
+def unregister_icon_pack(pack: IconPack) -> bool:
+    """Stop searching a pack for icons, forgetting the icon paths resolved while it was registered.
+
+    Parameters
+    ----------
+    pack : IconPack
+        The registered pack, or the bundled pack
+
+    Returns
+    -------
+    bool
+        Whether the pack was registered
+    """
+    with _ICON_LOCK:
+        found = False
+        for packs in (_ICON_PACKS, _BUNDLED_PACKS):
+            if any(registered is pack for registered in packs):
+                packs[:] = [registered for registered in packs if registered is not pack]
+                found = True
+        if found:
+            _ICON_PATHS.clear()
+    return found
+
+
+def get_icon_packs() -> list:
+    """
+    Return the packs searched for icons in order, ending with the bundled pack if there is one.
+    """
+    with _ICON_LOCK:
+        if not _BUNDLED_PACKS and os.path.exists(_BUNDLED_PACK):
+            _BUNDLED_PACKS.append(IconPack(_BUNDLED_PACK))
+        return _ICON_PACKS + _BUNDLED_PACKS
+
+
+def resolve_icon(icon_dir: str, icon: str) -> str:
+    """Return the path of an icon, resolving it only the first time it is used.
+
+    The icon is named by its directory without the leading icons/ and its file name, for
+    example aws/compute/batch.png, and taken from the first pack that has it.  Icons that
+    are in no pack are read from the icons directory.
+
+    Parameters
+    ----------
+    icon_dir : str
+        The directory of the icon, such as icons/aws/compute
+    icon : str
+        The file name of the icon
+
+    Returns
+    -------
+    str
+        The path of the icon
+    """
+    key = (icon_dir, icon)
+    icon_path = _ICON_PATHS.get(key)
+    if icon_path is not None:
+        return icon_path
+
+    name = "/".join(part for part in icon_dir.replace(os.sep, "/").split("/") if part)
+    if name == "icons" or name.startswith("icons/"):
+        name = name[len("icons"):].lstrip("/")
+    name = f"{name}/{icon}" if name else icon
+
+    for pack in get_icon_packs():
+        if name in pack:
+            icon_path = pack.extract(name)
+            break
+    else:
+        icon_path = os.path.join(_ICON_ROOT, icon_dir, icon)
+        if not os.path.isfile(icon_path):
+            warnings.warn(f"The icon {name} was not found: {icon_path}")
+
+    _ICON_PATHS[key] = icon_path
+    return icon_path
+
+
+def _get_cache_directory(*names: str) -> str:
+    """
+    Return a directory of architectures under the user cache directory, such as icons/resized.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "architectures", *names)
+
+
+def _temp_path(path: str) -> str:
+    """
+    Return a new, unique temporary file path in the same directory as the path.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    os.close(fd)
+    return temp_path
+
+
+@contextlib.contextmanager
+def _atomic_write(path: str, mode: str = "wb") -> Iterator[IO]:
+    """
+    Open a temporary file next to a path and rename it into place once it is written, so readers never see a partial file.
+    """
+    temp_file = _temp_path(path)
+    try:
+        with open(temp_file, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+        os.replace(temp_file, path)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+class IconCache():
+    """
+    An on-disk cache of icons resized to the size they are drawn at.
+
+    The bundled icons are much larger than the nodes they are drawn in, so without resizing
+    Graphviz decodes and scales every full size image and embeds it at full size in formats
+    such as PDF.  Resized icons are keyed by the contents of the original and the target size.
+    Resizing uses Pillow when it is installed, otherwise the original icons are used.
+    """
+
+    # Bump when the resizing changes so stale icons are never reused
+    _key_version = "1"
+
+    # Environment variable used to turn on the cache without changing diagram scripts
+    _directory_variable = "ARCHITECTURES_ICON_CACHE"
+
+    def __init__(self, directory: Union[None, str] = None, dpi: Union[None, float] = None) -> None:
+        """
+        :param str directory: The cache directory (defaults to architectures/icons/resized under the user cache directory).
+        :param float dpi: The pixels per inch icons are resized for (defaults to the dpi of the graph, or 96).
+        """
+        if directory is None:
+            directory = _get_cache_directory("icons", "resized")
+
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.dpi = dpi
+
+        # Resized icon paths memoized by original path and size
+        self._paths = {}
+
+    @classmethod
+    def from_environment(cls) -> Union[None, IconCache]:
+        """
+        Return a cache configured from the environment, or None if it is not turned on.
+        """
+        directory = os.environ.get(cls._directory_variable)
+        if not directory:
+            return None
+        return cls(directory)
+
+    def resize(self, path: str, width: float, height: Union[None, float] = None, dpi: float = 96.0) -> str:
+        """
+        Return the path of a copy of an icon that fits in a box, or the original path if it already fits.
+
+        :param str path: The path of the icon.
+        :param float width: The width of the box in inches.
+        :param float height: The height of the box in inches (defaults to the width).
+        :param float dpi: The pixels per inch of the output, used unless the cache sets its own.
+        """
+        dpi = self.dpi or dpi
+        size = (max(1, round(width * dpi)), max(1, round((width if height is None else height) * dpi)))
+
+        memo_key = (path, size)
+        if memo_key not in self._paths:
+            self._paths[memo_key] = self._resize(path, size)
+        return self._paths[memo_key]
+
+    def _resize(self, path: str, size: tuple) -> str:
+        try:
+            from PIL import Image
+        except ImportError:
+            return path
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return path
+
+        digest = hashlib.sha256(data)
+        digest.update(f"\0{self._key_version}\0{size[0]}x{size[1]}".encode("utf-8"))
+        digest = digest.hexdigest()
+        name = os.path.splitext(os.path.basename(path))[0]
+        output_file = os.path.join(self.directory, digest[:2], f"{name}-{size[0]}x{size[1]}-{digest[:16]}.png")
+        if os.path.exists(output_file):
+            return output_file
+
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                if image.width <= size[0] and image.height <= size[1]:
+                    return path
+                image.thumbnail(size, Image.LANCZOS)
+
+                # Write a temporary file and rename it so concurrent renders never see a partial icon
+                os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                with _atomic_write(output_file) as f:
+                    image.save(f, "PNG", optimize=True)
+        except OSError:
+            # Use the original icon if it can't be read or the cache can't be written
+            return path
+
+        return output_file
+
+
+class IconPack():
+    """
+    A single file of icons, built with build_icon_pack, that extracts icons as they are used.
+
+    The pack is memory mapped and its index read once, and icons with identical contents are
+    stored and extracted once, so using an icon costs at most one write to the cache directory
+    rather than a lookup among thousands of small files.
+    """
+
+    def __init__(self, path: str, cache_directory: Union[None, str] = None) -> None:
+        """
+        :param str path: The path of the pack file.
+        :param str cache_directory: The directory icons are extracted to (defaults to architectures/icons/extracted under the user cache directory).
+        """
+        if cache_directory is None:
+            cache_directory = _get_cache_directory("icons", "extracted")
+
+        self.path = os.path.abspath(path)
+        self.cache_directory = os.path.abspath(os.path.expanduser(cache_directory))
+
+        with open(self.path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, index_size = _PACK_HEADER.unpack_from(self._data)
+        if magic != _PACK_MAGIC or version != _PACK_VERSION:
+            self._data.close()
+            raise ValueError(f"{self.path} is not an icon pack.")
+
+        index = json.loads(self._data[_PACK_HEADER.size:_PACK_HEADER.size + index_size])
+        self._icons = index["icons"]
+        self._blobs = index["blobs"]
+        self._offset = _PACK_HEADER.size + index_size
+
+        # Extracted icon paths by content digest
+        self._paths = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._icons
+
+    def __len__(self) -> int:
+        return len(self._icons)
+
+    def __enter__(self) -> IconPack:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def names(self) -> list:
+        """
+        The names of the icons in the pack.
+        """
+        return sorted(self._icons)
+
+    def read(self, name: str) -> bytes:
+        """
+        Return the contents of an icon.
+        """
+        offset, size = self._blobs[self._icons[name]]
+        start = self._offset + offset
+        return self._data[start:start + size]
+
+    def extract(self, name: str) -> str:
+        """
+        Return the path of an icon, writing it to the cache directory the first time it is used.
+        """
+        digest = self._icons[name]
+        if digest in self._paths:
+            return self._paths[digest]
+
+        extension = os.path.splitext(name)[1]
+        output_file = os.path.join(self.cache_directory, digest[:2], f"{digest}{extension}")
+        if not os.path.exists(output_file):
+            # Write a temporary file and rename it so concurrent renders never see a partial icon
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            with _atomic_write(output_file) as f:
+                f.write(self.read(name))
+
+        self._paths[digest] = output_file
+        return output_file
+
+    def close(self) -> None:
+        """
+        Unregister the pack and close its memory map.
+        """
+        unregister_icon_pack(self)
+        self._data.close()
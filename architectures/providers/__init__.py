@@ -2,22 +2,27 @@
 
 from architectures.core import Node
 
+class _Aws(Node):
+    _provider = "aws"
+    _icon_dir = "icons/aws"
+
 class _Azure(Node):
     _provider = "azure"
     _icon_dir = "icons/azure"
 
-class _General(Node):
-    _provider = "general"
-    _icon_dir = "icons/general"
-
 class _Gcp(Node):
     _provider = "gcp"
     _icon_dir = "icons/gcp"
 
-class _Aws(Node):
-    _provider = "aws"
-    _icon_dir = "icons/aws"
+class _General(Node):
+    _provider = "general"
+    _icon_dir = "icons/general"
 
 class _Kubernetes(Node):
     _provider = "kubernetes"
-    _icon_dir = "icons/kubernetes"
\ No newline at end of file
+    _icon_dir = "icons/kubernetes"
+
+from architectures.catalog import lookup  # noqa: F401
+from architectures.catalog import lazy_loader
+
+__getattr__, __dir__ = lazy_loader(__name__)
@@ -6,61 +6,49 @@ class _Analytics(_Aws):
     _service_type = "analytics"
     _icon_dir = "icons/aws/analytics"
 
-class KinesisVideoStreams(_Analytics):
-    _icon = "kinesis-video-streams.png"
-    _default_label = "Kinesis Video Streams"
-
-class RedshiftDenseComputeNode(_Analytics):
-    _icon = "redshift-dense-compute-node.png"
-    _default_label = "Redshift Dense Compute Node"
-
-class Redshift(_Analytics):
-    _icon = "redshift.png"
-    _default_label = "Redshift"
+class Analytics(_Analytics):
+    _icon = "analytics.png"
+    _default_label = "Analytics"
 
 class Athena(_Analytics):
     _icon = "athena.png"
     _default_label = "Athena"
 
+class CloudsearchSearchDocuments(_Analytics):
+    _icon = "cloudsearch-search-documents.png"
+    _default_label = "Cloudsearch Search Documents"
+
+class Cloudsearch(_Analytics):
+    _icon = "cloudsearch.png"
+    _default_label = "Cloudsearch"
+
 class DataPipeline(_Analytics):
     _icon = "data-pipeline.png"
     _default_label = "Data Pipeline"
 
-class GlueCrawlers(_Analytics):
-    _icon = "glue-crawlers.png"
-    _default_label = "Glue Crawlers"
-
-class EmrHdfsCluster(_Analytics):
-    _icon = "emr-hdfs-cluster.png"
-    _default_label = "Emr Hdfs Cluster"
-
 class ElasticsearchService(_Analytics):
     _icon = "elasticsearch-service.png"
     _default_label = "Elasticsearch Service"
 
-class KinesisDataStreams(_Analytics):
-    _icon = "kinesis-data-streams.png"
-    _default_label = "Kinesis Data Streams"
-
-class KinesisDataFirehose(_Analytics):
-    _icon = "kinesis-data-firehose.png"
-    _default_label = "Kinesis Data Firehose"
-
 class EmrCluster(_Analytics):
     _icon = "emr-cluster.png"
     _default_label = "Emr Cluster"
 
+class EmrHdfsCluster(_Analytics):
+    _icon = "emr-hdfs-cluster.png"
+    _default_label = "Emr Hdfs Cluster"
+
 class Emr(_Analytics):
     _icon = "emr.png"
     _default_label = "Emr"
 
-class Quicksight(_Analytics):
-    _icon = "quicksight.png"
-    _default_label = "Quicksight"
+class GlueCrawlers(_Analytics):
+    _icon = "glue-crawlers.png"
+    _default_label = "Glue Crawlers"
 
-class CloudsearchSearchDocuments(_Analytics):
-    _icon = "cloudsearch-search-documents.png"
-    _default_label = "Cloudsearch Search Documents"
+class GlueDataCatalog(_Analytics):
+    _icon = "glue-data-catalog.png"
+    _default_label = "Glue Data Catalog"
 
 class Glue(_Analytics):
     _icon = "glue.png"
@@ -70,21 +58,17 @@ class KinesisDataAnalytics(_Analytics):
     _icon = "kinesis-data-analytics.png"
     _default_label = "Kinesis Data Analytics"
 
-class RedshiftDenseStorageNode(_Analytics):
-    _icon = "redshift-dense-storage-node.png"
-    _default_label = "Redshift Dense Storage Node"
-
-class ManagedStreamingForKafka(_Analytics):
-    _icon = "managed-streaming-for-kafka.png"
-    _default_label = "Managed Streaming For Kafka"
+class KinesisDataFirehose(_Analytics):
+    _icon = "kinesis-data-firehose.png"
+    _default_label = "Kinesis Data Firehose"
 
-class GlueDataCatalog(_Analytics):
-    _icon = "glue-data-catalog.png"
-    _default_label = "Glue Data Catalog"
+class KinesisDataStreams(_Analytics):
+    _icon = "kinesis-data-streams.png"
+    _default_label = "Kinesis Data Streams"
 
-class Analytics(_Analytics):
-    _icon = "analytics.png"
-    _default_label = "Analytics"
+class KinesisVideoStreams(_Analytics):
+    _icon = "kinesis-video-streams.png"
+    _default_label = "Kinesis Video Streams"
 
 class Kinesis(_Analytics):
     _icon = "kinesis.png"
@@ -94,6 +78,22 @@ class LakeFormation(_Analytics):
     _icon = "lake-formation.png"
     _default_label = "Lake Formation"
 
-class Cloudsearch(_Analytics):
-    _icon = "cloudsearch.png"
-    _default_label = "Cloudsearch"
\ No newline at end of file
+class ManagedStreamingForKafka(_Analytics):
+    _icon = "managed-streaming-for-kafka.png"
+    _default_label = "Managed Streaming For Kafka"
+
+class Quicksight(_Analytics):
+    _icon = "quicksight.png"
+    _default_label = "Quicksight"
+
+class RedshiftDenseComputeNode(_Analytics):
+    _icon = "redshift-dense-compute-node.png"
+    _default_label = "Redshift Dense Compute Node"
+
+class RedshiftDenseStorageNode(_Analytics):
+    _icon = "redshift-dense-storage-node.png"
+    _default_label = "Redshift Dense Storage Node"
+
+class Redshift(_Analytics):
+    _icon = "redshift.png"
+    _default_label = "Redshift"
\ No newline at end of file
@@ -6,10 +6,10 @@ class _Blockchain(_Aws):
     _service_type = "blockchain"
     _icon_dir = "icons/aws/blockchain"
 
-class QuantumLedgerDatabaseQldb(_Blockchain):
-    _icon = "quantum-ledger-database-qldb.png"
-    _default_label = "Quantum Ledger Database Qldb"
-
 class ManagedBlockchain(_Blockchain):
     _icon = "managed-blockchain.png"
-    _default_label = "Managed Blockchain"
\ No newline at end of file
+    _default_label = "Managed Blockchain"
+
+class QuantumLedgerDatabaseQldb(_Blockchain):
+    _icon = "quantum-ledger-database-qldb.png"
+    _default_label = "Quantum Ledger Database Qldb"
\ No newline at end of file
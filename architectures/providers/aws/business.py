@@ -10,10 +10,10 @@ class AlexaForBusiness(_Business):
     _icon = "alexa-for-business.png"
     _default_label = "Alexa For Business"
 
-class Workmail(_Business):
-    _icon = "workmail.png"
-    _default_label = "Workmail"
-
 class Chime(_Business):
     _icon = "chime.png"
-    _default_label = "Chime"
\ No newline at end of file
+    _default_label = "Chime"
+
+class Workmail(_Business):
+    _icon = "workmail.png"
+    _default_label = "Workmail"
\ No newline at end of file
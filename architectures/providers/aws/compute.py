@@ -6,153 +6,101 @@ class _Compute(_Aws):
     _service_type = "compute"
     _icon_dir = "icons/aws/compute"
 
+class ApplicationAutoScalingRounded(_Compute):
+    _icon = "application-auto-scaling-rounded.png"
+    _default_label = "Application Auto Scaling Rounded"
+
+class ApplicationAutoScaling(_Compute):
+    _icon = "application-auto-scaling.png"
+    _default_label = "Application Auto Scaling"
+
+class BatchRounded(_Compute):
+    _icon = "batch-rounded.png"
+    _default_label = "Batch Rounded"
+
 class Batch(_Compute):
     _icon = "batch.png"
     _default_label = "Batch"
 
-class ElasticKubernetesService(_Compute):
-    _icon = "elastic-kubernetes-service.png"
-    _default_label = "Elastic Kubernetes Service"
+class ComputeRounded(_Compute):
+    _icon = "compute-rounded.png"
+    _default_label = "Compute Rounded"
 
 class Compute(_Compute):
     _icon = "compute.png"
     _default_label = "Compute"
 
-class ElasticBeanstalkRounded(_Compute):
-    _icon = "elastic-beanstalk-rounded.png"
-    _default_label = "Elastic Beanstalk Rounded"
-
-class ThinkboxFrost(_Compute):
-    _icon = "thinkbox-frost.png"
-    _default_label = "Thinkbox Frost"
-
 class Ec2ContainerRegistryRounded(_Compute):
     _icon = "ec2-container-registry-rounded.png"
     _default_label = "Ec2 Container Registry Rounded"
 
-class ThinkboxDeadlineRounded(_Compute):
-    _icon = "thinkbox-deadline-rounded.png"
-    _default_label = "Thinkbox Deadline Rounded"
-
-class ThinkboxStokeRounded(_Compute):
-    _icon = "thinkbox-stoke-rounded.png"
-    _default_label = "Thinkbox Stoke Rounded"
-
-class ComputeRounded(_Compute):
-    _icon = "compute-rounded.png"
-    _default_label = "Compute Rounded"
-
-class ThinkboxStoke(_Compute):
-    _icon = "thinkbox-stoke.png"
-    _default_label = "Thinkbox Stoke"
+class Ec2ContainerRegistry(_Compute):
+    _icon = "ec2-container-registry.png"
+    _default_label = "Ec2 Container Registry"
 
 class Ec2Rounded(_Compute):
     _icon = "ec2-rounded.png"
     _default_label = "Ec2 Rounded"
 
-class ThinkboxDraftRounded(_Compute):
-    _icon = "thinkbox-draft-rounded.png"
-    _default_label = "Thinkbox Draft Rounded"
-
-class Ec2ContainerRegistry(_Compute):
-    _icon = "ec2-container-registry.png"
-    _default_label = "Ec2 Container Registry"
-
 class Ec2(_Compute):
     _icon = "ec2.png"
     _default_label = "Ec2"
 
-class BatchRounded(_Compute):
-    _icon = "batch-rounded.png"
-    _default_label = "Batch Rounded"
-
-class ThinkboxDeadline(_Compute):
-    _icon = "thinkbox-deadline.png"
-    _default_label = "Thinkbox Deadline"
-
-class Fargate(_Compute):
-    _icon = "fargate.png"
-    _default_label = "Fargate"
-
-class ThinkboxKrakatoaRounded(_Compute):
-    _icon = "thinkbox-krakatoa-rounded.png"
-    _default_label = "Thinkbox Krakatoa Rounded"
-
-class Outposts(_Compute):
-    _icon = "outposts.png"
-    _default_label = "Outposts"
+class ElasticBeanstalkRounded(_Compute):
+    _icon = "elastic-beanstalk-rounded.png"
+    _default_label = "Elastic Beanstalk Rounded"
 
-class ApplicationAutoScalingRounded(_Compute):
-    _icon = "application-auto-scaling-rounded.png"
-    _default_label = "Application Auto Scaling Rounded"
+class ElasticBeanstalk(_Compute):
+    _icon = "elastic-beanstalk.png"
+    _default_label = "Elastic Beanstalk"
 
 class ElasticContainerServiceRounded(_Compute):
     _icon = "elastic-container-service-rounded.png"
     _default_label = "Elastic Container Service Rounded"
 
+class ElasticContainerService(_Compute):
+    _icon = "elastic-container-service.png"
+    _default_label = "Elastic Container Service"
+
 class ElasticKubernetesServiceRounded(_Compute):
     _icon = "elastic-kubernetes-service-rounded.png"
     _default_label = "Elastic Kubernetes Service Rounded"
 
-class LambdaRounded(_Compute):
-    _icon = "lambda-rounded.png"
-    _default_label = "Lambda Rounded"
-
-class ThinkboxDraft(_Compute):
-    _icon = "thinkbox-draft.png"
-    _default_label = "Thinkbox Draft"
-
-class ThinkboxFrostRounded(_Compute):
-    _icon = "thinkbox-frost-rounded.png"
-    _default_label = "Thinkbox Frost Rounded"
+class ElasticKubernetesService(_Compute):
+    _icon = "elastic-kubernetes-service.png"
+    _default_label = "Elastic Kubernetes Service"
 
 class FargateRounded(_Compute):
     _icon = "fargate-rounded.png"
     _default_label = "Fargate Rounded"
 
-class VmwareCloudOnAws(_Compute):
-    _icon = "vmware-cloud-on-aws.png"
-    _default_label = "Vmware Cloud On Aws"
-
-class ThinkboxXmeshRounded(_Compute):
-    _icon = "thinkbox-xmesh-rounded.png"
-    _default_label = "Thinkbox Xmesh Rounded"
+class Fargate(_Compute):
+    _icon = "fargate.png"
+    _default_label = "Fargate"
 
-class ThinkboxXmesh(_Compute):
-    _icon = "thinkbox-xmesh.png"
-    _default_label = "Thinkbox Xmesh"
+class LambdaRounded(_Compute):
+    _icon = "lambda-rounded.png"
+    _default_label = "Lambda Rounded"
 
 class Lambda(_Compute):
     _icon = "lambda.png"
     _default_label = "Lambda"
 
-class VmwareCloudOnAwsRounded(_Compute):
-    _icon = "vmware-cloud-on-aws-rounded.png"
-    _default_label = "Vmware Cloud On Aws Rounded"
+class LightsailRounded(_Compute):
+    _icon = "lightsail-rounded.png"
+    _default_label = "Lightsail Rounded"
+
+class Lightsail(_Compute):
+    _icon = "lightsail.png"
+    _default_label = "Lightsail"
 
 class OutpostsRounded(_Compute):
     _icon = "outposts-rounded.png"
     _default_label = "Outposts Rounded"
 
-class ThinkboxKrakatoa(_Compute):
-    _icon = "thinkbox-krakatoa.png"
-    _default_label = "Thinkbox Krakatoa"
-
-class ThinkboxSequoiaRounded(_Compute):
-    _icon = "thinkbox-sequoia-rounded.png"
-    _default_label = "Thinkbox Sequoia Rounded"
-
-class ElasticContainerService(_Compute):
-    _icon = "elastic-container-service.png"
-    _default_label = "Elastic Container Service"
-
-class LightsailRounded(_Compute):
-    _icon = "lightsail-rounded.png"
-    _default_label = "Lightsail Rounded"
-
-class ApplicationAutoScaling(_Compute):
-    _icon = "application-auto-scaling.png"
-    _default_label = "Application Auto Scaling"
+class Outposts(_Compute):
+    _icon = "outposts.png"
+    _default_label = "Outposts"
 
 class ServerlessApplicationRepositoryRounded(_Compute):
     _icon = "serverless-application-repository-rounded.png"
@@ -162,14 +110,66 @@ class ServerlessApplicationRepository(_Compute):
     _icon = "serverless-application-repository.png"
     _default_label = "Serverless Application Repository"
 
-class ElasticBeanstalk(_Compute):
-    _icon = "elastic-beanstalk.png"
-    _default_label = "Elastic Beanstalk"
+class ThinkboxDeadlineRounded(_Compute):
+    _icon = "thinkbox-deadline-rounded.png"
+    _default_label = "Thinkbox Deadline Rounded"
+
+class ThinkboxDeadline(_Compute):
+    _icon = "thinkbox-deadline.png"
+    _default_label = "Thinkbox Deadline"
+
+class ThinkboxDraftRounded(_Compute):
+    _icon = "thinkbox-draft-rounded.png"
+    _default_label = "Thinkbox Draft Rounded"
+
+class ThinkboxDraft(_Compute):
+    _icon = "thinkbox-draft.png"
+    _default_label = "Thinkbox Draft"
+
+class ThinkboxFrostRounded(_Compute):
+    _icon = "thinkbox-frost-rounded.png"
+    _default_label = "Thinkbox Frost Rounded"
+
+class ThinkboxFrost(_Compute):
+    _icon = "thinkbox-frost.png"
+    _default_label = "Thinkbox Frost"
+
+class ThinkboxKrakatoaRounded(_Compute):
+    _icon = "thinkbox-krakatoa-rounded.png"
+    _default_label = "Thinkbox Krakatoa Rounded"
+
+class ThinkboxKrakatoa(_Compute):
+    _icon = "thinkbox-krakatoa.png"
+    _default_label = "Thinkbox Krakatoa"
+
+class ThinkboxSequoiaRounded(_Compute):
+    _icon = "thinkbox-sequoia-rounded.png"
+    _default_label = "Thinkbox Sequoia Rounded"
 
 class ThinkboxSequoia(_Compute):
     _icon = "thinkbox-sequoia.png"
     _default_label = "Thinkbox Sequoia"
 
-class Lightsail(_Compute):
-    _icon = "lightsail.png"
-    _default_label = "Lightsail"
\ No newline at end of file
+class ThinkboxStokeRounded(_Compute):
+    _icon = "thinkbox-stoke-rounded.png"
+    _default_label = "Thinkbox Stoke Rounded"
+
+class ThinkboxStoke(_Compute):
+    _icon = "thinkbox-stoke.png"
+    _default_label = "Thinkbox Stoke"
+
+class ThinkboxXmeshRounded(_Compute):
+    _icon = "thinkbox-xmesh-rounded.png"
+    _default_label = "Thinkbox Xmesh Rounded"
+
+class ThinkboxXmesh(_Compute):
+    _icon = "thinkbox-xmesh.png"
+    _default_label = "Thinkbox Xmesh"
+
+class VmwareCloudOnAwsRounded(_Compute):
+    _icon = "vmware-cloud-on-aws-rounded.png"
+    _default_label = "Vmware Cloud On Aws Rounded"
+
+class VmwareCloudOnAws(_Compute):
+    _icon = "vmware-cloud-on-aws.png"
+    _default_label = "Vmware Cloud On Aws"
\ No newline at end of file
@@ -6,22 +6,22 @@ class _Cost(_Aws):
     _service_type = "cost"
     _icon_dir = "icons/aws/cost"
 
-class SavingsPlans(_Cost):
-    _icon = "savings-plans.png"
-    _default_label = "Savings Plans"
+class Budgets(_Cost):
+    _icon = "budgets.png"
+    _default_label = "Budgets"
 
 class CostAndUsageReport(_Cost):
     _icon = "cost-and-usage-report.png"
     _default_label = "Cost And Usage Report"
 
+class CostExplorer(_Cost):
+    _icon = "cost-explorer.png"
+    _default_label = "Cost Explorer"
+
 class ReservedInstanceReporting(_Cost):
     _icon = "reserved-instance-reporting.png"
     _default_label = "Reserved Instance Reporting"
 
-class Budgets(_Cost):
-    _icon = "budgets.png"
-    _default_label = "Budgets"
-
-class CostExplorer(_Cost):
-    _icon = "cost-explorer.png"
-    _default_label = "Cost Explorer"
\ No newline at end of file
+class SavingsPlans(_Cost):
+    _icon = "savings-plans.png"
+    _default_label = "Savings Plans"
\ No newline at end of file
@@ -6,62 +6,62 @@ class _Database(_Aws):
     _service_type = "database"
     _icon_dir = "icons/aws/database"
 
-class QuantumLedgerDatabaseQldb(_Database):
-    _icon = "quantum-ledger-database-qldb.png"
-    _default_label = "Quantum Ledger Database Qldb"
-
-class Redshift(_Database):
-    _icon = "redshift.png"
-    _default_label = "Redshift"
-
-class Dynamodb(_Database):
-    _icon = "dynamodb.png"
-    _default_label = "Dynamodb"
+class Aurora(_Database):
+    _icon = "aurora.png"
+    _default_label = "Aurora"
 
-class DynamodbTable(_Database):
-    _icon = "dynamodb-table.png"
-    _default_label = "Dynamodb Table"
+class DatabaseMigrationService(_Database):
+    _icon = "database-migration-service.png"
+    _default_label = "Database Migration Service"
 
 class Database(_Database):
     _icon = "database.png"
     _default_label = "Database"
 
-class DatabaseMigrationService(_Database):
-    _icon = "database-migration-service.png"
-    _default_label = "Database Migration Service"
-
-class Aurora(_Database):
-    _icon = "aurora.png"
-    _default_label = "Aurora"
+class DocumentdbMongodbCompatibility(_Database):
+    _icon = "documentdb-mongodb-compatibility.png"
+    _default_label = "Documentdb Mongodb Compatibility"
 
-class Timestream(_Database):
-    _icon = "timestream.png"
-    _default_label = "Timestream"
+class DynamodbDax(_Database):
+    _icon = "dynamodb-dax.png"
+    _default_label = "Dynamodb Dax"
 
 class DynamodbGlobalSecondaryIndex(_Database):
     _icon = "dynamodb-global-secondary-index.png"
     _default_label = "Dynamodb Global Secondary Index"
 
-class DynamodbDax(_Database):
-    _icon = "dynamodb-dax.png"
-    _default_label = "Dynamodb Dax"
+class DynamodbTable(_Database):
+    _icon = "dynamodb-table.png"
+    _default_label = "Dynamodb Table"
+
+class Dynamodb(_Database):
+    _icon = "dynamodb.png"
+    _default_label = "Dynamodb"
+
+class Elasticache(_Database):
+    _icon = "elasticache.png"
+    _default_label = "Elasticache"
 
 class Neptune(_Database):
     _icon = "neptune.png"
     _default_label = "Neptune"
 
-class Rds(_Database):
-    _icon = "rds.png"
-    _default_label = "Rds"
-
-class DocumentdbMongodbCompatibility(_Database):
-    _icon = "documentdb-mongodb-compatibility.png"
-    _default_label = "Documentdb Mongodb Compatibility"
+class QuantumLedgerDatabaseQldb(_Database):
+    _icon = "quantum-ledger-database-qldb.png"
+    _default_label = "Quantum Ledger Database Qldb"
 
 class RdsOnVmware(_Database):
     _icon = "rds-on-vmware.png"
     _default_label = "Rds On Vmware"
 
-class Elasticache(_Database):
-    _icon = "elasticache.png"
-    _default_label = "Elasticache"
\ No newline at end of file
+class Rds(_Database):
+    _icon = "rds.png"
+    _default_label = "Rds"
+
+class Redshift(_Database):
+    _icon = "redshift.png"
+    _default_label = "Redshift"
+
+class Timestream(_Database):
+    _icon = "timestream.png"
+    _default_label = "Timestream"
\ No newline at end of file
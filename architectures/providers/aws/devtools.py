@@ -6,46 +6,46 @@ class _Devtools(_Aws):
     _service_type = "devtools"
     _icon_dir = "icons/aws/devtools"
 
-class XRay(_Devtools):
-    _icon = "x-ray.png"
-    _default_label = "X Ray"
-
-class CommandLineInterface(_Devtools):
-    _icon = "command-line-interface.png"
-    _default_label = "Command Line Interface"
-
-class ToolsAndSdks(_Devtools):
-    _icon = "tools-and-sdks.png"
-    _default_label = "Tools And Sdks"
+class CloudDevelopmentKit(_Devtools):
+    _icon = "cloud-development-kit.png"
+    _default_label = "Cloud Development Kit"
 
-class Codepipeline(_Devtools):
-    _icon = "codepipeline.png"
-    _default_label = "Codepipeline"
+class Cloud9(_Devtools):
+    _icon = "cloud9.png"
+    _default_label = "Cloud9"
 
 class Codebuild(_Devtools):
     _icon = "codebuild.png"
     _default_label = "Codebuild"
 
-class Cloud9(_Devtools):
-    _icon = "cloud9.png"
-    _default_label = "Cloud9"
+class Codecommit(_Devtools):
+    _icon = "codecommit.png"
+    _default_label = "Codecommit"
 
-class CloudDevelopmentKit(_Devtools):
-    _icon = "cloud-development-kit.png"
-    _default_label = "Cloud Development Kit"
+class Codedeploy(_Devtools):
+    _icon = "codedeploy.png"
+    _default_label = "Codedeploy"
+
+class Codepipeline(_Devtools):
+    _icon = "codepipeline.png"
+    _default_label = "Codepipeline"
 
 class Codestar(_Devtools):
     _icon = "codestar.png"
     _default_label = "Codestar"
 
+class CommandLineInterface(_Devtools):
+    _icon = "command-line-interface.png"
+    _default_label = "Command Line Interface"
+
 class DeveloperTools(_Devtools):
     _icon = "developer-tools.png"
     _default_label = "Developer Tools"
 
-class Codecommit(_Devtools):
-    _icon = "codecommit.png"
-    _default_label = "Codecommit"
+class ToolsAndSdks(_Devtools):
+    _icon = "tools-and-sdks.png"
+    _default_label = "Tools And Sdks"
 
-class Codedeploy(_Devtools):
-    _icon = "codedeploy.png"
-    _default_label = "Codedeploy"
\ No newline at end of file
+class XRay(_Devtools):
+    _icon = "x-ray.png"
+    _default_label = "X Ray"
\ No newline at end of file
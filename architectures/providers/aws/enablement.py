@@ -6,18 +6,18 @@ class _Enablement(_Aws):
     _service_type = "enablement"
     _icon_dir = "icons/aws/enablement"
 
-class ManagedServices(_Enablement):
-    _icon = "managed-services.png"
-    _default_label = "Managed Services"
-
-class Support(_Enablement):
-    _icon = "support.png"
-    _default_label = "Support"
-
 class Iq(_Enablement):
     _icon = "iq.png"
     _default_label = "Iq"
 
+class ManagedServices(_Enablement):
+    _icon = "managed-services.png"
+    _default_label = "Managed Services"
+
 class ProfessionalServices(_Enablement):
     _icon = "professional-services.png"
-    _default_label = "Professional Services"
\ No newline at end of file
+    _default_label = "Professional Services"
+
+class Support(_Enablement):
+    _icon = "support.png"
+    _default_label = "Support"
\ No newline at end of file
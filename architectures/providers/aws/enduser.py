@@ -6,18 +6,18 @@ class _Enduser(_Aws):
     _service_type = "enduser"
     _icon_dir = "icons/aws/enduser"
 
-class Workspaces(_Enduser):
-    _icon = "workspaces.png"
-    _default_label = "Workspaces"
-
-class Worklink(_Enduser):
-    _icon = "worklink.png"
-    _default_label = "Worklink"
-
 class Appstream20(_Enduser):
     _icon = "appstream-2-0.png"
     _default_label = "Appstream 2 0"
 
 class Workdocs(_Enduser):
     _icon = "workdocs.png"
-    _default_label = "Workdocs"
\ No newline at end of file
+    _default_label = "Workdocs"
+
+class Worklink(_Enduser):
+    _icon = "worklink.png"
+    _default_label = "Worklink"
+
+class Workspaces(_Enduser):
+    _icon = "workspaces.png"
+    _default_label = "Workspaces"
\ No newline at end of file
@@ -6,14 +6,14 @@ class _Engagement(_Aws):
     _service_type = "engagement"
     _icon_dir = "icons/aws/engagement"
 
-class Pinpoint(_Engagement):
-    _icon = "pinpoint.png"
-    _default_label = "Pinpoint"
-
 class Connect(_Engagement):
     _icon = "connect.png"
     _default_label = "Connect"
 
+class Pinpoint(_Engagement):
+    _icon = "pinpoint.png"
+    _default_label = "Pinpoint"
+
 class SimpleEmailServiceSes(_Engagement):
     _icon = "simple-email-service-ses.png"
     _default_label = "Simple Email Service Ses"
\ No newline at end of file
@@ -6,46 +6,46 @@ class _General(_Aws):
     _service_type = "general"
     _icon_dir = "icons/aws/general"
 
-class GenericOfficeBuilding(_General):
-    _icon = "generic-office-building.png"
-    _default_label = "Generic Office Building"
-
-class TraditionalServer(_General):
-    _icon = "traditional-server.png"
-    _default_label = "Traditional Server"
+class Disk(_General):
+    _icon = "disk.png"
+    _default_label = "Disk"
 
-class GenericFirewall(_General):
-    _icon = "generic-firewall.png"
-    _default_label = "Generic Firewall"
+class General(_General):
+    _icon = "general.png"
+    _default_label = "General"
 
 class GenericDatabase(_General):
     _icon = "generic-database.png"
     _default_label = "Generic Database"
 
-class User(_General):
-    _icon = "user.png"
-    _default_label = "User"
+class GenericFirewall(_General):
+    _icon = "generic-firewall.png"
+    _default_label = "Generic Firewall"
 
-class Users(_General):
-    _icon = "users.png"
-    _default_label = "Users"
+class GenericOfficeBuilding(_General):
+    _icon = "generic-office-building.png"
+    _default_label = "Generic Office Building"
 
 class GenericSamlToken(_General):
     _icon = "generic-saml-token.png"
     _default_label = "Generic Saml Token"
 
+class GenericSdk(_General):
+    _icon = "generic-sdk.png"
+    _default_label = "Generic Sdk"
+
 class Marketplace(_General):
     _icon = "marketplace.png"
     _default_label = "Marketplace"
 
-class General(_General):
-    _icon = "general.png"
-    _default_label = "General"
+class TraditionalServer(_General):
+    _icon = "traditional-server.png"
+    _default_label = "Traditional Server"
 
-class Disk(_General):
-    _icon = "disk.png"
-    _default_label = "Disk"
+class User(_General):
+    _icon = "user.png"
+    _default_label = "User"
 
-class GenericSdk(_General):
-    _icon = "generic-sdk.png"
-    _default_label = "Generic Sdk"
\ No newline at end of file
+class Users(_General):
+    _icon = "users.png"
+    _default_label = "Users"
\ No newline at end of file
@@ -10,25 +10,21 @@ class ApplicationIntegration(_Integration):
     _icon = "application-integration.png"
     _default_label = "Application Integration"
 
-class Mq(_Integration):
-    _icon = "mq.png"
-    _default_label = "Mq"
-
-class StepFunctions(_Integration):
-    _icon = "step-functions.png"
-    _default_label = "Step Functions"
-
 class Appsync(_Integration):
     _icon = "appsync.png"
     _default_label = "Appsync"
 
+class ConsoleMobileApplication(_Integration):
+    _icon = "console-mobile-application.png"
+    _default_label = "Console Mobile Application"
+
 class Eventbridge(_Integration):
     _icon = "eventbridge.png"
     _default_label = "Eventbridge"
 
-class ConsoleMobileApplication(_Integration):
-    _icon = "console-mobile-application.png"
-    _default_label = "Console Mobile Application"
+class Mq(_Integration):
+    _icon = "mq.png"
+    _default_label = "Mq"
 
 class SimpleNotificationServiceSns(_Integration):
     _icon = "simple-notification-service-sns.png"
@@ -36,4 +32,8 @@ class SimpleNotificationServiceSns(_Integration):
 
 class SimpleQueueServiceSqs(_Integration):
     _icon = "simple-queue-service-sqs.png"
-    _default_label = "Simple Queue Service Sqs"
\ No newline at end of file
+    _default_label = "Simple Queue Service Sqs"
+
+class StepFunctions(_Integration):
+    _icon = "step-functions.png"
+    _default_label = "Step Functions"
\ No newline at end of file
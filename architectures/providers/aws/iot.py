@@ -6,118 +6,118 @@ class _Iot(_Aws):
     _service_type = "iot"
     _icon_dir = "icons/aws/iot"
 
-class IotRule(_Iot):
-    _icon = "iot-rule.png"
-    _default_label = "Iot Rule"
-
-class IotEvents(_Iot):
-    _icon = "iot-events.png"
-    _default_label = "Iot Events"
-
-class InternetOfThings(_Iot):
-    _icon = "internet-of-things.png"
-    _default_label = "Internet Of Things"
-
 class Freertos(_Iot):
     _icon = "freertos.png"
     _default_label = "Freertos"
 
-class IotHttp2(_Iot):
-    _icon = "iot-http2.png"
-    _default_label = "Iot Http2"
-
-class IotAlexaEcho(_Iot):
-    _icon = "iot-alexa-echo.png"
-    _default_label = "Iot Alexa Echo"
+class InternetOfThings(_Iot):
+    _icon = "internet-of-things.png"
+    _default_label = "Internet Of Things"
 
-class IotPolicy(_Iot):
-    _icon = "iot-policy.png"
-    _default_label = "Iot Policy"
+class Iot1Click(_Iot):
+    _icon = "iot-1-click.png"
+    _default_label = "Iot 1 Click"
 
 class IotAction(_Iot):
     _icon = "iot-action.png"
     _default_label = "Iot Action"
 
-class IotHttp(_Iot):
-    _icon = "iot-http.png"
-    _default_label = "Iot Http"
-
-class IotPolicyEmergency(_Iot):
-    _icon = "iot-policy-emergency.png"
-    _default_label = "Iot Policy Emergency"
-
-class IotGreengrassConnector(_Iot):
-    _icon = "iot-greengrass-connector.png"
-    _default_label = "Iot Greengrass Connector"
+class IotAlexaEcho(_Iot):
+    _icon = "iot-alexa-echo.png"
+    _default_label = "Iot Alexa Echo"
 
-class IotThingsGraph(_Iot):
-    _icon = "iot-things-graph.png"
-    _default_label = "Iot Things Graph"
+class IotAlexaSkill(_Iot):
+    _icon = "iot-alexa-skill.png"
+    _default_label = "Iot Alexa Skill"
 
-class IotJobs(_Iot):
-    _icon = "iot-jobs.png"
-    _default_label = "Iot Jobs"
+class IotAnalytics(_Iot):
+    _icon = "iot-analytics.png"
+    _default_label = "Iot Analytics"
 
 class IotButton(_Iot):
     _icon = "iot-button.png"
     _default_label = "Iot Button"
 
-class IotTopic(_Iot):
-    _icon = "iot-topic.png"
-    _default_label = "Iot Topic"
-
 class IotCamera(_Iot):
     _icon = "iot-camera.png"
     _default_label = "Iot Camera"
 
-class Iot1Click(_Iot):
-    _icon = "iot-1-click.png"
-    _default_label = "Iot 1 Click"
+class IotCertificate(_Iot):
+    _icon = "iot-certificate.png"
+    _default_label = "Iot Certificate"
 
-class IotHardwareBoard(_Iot):
-    _icon = "iot-hardware-board.png"
-    _default_label = "Iot Hardware Board"
+class IotCore(_Iot):
+    _icon = "iot-core.png"
+    _default_label = "Iot Core"
 
-class IotShadow(_Iot):
-    _icon = "iot-shadow.png"
-    _default_label = "Iot Shadow"
+class IotDeviceDefender(_Iot):
+    _icon = "iot-device-defender.png"
+    _default_label = "Iot Device Defender"
 
 class IotDeviceManagement(_Iot):
     _icon = "iot-device-management.png"
     _default_label = "Iot Device Management"
 
-class IotAlexaSkill(_Iot):
-    _icon = "iot-alexa-skill.png"
-    _default_label = "Iot Alexa Skill"
+class IotEvents(_Iot):
+    _icon = "iot-events.png"
+    _default_label = "Iot Events"
 
-class IotDeviceDefender(_Iot):
-    _icon = "iot-device-defender.png"
-    _default_label = "Iot Device Defender"
+class IotGreengrassConnector(_Iot):
+    _icon = "iot-greengrass-connector.png"
+    _default_label = "Iot Greengrass Connector"
 
-class IotSitewise(_Iot):
-    _icon = "iot-sitewise.png"
-    _default_label = "Iot Sitewise"
+class IotGreengrass(_Iot):
+    _icon = "iot-greengrass.png"
+    _default_label = "Iot Greengrass"
 
-class IotCore(_Iot):
-    _icon = "iot-core.png"
-    _default_label = "Iot Core"
+class IotHardwareBoard(_Iot):
+    _icon = "iot-hardware-board.png"
+    _default_label = "Iot Hardware Board"
+
+class IotHttp(_Iot):
+    _icon = "iot-http.png"
+    _default_label = "Iot Http"
+
+class IotHttp2(_Iot):
+    _icon = "iot-http2.png"
+    _default_label = "Iot Http2"
+
+class IotJobs(_Iot):
+    _icon = "iot-jobs.png"
+    _default_label = "Iot Jobs"
 
 class IotLambda(_Iot):
     _icon = "iot-lambda.png"
     _default_label = "Iot Lambda"
 
-class IotGreengrass(_Iot):
-    _icon = "iot-greengrass.png"
-    _default_label = "Iot Greengrass"
-
 class IotMqtt(_Iot):
     _icon = "iot-mqtt.png"
     _default_label = "Iot Mqtt"
 
-class IotCertificate(_Iot):
-    _icon = "iot-certificate.png"
-    _default_label = "Iot Certificate"
+class IotPolicyEmergency(_Iot):
+    _icon = "iot-policy-emergency.png"
+    _default_label = "Iot Policy Emergency"
 
-class IotAnalytics(_Iot):
-    _icon = "iot-analytics.png"
-    _default_label = "Iot Analytics"
\ No newline at end of file
+class IotPolicy(_Iot):
+    _icon = "iot-policy.png"
+    _default_label = "Iot Policy"
+
+class IotRule(_Iot):
+    _icon = "iot-rule.png"
+    _default_label = "Iot Rule"
+
+class IotShadow(_Iot):
+    _icon = "iot-shadow.png"
+    _default_label = "Iot Shadow"
+
+class IotSitewise(_Iot):
+    _icon = "iot-sitewise.png"
+    _default_label = "Iot Sitewise"
+
+class IotThingsGraph(_Iot):
+    _icon = "iot-things-graph.png"
+    _default_label = "Iot Things Graph"
+
+class IotTopic(_Iot):
+    _icon = "iot-topic.png"
+    _default_label = "Iot Topic"
\ No newline at end of file
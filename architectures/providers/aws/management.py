@@ -6,73 +6,73 @@ class _Management(_Aws):
     _service_type = "management"
     _icon_dir = "icons/aws/management"
 
-class ManagedServices(_Management):
-    _icon = "managed-services.png"
-    _default_label = "Managed Services"
-
-class CommandLineInterface(_Management):
-    _icon = "command-line-interface.png"
-    _default_label = "Command Line Interface"
-
-class TrustedAdvisor(_Management):
-    _icon = "trusted-advisor.png"
-    _default_label = "Trusted Advisor"
+class AutoScaling(_Management):
+    _icon = "auto-scaling.png"
+    _default_label = "Auto Scaling"
 
-class LicenseManager(_Management):
-    _icon = "license-manager.png"
-    _default_label = "License Manager"
+class Cloudformation(_Management):
+    _icon = "cloudformation.png"
+    _default_label = "Cloudformation"
 
-class Opsworks(_Management):
-    _icon = "opsworks.png"
-    _default_label = "Opsworks"
+class Cloudtrail(_Management):
+    _icon = "cloudtrail.png"
+    _default_label = "Cloudtrail"
 
-class Config(_Management):
-    _icon = "config.png"
-    _default_label = "Config"
+class Cloudwatch(_Management):
+    _icon = "cloudwatch.png"
+    _default_label = "Cloudwatch"
 
 class Codeguru(_Management):
     _icon = "codeguru.png"
     _default_label = "Codeguru"
 
-class AutoScaling(_Management):
-    _icon = "auto-scaling.png"
-    _default_label = "Auto Scaling"
-
-class SystemsManager(_Management):
-    _icon = "systems-manager.png"
-    _default_label = "Systems Manager"
+class CommandLineInterface(_Management):
+    _icon = "command-line-interface.png"
+    _default_label = "Command Line Interface"
 
-class Organizations(_Management):
-    _icon = "organizations.png"
-    _default_label = "Organizations"
+class Config(_Management):
+    _icon = "config.png"
+    _default_label = "Config"
 
 class ControlTower(_Management):
     _icon = "control-tower.png"
     _default_label = "Control Tower"
 
+class LicenseManager(_Management):
+    _icon = "license-manager.png"
+    _default_label = "License Manager"
+
+class ManagedServices(_Management):
+    _icon = "managed-services.png"
+    _default_label = "Managed Services"
+
 class ManagementConsole(_Management):
     _icon = "management-console.png"
     _default_label = "Management Console"
 
-class Cloudtrail(_Management):
-    _icon = "cloudtrail.png"
-    _default_label = "Cloudtrail"
+class Opsworks(_Management):
+    _icon = "opsworks.png"
+    _default_label = "Opsworks"
 
-class Cloudwatch(_Management):
-    _icon = "cloudwatch.png"
-    _default_label = "Cloudwatch"
+class Organizations(_Management):
+    _icon = "organizations.png"
+    _default_label = "Organizations"
+
+class ServiceCatalog(_Management):
+    _icon = "service-catalog.png"
+    _default_label = "Service Catalog"
 
 class SystemsManagerParameterStore(_Management):
     _icon = "systems-manager-parameter-store.png"
     _default_label = "Systems Manager Parameter Store"
 
-class ServiceCatalog(_Management):
-    _icon = "service-catalog.png"
-    _default_label = "Service Catalog"
+class SystemsManager(_Management):
+    _icon = "systems-manager.png"
+    _default_label = "Systems Manager"
 
-class Cloudformation(_Management):
-    _icon = "cloudformation.png"
-    _default_label = "Cloudformation"
+class TrustedAdvisor(_Management):
+    _icon = "trusted-advisor.png"
+    _default_label = "Trusted Advisor"
 
 class WellArchitectedTool(_Management):
     _icon = "well-architected-tool.png"
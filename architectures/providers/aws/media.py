@@ -6,14 +6,38 @@ class _Media(_Aws):
     _service_type = "media"
     _icon_dir = "icons/aws/media"
 
+class ElasticTranscoder(_Media):
+    _icon = "elastic-transcoder.png"
+    _default_label = "Elastic Transcoder"
+
+class ElementalConductor(_Media):
+    _icon = "elemental-conductor.png"
+    _default_label = "Elemental Conductor"
+
+class ElementalDelta(_Media):
+    _icon = "elemental-delta.png"
+    _default_label = "Elemental Delta"
+
 class ElementalLive(_Media):
     _icon = "elemental-live.png"
     _default_label = "Elemental Live"
 
+class ElementalMediaconnect(_Media):
+    _icon = "elemental-mediaconnect.png"
+    _default_label = "Elemental Mediaconnect"
+
 class ElementalMediaconvert(_Media):
     _icon = "elemental-mediaconvert.png"
     _default_label = "Elemental Mediaconvert"
 
+class ElementalMedialive(_Media):
+    _icon = "elemental-medialive.png"
+    _default_label = "Elemental Medialive"
+
+class ElementalMediapackage(_Media):
+    _icon = "elemental-mediapackage.png"
+    _default_label = "Elemental Mediapackage"
+
 class ElementalMediastore(_Media):
     _icon = "elemental-mediastore.png"
     _default_label = "Elemental Mediastore"
@@ -22,30 +46,6 @@ class ElementalMediatailor(_Media):
     _icon = "elemental-mediatailor.png"
     _default_label = "Elemental Mediatailor"
 
-class ElementalDelta(_Media):
-    _icon = "elemental-delta.png"
-    _default_label = "Elemental Delta"
-
-class ElementalConductor(_Media):
-    _icon = "elemental-conductor.png"
-    _default_label = "Elemental Conductor"
-
 class ElementalServer(_Media):
     _icon = "elemental-server.png"
-    _default_label = "Elemental Server"
-
-class ElementalMedialive(_Media):
-    _icon = "elemental-medialive.png"
-    _default_label = "Elemental Medialive"
-
-class ElementalMediapackage(_Media):
-    _icon = "elemental-mediapackage.png"
-    _default_label = "Elemental Mediapackage"
-
-class ElasticTranscoder(_Media):
-    _icon = "elastic-transcoder.png"
-    _default_label = "Elastic Transcoder"
-
-class ElementalMediaconnect(_Media):
-    _icon = "elemental-mediaconnect.png"
-    _default_label = "Elemental Mediaconnect"
\ No newline at end of file
+    _default_label = "Elemental Server"
\ No newline at end of file
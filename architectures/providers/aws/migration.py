@@ -6,46 +6,46 @@ class _Migration(_Aws):
     _service_type = "migration"
     _icon_dir = "icons/aws/migration"
 
-class ServerMigrationService(_Migration):
-    _icon = "server-migration-service.png"
-    _default_label = "Server Migration Service"
-
 class ApplicationDiscoveryService(_Migration):
     _icon = "application-discovery-service.png"
     _default_label = "Application Discovery Service"
 
-class TransferForSftp(_Migration):
-    _icon = "transfer-for-sftp.png"
-    _default_label = "Transfer For Sftp"
-
-class MigrationAndTransfer(_Migration):
-    _icon = "migration-and-transfer.png"
-    _default_label = "Migration And Transfer"
-
-class Datasync(_Migration):
-    _icon = "datasync.png"
-    _default_label = "Datasync"
+class CloudendureMigration(_Migration):
+    _icon = "cloudendure-migration.png"
+    _default_label = "Cloudendure Migration"
 
 class DatabaseMigrationService(_Migration):
     _icon = "database-migration-service.png"
     _default_label = "Database Migration Service"
 
-class Snowball(_Migration):
-    _icon = "snowball.png"
-    _default_label = "Snowball"
+class Datasync(_Migration):
+    _icon = "datasync.png"
+    _default_label = "Datasync"
 
-class CloudendureMigration(_Migration):
-    _icon = "cloudendure-migration.png"
-    _default_label = "Cloudendure Migration"
+class MigrationAndTransfer(_Migration):
+    _icon = "migration-and-transfer.png"
+    _default_label = "Migration And Transfer"
 
 class MigrationHub(_Migration):
     _icon = "migration-hub.png"
     _default_label = "Migration Hub"
 
+class ServerMigrationService(_Migration):
+    _icon = "server-migration-service.png"
+    _default_label = "Server Migration Service"
+
 class SnowballEdge(_Migration):
     _icon = "snowball-edge.png"
     _default_label = "Snowball Edge"
 
+class Snowball(_Migration):
+    _icon = "snowball.png"
+    _default_label = "Snowball"
+
 class Snowmobile(_Migration):
     _icon = "snowmobile.png"
-    _default_label = "Snowmobile"
\ No newline at end of file
+    _default_label = "Snowmobile"
+
+class TransferForSftp(_Migration):
+    _icon = "transfer-for-sftp.png"
+    _default_label = "Transfer For Sftp"
\ No newline at end of file
@@ -6,37 +6,61 @@ class _Ml(_Aws):
     _service_type = "ml"
     _icon_dir = "icons/aws/ml"
 
+class ApacheMxnetOnAws(_Ml):
+    _icon = "apache-mxnet-on-aws.png"
+    _default_label = "Apache Mxnet On Aws"
+
+class Comprehend(_Ml):
+    _icon = "comprehend.png"
+    _default_label = "Comprehend"
+
+class DeepLearningAmis(_Ml):
+    _icon = "deep-learning-amis.png"
+    _default_label = "Deep Learning Amis"
+
+class DeepLearningContainers(_Ml):
+    _icon = "deep-learning-containers.png"
+    _default_label = "Deep Learning Containers"
+
+class Deeplens(_Ml):
+    _icon = "deeplens.png"
+    _default_label = "Deeplens"
+
 class Deepracer(_Ml):
     _icon = "deepracer.png"
     _default_label = "Deepracer"
 
-class Sagemaker(_Ml):
-    _icon = "sagemaker.png"
-    _default_label = "Sagemaker"
-
-class SagemakerGroundTruth(_Ml):
-    _icon = "sagemaker-ground-truth.png"
-    _default_label = "Sagemaker Ground Truth"
+class ElasticInference(_Ml):
+    _icon = "elastic-inference.png"
+    _default_label = "Elastic Inference"
 
-class Polly(_Ml):
-    _icon = "polly.png"
-    _default_label = "Polly"
+class Forecast(_Ml):
+    _icon = "forecast.png"
+    _default_label = "Forecast"
 
-class Transcribe(_Ml):
-    _icon = "transcribe.png"
-    _default_label = "Transcribe"
+class Lex(_Ml):
+    _icon = "lex.png"
+    _default_label = "Lex"
 
 class MachineLearning(_Ml):
     _icon = "machine-learning.png"
     _default_label = "Machine Learning"
 
+class Personalize(_Ml):
+    _icon = "personalize.png"
+    _default_label = "Personalize"
+
+class Polly(_Ml):
+    _icon = "polly.png"
+    _default_label = "Polly"
+
 class Rekognition(_Ml):
     _icon = "rekognition.png"
     _default_label = "Rekognition"
 
-class Lex(_Ml):
-    _icon = "lex.png"
-    _default_label = "Lex"
+class SagemakerGroundTruth(_Ml):
+    _icon = "sagemaker-ground-truth.png"
+    _default_label = "Sagemaker Ground Truth"
 
 class SagemakerModel(_Ml):
     _icon = "sagemaker-model.png"
@@ -46,50 +70,26 @@ class SagemakerNotebook(_Ml):
     _icon = "sagemaker-notebook.png"
     _default_label = "Sagemaker Notebook"
 
-class Deeplens(_Ml):
-    _icon = "deeplens.png"
-    _default_label = "Deeplens"
+class SagemakerTrainingJob(_Ml):
+    _icon = "sagemaker-training-job.png"
+    _default_label = "Sagemaker Training Job"
+
+class Sagemaker(_Ml):
+    _icon = "sagemaker.png"
+    _default_label = "Sagemaker"
 
 class TensorflowOnAws(_Ml):
     _icon = "tensorflow-on-aws.png"
     _default_label = "Tensorflow On Aws"
 
-class DeepLearningContainers(_Ml):
-    _icon = "deep-learning-containers.png"
-    _default_label = "Deep Learning Containers"
-
-class Translate(_Ml):
-    _icon = "translate.png"
-    _default_label = "Translate"
-
 class Textract(_Ml):
     _icon = "textract.png"
     _default_label = "Textract"
 
-class DeepLearningAmis(_Ml):
-    _icon = "deep-learning-amis.png"
-    _default_label = "Deep Learning Amis"
-
-class Comprehend(_Ml):
-    _icon = "comprehend.png"
-    _default_label = "Comprehend"
-
-class Personalize(_Ml):
-    _icon = "personalize.png"
-    _default_label = "Personalize"
-
-class ApacheMxnetOnAws(_Ml):
-    _icon = "apache-mxnet-on-aws.png"
-    _default_label = "Apache Mxnet On Aws"
-
-class SagemakerTrainingJob(_Ml):
-    _icon = "sagemaker-training-job.png"
-    _default_label = "Sagemaker Training Job"
-
-class Forecast(_Ml):
-    _icon = "forecast.png"
-    _default_label = "Forecast"
+class Transcribe(_Ml):
+    _icon = "transcribe.png"
+    _default_label = "Transcribe"
 
-class ElasticInference(_Ml):
-    _icon = "elastic-inference.png"
-    _default_label = "Elastic Inference"
\ No newline at end of file
+class Translate(_Ml):
+    _icon = "translate.png"
+    _default_label = "Translate"
\ No newline at end of file
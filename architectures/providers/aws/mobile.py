@@ -6,26 +6,26 @@ class _Mobile(_Aws):
     _service_type = "mobile"
     _icon_dir = "icons/aws/mobile"
 
-class Pinpoint(_Mobile):
-    _icon = "pinpoint.png"
-    _default_label = "Pinpoint"
-
-class Appsync(_Mobile):
-    _icon = "appsync.png"
-    _default_label = "Appsync"
+class Amplify(_Mobile):
+    _icon = "amplify.png"
+    _default_label = "Amplify"
 
 class ApiGatewayEndpoint(_Mobile):
     _icon = "api-gateway-endpoint.png"
     _default_label = "Api Gateway Endpoint"
 
-class Amplify(_Mobile):
-    _icon = "amplify.png"
-    _default_label = "Amplify"
-
 class ApiGateway(_Mobile):
     _icon = "api-gateway.png"
     _default_label = "Api Gateway"
 
+class Appsync(_Mobile):
+    _icon = "appsync.png"
+    _default_label = "Appsync"
+
 class DeviceFarm(_Mobile):
     _icon = "device-farm.png"
-    _default_label = "Device Farm"
\ No newline at end of file
+    _default_label = "Device Farm"
+
+class Pinpoint(_Mobile):
+    _icon = "pinpoint.png"
+    _default_label = "Pinpoint"
\ No newline at end of file
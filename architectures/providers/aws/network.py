@@ -6,93 +6,93 @@ class _Network(_Aws):
     _service_type = "network"
     _icon_dir = "icons/aws/network"
 
-class NetworkingAndContentDelivery(_Network):
-    _icon = "networking-and-content-delivery.png"
-    _default_label = "Networking And Content Delivery"
-
-class VpcPeering(_Network):
-    _icon = "vpc-peering.png"
-    _default_label = "Vpc Peering"
-
-class NatGateway(_Network):
-    _icon = "nat-gateway.png"
-    _default_label = "Nat Gateway"
+class ApiGateway(_Network):
+    _icon = "api-gateway.png"
+    _default_label = "Api Gateway"
 
-class SiteToSiteVpn(_Network):
-    _icon = "site-to-site-vpn.png"
-    _default_label = "Site To Site Vpn"
+class AppMesh(_Network):
+    _icon = "app-mesh.png"
+    _default_label = "App Mesh"
 
-class Route53(_Network):
-    _icon = "route-53.png"
-    _default_label = "Route 53"
+class ClientVpn(_Network):
+    _icon = "client-vpn.png"
+    _default_label = "Client Vpn"
 
-class InternetGateway(_Network):
-    _icon = "internet-gateway.png"
-    _default_label = "Internet Gateway"
+class CloudMap(_Network):
+    _icon = "cloud-map.png"
+    _default_label = "Cloud Map"
 
 class Cloudfront(_Network):
     _icon = "cloudfront.png"
     _default_label = "Cloudfront"
 
+class DirectConnect(_Network):
+    _icon = "direct-connect.png"
+    _default_label = "Direct Connect"
+
 class ElasticLoadBalancing(_Network):
     _icon = "elastic-load-balancing.png"
     _default_label = "Elastic Load Balancing"
 
-class VpcRouter(_Network):
-    _icon = "vpc-router.png"
-    _default_label = "Vpc Router"
-
-class AppMesh(_Network):
-    _icon = "app-mesh.png"
-    _default_label = "App Mesh"
-
-class TransitGateway(_Network):
-    _icon = "transit-gateway.png"
-    _default_label = "Transit Gateway"
+class Endpoint(_Network):
+    _icon = "endpoint.png"
+    _default_label = "Endpoint"
 
 class GlobalAccelerator(_Network):
     _icon = "global-accelerator.png"
     _default_label = "Global Accelerator"
 
-class Privatelink(_Network):
-    _icon = "privatelink.png"
-    _default_label = "Privatelink"
+class InternetGateway(_Network):
+    _icon = "internet-gateway.png"
+    _default_label = "Internet Gateway"
 
-class DirectConnect(_Network):
-    _icon = "direct-connect.png"
-    _default_label = "Direct Connect"
+class Nacl(_Network):
+    _icon = "nacl.png"
+    _default_label = "Nacl"
+
+class NatGateway(_Network):
+    _icon = "nat-gateway.png"
+    _default_label = "Nat Gateway"
+
+class NetworkingAndContentDelivery(_Network):
+    _icon = "networking-and-content-delivery.png"
+    _default_label = "Networking And Content Delivery"
 
 class PrivateSubnet(_Network):
     _icon = "private-subnet.png"
     _default_label = "Private Subnet"
 
-class CloudMap(_Network):
-    _icon = "cloud-map.png"
-    _default_label = "Cloud Map"
+class Privatelink(_Network):
+    _icon = "privatelink.png"
+    _default_label = "Privatelink"
+
+class PublicSubnet(_Network):
+    _icon = "public-subnet.png"
+    _default_label = "Public Subnet"
+
+class Route53(_Network):
+    _icon = "route-53.png"
+    _default_label = "Route 53"
 
 class RouteTable(_Network):
     _icon = "route-table.png"
     _default_label = "Route Table"
 
-class Endpoint(_Network):
-    _icon = "endpoint.png"
-    _default_label = "Endpoint"
-
-class ApiGateway(_Network):
-    _icon = "api-gateway.png"
-    _default_label = "Api Gateway"
+class SiteToSiteVpn(_Network):
+    _icon = "site-to-site-vpn.png"
+    _default_label = "Site To Site Vpn"
 
-class Nacl(_Network):
-    _icon = "nacl.png"
-    _default_label = "Nacl"
+class TransitGateway(_Network):
+    _icon = "transit-gateway.png"
+    _default_label = "Transit Gateway"
 
-class PublicSubnet(_Network):
-    _icon = "public-subnet.png"
-    _default_label = "Public Subnet"
+class VpcPeering(_Network):
+    _icon = "vpc-peering.png"
+    _default_label = "Vpc Peering"
 
-class ClientVpn(_Network):
-    _icon = "client-vpn.png"
-    _default_label = "Client Vpn"
+class VpcRouter(_Network):
+    _icon = "vpc-router.png"
+    _default_label = "Vpc Router"
 
 class Vpc(_Network):
     _icon = "vpc.png"
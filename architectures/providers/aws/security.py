@@ -6,98 +6,98 @@ class _Security(_Aws):
     _service_type = "security"
     _icon_dir = "icons/aws/security"
 
-class SecurityHub(_Security):
-    _icon = "security-hub.png"
-    _default_label = "Security Hub"
-
-class Waf(_Security):
-    _icon = "waf.png"
-    _default_label = "Waf"
+class Artifact(_Security):
+    _icon = "artifact.png"
+    _default_label = "Artifact"
 
-class Shield(_Security):
-    _icon = "shield.png"
-    _default_label = "Shield"
+class CertificateManager(_Security):
+    _icon = "certificate-manager.png"
+    _default_label = "Certificate Manager"
 
 class CloudDirectory(_Security):
     _icon = "cloud-directory.png"
     _default_label = "Cloud Directory"
 
-class IdentityAndAccessManagementIamRole(_Security):
-    _icon = "identity-and-access-management-iam-role.png"
-    _default_label = "Identity And Access Management Iam Role"
+class Cloudhsm(_Security):
+    _icon = "cloudhsm.png"
+    _default_label = "Cloudhsm"
 
-class IdentityAndAccessManagementIamPermissions(_Security):
-    _icon = "identity-and-access-management-iam-permissions.png"
-    _default_label = "Identity And Access Management Iam Permissions"
+class Cognito(_Security):
+    _icon = "cognito.png"
+    _default_label = "Cognito"
 
 class Detective(_Security):
     _icon = "detective.png"
     _default_label = "Detective"
 
-class Inspector(_Security):
-    _icon = "inspector.png"
-    _default_label = "Inspector"
+class DirectoryService(_Security):
+    _icon = "directory-service.png"
+    _default_label = "Directory Service"
 
-class SingleSignOn(_Security):
-    _icon = "single-sign-on.png"
-    _default_label = "Single Sign On"
+class FirewallManager(_Security):
+    _icon = "firewall-manager.png"
+    _default_label = "Firewall Manager"
 
-class SecretsManager(_Security):
-    _icon = "secrets-manager.png"
-    _default_label = "Secrets Manager"
+class Guardduty(_Security):
+    _icon = "guardduty.png"
+    _default_label = "Guardduty"
 
-class Artifact(_Security):
-    _icon = "artifact.png"
-    _default_label = "Artifact"
+class IdentityAndAccessManagementIamAccessAnalyzer(_Security):
+    _icon = "identity-and-access-management-iam-access-analyzer.png"
+    _default_label = "Identity And Access Management Iam Access Analyzer"
+
+class IdentityAndAccessManagementIamAwsSts(_Security):
+    _icon = "identity-and-access-management-iam-aws-sts.png"
+    _default_label = "Identity And Access Management Iam Aws Sts"
+
+class IdentityAndAccessManagementIamPermissions(_Security):
+    _icon = "identity-and-access-management-iam-permissions.png"
+    _default_label = "Identity And Access Management Iam Permissions"
+
+class IdentityAndAccessManagementIamRole(_Security):
+    _icon = "identity-and-access-management-iam-role.png"
+    _default_label = "Identity And Access Management Iam Role"
 
 class IdentityAndAccessManagementIam(_Security):
     _icon = "identity-and-access-management-iam.png"
     _default_label = "Identity And Access Management Iam"
 
-class Cognito(_Security):
-    _icon = "cognito.png"
-    _default_label = "Cognito"
-
-class DirectoryService(_Security):
-    _icon = "directory-service.png"
-    _default_label = "Directory Service"
+class Inspector(_Security):
+    _icon = "inspector.png"
+    _default_label = "Inspector"
 
 class KeyManagementService(_Security):
     _icon = "key-management-service.png"
     _default_label = "Key Management Service"
 
-class IdentityAndAccessManagementIamAwsSts(_Security):
-    _icon = "identity-and-access-management-iam-aws-sts.png"
-    _default_label = "Identity And Access Management Iam Aws Sts"
+class Macie(_Security):
+    _icon = "macie.png"
+    _default_label = "Macie"
 
 class ResourceAccessManager(_Security):
     _icon = "resource-access-manager.png"
     _default_label = "Resource Access Manager"
 
-class FirewallManager(_Security):
-    _icon = "firewall-manager.png"
-    _default_label = "Firewall Manager"
-
-class Guardduty(_Security):
-    _icon = "guardduty.png"
-    _default_label = "Guardduty"
-
-class CertificateManager(_Security):
-    _icon = "certificate-manager.png"
-    _default_label = "Certificate Manager"
+class SecretsManager(_Security):
+    _icon = "secrets-manager.png"
+    _default_label = "Secrets Manager"
 
-class IdentityAndAccessManagementIamAccessAnalyzer(_Security):
-    _icon = "identity-and-access-management-iam-access-analyzer.png"
-    _default_label = "Identity And Access Management Iam Access Analyzer"
+class SecurityHub(_Security):
+    _icon = "security-hub.png"
+    _default_label = "Security Hub"
 
 class SecurityIdentityAndCompliance(_Security):
     _icon = "security-identity-and-compliance.png"
     _default_label = "Security Identity And Compliance"
 
-class Macie(_Security):
-    _icon = "macie.png"
-    _default_label = "Macie"
+class Shield(_Security):
+    _icon = "shield.png"
+    _default_label = "Shield"
 
-class Cloudhsm(_Security):
-    _icon = "cloudhsm.png"
-    _default_label = "Cloudhsm"
\ No newline at end of file
+class SingleSignOn(_Security):
+    _icon = "single-sign-on.png"
+    _default_label = "Single Sign On"
+
+class Waf(_Security):
+    _icon = "waf.png"
+    _default_label = "Waf"
\ No newline at end of file
@@ -6,9 +6,9 @@ class _Storage(_Aws):
     _service_type = "storage"
     _icon_dir = "icons/aws/storage"
 
-class FsxForWindowsFileServer(_Storage):
-    _icon = "fsx-for-windows-file-server.png"
-    _default_label = "Fsx For Windows File Server"
+class Backup(_Storage):
+    _icon = "backup.png"
+    _default_label = "Backup"
 
 class CloudendureDisasterRecovery(_Storage):
     _icon = "cloudendure-disaster-recovery.png"
@@ -18,54 +18,54 @@ class EfsInfrequentaccessPrimaryBg(_Storage):
     _icon = "efs-infrequentaccess-primary-bg.png"
     _default_label = "Efs Infrequentaccess Primary Bg"
 
-class SimpleStorageServiceS3(_Storage):
-    _icon = "simple-storage-service-s3.png"
-    _default_label = "Simple Storage Service S3"
-
-class Snowball(_Storage):
-    _icon = "snowball.png"
-    _default_label = "Snowball"
-
 class EfsStandardPrimaryBg(_Storage):
     _icon = "efs-standard-primary-bg.png"
     _default_label = "Efs Standard Primary Bg"
 
+class ElasticBlockStoreEbs(_Storage):
+    _icon = "elastic-block-store-ebs.png"
+    _default_label = "Elastic Block Store Ebs"
+
+class ElasticFileSystemEfs(_Storage):
+    _icon = "elastic-file-system-efs.png"
+    _default_label = "Elastic File System Efs"
+
+class FsxForLustre(_Storage):
+    _icon = "fsx-for-lustre.png"
+    _default_label = "Fsx For Lustre"
+
+class FsxForWindowsFileServer(_Storage):
+    _icon = "fsx-for-windows-file-server.png"
+    _default_label = "Fsx For Windows File Server"
+
 class Fsx(_Storage):
     _icon = "fsx.png"
     _default_label = "Fsx"
 
-class StorageGateway(_Storage):
-    _icon = "storage-gateway.png"
-    _default_label = "Storage Gateway"
+class S3Glacier(_Storage):
+    _icon = "s3-glacier.png"
+    _default_label = "S3 Glacier"
 
-class Backup(_Storage):
-    _icon = "backup.png"
-    _default_label = "Backup"
+class SimpleStorageServiceS3(_Storage):
+    _icon = "simple-storage-service-s3.png"
+    _default_label = "Simple Storage Service S3"
 
 class SnowballEdge(_Storage):
     _icon = "snowball-edge.png"
     _default_label = "Snowball Edge"
 
+class Snowball(_Storage):
+    _icon = "snowball.png"
+    _default_label = "Snowball"
+
 class Snowmobile(_Storage):
     _icon = "snowmobile.png"
     _default_label = "Snowmobile"
 
-class ElasticBlockStoreEbs(_Storage):
-    _icon = "elastic-block-store-ebs.png"
-    _default_label = "Elastic Block Store Ebs"
-
-class FsxForLustre(_Storage):
-    _icon = "fsx-for-lustre.png"
-    _default_label = "Fsx For Lustre"
-
-class S3Glacier(_Storage):
-    _icon = "s3-glacier.png"
-    _default_label = "S3 Glacier"
+class StorageGateway(_Storage):
+    _icon = "storage-gateway.png"
+    _default_label = "Storage Gateway"
 
 class Storage(_Storage):
     _icon = "storage.png"
-    _default_label = "Storage"
-
-class ElasticFileSystemEfs(_Storage):
-    _icon = "elastic-file-system-efs.png"
-    _default_label = "Elastic File System Efs"
\ No newline at end of file
+    _default_label = "Storage"
\ No newline at end of file
@@ -6,182 +6,182 @@ class _Ai(_Azure):
     _service_type = "ai"
     _icon_dir = "icons/azure/ai"
 
+class AdministrativeUnit(_Ai):
+    _icon = "administrative-unit.png"
+    _default_label = "Administrative Unit"
+
+class BatchAi(_Ai):
+    _icon = "batch-ai.png"
+    _default_label = "Batch Ai"
+
+class Bonsai(_Ai):
+    _icon = "bonsai.png"
+    _default_label = "Bonsai"
+
+class BotService(_Ai):
+    _icon = "bot-service.png"
+    _default_label = "Bot Service"
+
+class CognitiveServicesAnomalyDetector(_Ai):
+    _icon = "cognitive-services-anomaly-detector.png"
+    _default_label = "Cognitive Services Anomaly Detector"
+
+class CognitiveServicesBot(_Ai):
+    _icon = "cognitive-services-bot.png"
+    _default_label = "Cognitive Services Bot"
+
 class CognitiveServicesContentExtraction(_Ai):
     _icon = "cognitive-services-content-extraction.png"
     _default_label = "Cognitive Services Content Extraction"
 
-class CognitiveServicesSearch(_Ai):
-    _icon = "cognitive-services-search.png"
-    _default_label = "Cognitive Services Search"
+class CognitiveServicesContentModerator(_Ai):
+    _icon = "cognitive-services-content-moderator.png"
+    _default_label = "Cognitive Services Content Moderator"
 
-class CognitiveServicesDecision(_Ai):
-    _icon = "cognitive-services-decision.png"
-    _default_label = "Cognitive Services Decision"
+class CognitiveServicesConversation(_Ai):
+    _icon = "cognitive-services-conversation.png"
+    _default_label = "Cognitive Services Conversation"
 
 class CognitiveServicesCustomVision(_Ai):
     _icon = "cognitive-services-custom-vision.png"
     _default_label = "Cognitive Services Custom Vision"
 
-class CognitiveServicesContentModerator(_Ai):
-    _icon = "cognitive-services-content-moderator.png"
-    _default_label = "Cognitive Services Content Moderator"
-
-class MachineLearningStudioWorkspaceClassic(_Ai):
-    _icon = "machine-learning-studio-workspace-classic.png"
-    _default_label = "Machine Learning Studio Workspace Classic"
-
-class CognitiveServicesTextTranslator(_Ai):
-    _icon = "cognitive-services-text-translator.png"
-    _default_label = "Cognitive Services Text Translator"
+class CognitiveServicesCustomisedExperience(_Ai):
+    _icon = "cognitive-services-customised-experience.png"
+    _default_label = "Cognitive Services Customised Experience"
 
-class MachineLearning(_Ai):
-    _icon = "machine-learning.png"
-    _default_label = "Machine Learning"
+class CognitiveServicesDecision(_Ai):
+    _icon = "cognitive-services-decision.png"
+    _default_label = "Cognitive Services Decision"
 
 class CognitiveServicesEnterpriseBot(_Ai):
     _icon = "cognitive-services-enterprise-bot.png"
     _default_label = "Cognitive Services Enterprise Bot"
 
-class CognitiveServices(_Ai):
-    _icon = "cognitive-services.png"
-    _default_label = "Cognitive Services"
+class CognitiveServicesFormRecogniser(_Ai):
+    _icon = "cognitive-services-form-recogniser.png"
+    _default_label = "Cognitive Services Form Recogniser"
 
-class CognitiveServicesIntelligence(_Ai):
-    _icon = "cognitive-services-intelligence.png"
-    _default_label = "Cognitive Services Intelligence"
+class CognitiveServicesHealthAndLifeScience(_Ai):
+    _icon = "cognitive-services-health-and-life-science.png"
+    _default_label = "Cognitive Services Health And Life Science"
+
+class CognitiveServicesImmersiveReader(_Ai):
+    _icon = "cognitive-services-immersive-reader.png"
+    _default_label = "Cognitive Services Immersive Reader"
 
 class CognitiveServicesInkRecogniser(_Ai):
     _icon = "cognitive-services-ink-recogniser.png"
     _default_label = "Cognitive Services Ink Recogniser"
 
-class PowerBi(_Ai):
-    _icon = "power-bi.png"
-    _default_label = "Power Bi"
-
-class CognitiveServicesQnaExtracter(_Ai):
-    _icon = "cognitive-services-qna-extracter.png"
-    _default_label = "Cognitive Services Qna Extracter"
-
-class CognitiveServicesVision(_Ai):
-    _icon = "cognitive-services-vision.png"
-    _default_label = "Cognitive Services Vision"
+class CognitiveServicesIntelligence(_Ai):
+    _icon = "cognitive-services-intelligence.png"
+    _default_label = "Cognitive Services Intelligence"
 
-class CognitiveServicesBot(_Ai):
-    _icon = "cognitive-services-bot.png"
-    _default_label = "Cognitive Services Bot"
+class CognitiveServicesKnowledge(_Ai):
+    _icon = "cognitive-services-knowledge.png"
+    _default_label = "Cognitive Services Knowledge"
 
-class MachineLearningStudioWebServiceClassic(_Ai):
-    _icon = "machine-learning-studio-web-service-classic.png"
-    _default_label = "Machine Learning Studio Web Service Classic"
+class CognitiveServicesLanguage(_Ai):
+    _icon = "cognitive-services-language.png"
+    _default_label = "Cognitive Services Language"
 
-class AdministrativeUnit(_Ai):
-    _icon = "administrative-unit.png"
-    _default_label = "Administrative Unit"
+class CognitiveServicesModelOptimisation(_Ai):
+    _icon = "cognitive-services-model-optimisation.png"
+    _default_label = "Cognitive Services Model Optimisation"
 
-class CognitiveServicesVideoIndexer(_Ai):
-    _icon = "cognitive-services-video-indexer.png"
-    _default_label = "Cognitive Services Video Indexer"
+class CognitiveServicesOcr(_Ai):
+    _icon = "cognitive-services-ocr.png"
+    _default_label = "Cognitive Services Ocr"
 
-class CognitiveServicesTextAnalytics(_Ai):
-    _icon = "cognitive-services-text-analytics.png"
-    _default_label = "Cognitive Services Text Analytics"
+class CognitiveServicesPersonaliser(_Ai):
+    _icon = "cognitive-services-personaliser.png"
+    _default_label = "Cognitive Services Personaliser"
 
-class CognitiveServicesImmersiveReader(_Ai):
-    _icon = "cognitive-services-immersive-reader.png"
-    _default_label = "Cognitive Services Immersive Reader"
+class CognitiveServicesQnaBot(_Ai):
+    _icon = "cognitive-services-qna-bot.png"
+    _default_label = "Cognitive Services Qna Bot"
 
-class CognitiveServicesFormRecogniser(_Ai):
-    _icon = "cognitive-services-form-recogniser.png"
-    _default_label = "Cognitive Services Form Recogniser"
+class CognitiveServicesQnaExtracter(_Ai):
+    _icon = "cognitive-services-qna-extracter.png"
+    _default_label = "Cognitive Services Qna Extracter"
 
-class RemoteRenderingAccount(_Ai):
-    _icon = "remote-rendering-account.png"
-    _default_label = "Remote Rendering Account"
+class CognitiveServicesQnaMaker(_Ai):
+    _icon = "cognitive-services-qna-maker.png"
+    _default_label = "Cognitive Services Qna Maker"
 
-class SearchService(_Ai):
-    _icon = "search-service.png"
-    _default_label = "Search Service"
+class CognitiveServicesSearch(_Ai):
+    _icon = "cognitive-services-search.png"
+    _default_label = "Cognitive Services Search"
 
 class CognitiveServicesSpeakerRecognition(_Ai):
     _icon = "cognitive-services-speaker-recognition.png"
     _default_label = "Cognitive Services Speaker Recognition"
 
-class CognitiveServicesModelOptimisation(_Ai):
-    _icon = "cognitive-services-model-optimisation.png"
-    _default_label = "Cognitive Services Model Optimisation"
-
-class SpatialAnchorsAccount(_Ai):
-    _icon = "spatial-anchors-account.png"
-    _default_label = "Spatial Anchors Account"
-
 class CognitiveServicesSpeech(_Ai):
     _icon = "cognitive-services-speech.png"
     _default_label = "Cognitive Services Speech"
 
-class MachineLearningStudio(_Ai):
-    _icon = "machine-learning-studio.png"
-    _default_label = "Machine Learning Studio"
+class CognitiveServicesTextAnalytics(_Ai):
+    _icon = "cognitive-services-text-analytics.png"
+    _default_label = "Cognitive Services Text Analytics"
 
-class CognitiveServicesLanguage(_Ai):
-    _icon = "cognitive-services-language.png"
-    _default_label = "Cognitive Services Language"
+class CognitiveServicesTextTranslator(_Ai):
+    _icon = "cognitive-services-text-translator.png"
+    _default_label = "Cognitive Services Text Translator"
 
-class BotService(_Ai):
-    _icon = "bot-service.png"
-    _default_label = "Bot Service"
+class CognitiveServicesVideoIndexer(_Ai):
+    _icon = "cognitive-services-video-indexer.png"
+    _default_label = "Cognitive Services Video Indexer"
 
-class MachineLearningStudioWebServicePlanClassic(_Ai):
-    _icon = "machine-learning-studio-web-service-plan-classic.png"
-    _default_label = "Machine Learning Studio Web Service Plan Classic"
+class CognitiveServicesVision(_Ai):
+    _icon = "cognitive-services-vision.png"
+    _default_label = "Cognitive Services Vision"
 
-class CognitiveServicesCustomisedExperience(_Ai):
-    _icon = "cognitive-services-customised-experience.png"
-    _default_label = "Cognitive Services Customised Experience"
+class CognitiveServices(_Ai):
+    _icon = "cognitive-services.png"
+    _default_label = "Cognitive Services"
 
 class GenomicsAccount(_Ai):
     _icon = "genomics-account.png"
     _default_label = "Genomics Account"
 
-class CognitiveServicesPersonaliser(_Ai):
-    _icon = "cognitive-services-personaliser.png"
-    _default_label = "Cognitive Services Personaliser"
-
-class CognitiveServicesKnowledge(_Ai):
-    _icon = "cognitive-services-knowledge.png"
-    _default_label = "Cognitive Services Knowledge"
+class MachineLearningStudioWebServiceClassic(_Ai):
+    _icon = "machine-learning-studio-web-service-classic.png"
+    _default_label = "Machine Learning Studio Web Service Classic"
 
-class CognitiveServicesConversation(_Ai):
-    _icon = "cognitive-services-conversation.png"
-    _default_label = "Cognitive Services Conversation"
+class MachineLearningStudioWebServicePlanClassic(_Ai):
+    _icon = "machine-learning-studio-web-service-plan-classic.png"
+    _default_label = "Machine Learning Studio Web Service Plan Classic"
 
-class CognitiveServicesOcr(_Ai):
-    _icon = "cognitive-services-ocr.png"
-    _default_label = "Cognitive Services Ocr"
+class MachineLearningStudioWorkspaceClassic(_Ai):
+    _icon = "machine-learning-studio-workspace-classic.png"
+    _default_label = "Machine Learning Studio Workspace Classic"
 
-class CognitiveServicesQnaMaker(_Ai):
-    _icon = "cognitive-services-qna-maker.png"
-    _default_label = "Cognitive Services Qna Maker"
+class MachineLearningStudio(_Ai):
+    _icon = "machine-learning-studio.png"
+    _default_label = "Machine Learning Studio"
 
-class CognitiveServicesAnomalyDetector(_Ai):
-    _icon = "cognitive-services-anomaly-detector.png"
-    _default_label = "Cognitive Services Anomaly Detector"
+class MachineLearning(_Ai):
+    _icon = "machine-learning.png"
+    _default_label = "Machine Learning"
 
 class PowerBiEmbedded(_Ai):
     _icon = "power-bi-embedded.png"
     _default_label = "Power Bi Embedded"
 
-class CognitiveServicesQnaBot(_Ai):
-    _icon = "cognitive-services-qna-bot.png"
-    _default_label = "Cognitive Services Qna Bot"
+class PowerBi(_Ai):
+    _icon = "power-bi.png"
+    _default_label = "Power Bi"
 
-class Bonsai(_Ai):
-    _icon = "bonsai.png"
-    _default_label = "Bonsai"
+class RemoteRenderingAccount(_Ai):
+    _icon = "remote-rendering-account.png"
+    _default_label = "Remote Rendering Account"
 
-class CognitiveServicesHealthAndLifeScience(_Ai):
-    _icon = "cognitive-services-health-and-life-science.png"
-    _default_label = "Cognitive Services Health And Life Science"
+class SearchService(_Ai):
+    _icon = "search-service.png"
+    _default_label = "Search Service"
 
-class BatchAi(_Ai):
-    _icon = "batch-ai.png"
-    _default_label = "Batch Ai"
\ No newline at end of file
+class SpatialAnchorsAccount(_Ai):
+    _icon = "spatial-anchors-account.png"
+    _default_label = "Spatial Anchors Account"
\ No newline at end of file
@@ -6,137 +6,125 @@ class _Application(_Azure):
     _service_type = "application"
     _icon_dir = "icons/azure/application"
 
-class Websocket(_Application):
-    _icon = "websocket.png"
-    _default_label = "Websocket"
+class ApiConnection(_Application):
+    _icon = "api-connection.png"
+    _default_label = "Api Connection"
 
-class EventGridSubscription(_Application):
-    _icon = "event-grid-subscription.png"
-    _default_label = "Event Grid Subscription"
+class ApplicationConfiguration(_Application):
+    _icon = "application-configuration.png"
+    _default_label = "Application Configuration"
 
-class FunctionApp(_Application):
-    _icon = "function-app.png"
-    _default_label = "Function App"
+class ApplicationDeploymentSlot(_Application):
+    _icon = "application-deployment-slot.png"
+    _default_label = "Application Deployment Slot"
 
-class ApplicationServiceEnvironment(_Application):
-    _icon = "application-service-environment.png"
-    _default_label = "Application Service Environment"
+class ApplicationGroup(_Application):
+    _icon = "application-group.png"
+    _default_label = "Application Group"
 
-class StreamAnalyticsCluster(_Application):
-    _icon = "stream-analytics-cluster.png"
-    _default_label = "Stream Analytics Cluster"
+class ApplicationProxy(_Application):
+    _icon = "application-proxy.png"
+    _default_label = "Application Proxy"
 
-class ServicesHubConnector(_Application):
-    _icon = "services-hub-connector.png"
-    _default_label = "Services Hub Connector"
+class ApplicationRegistration(_Application):
+    _icon = "application-registration.png"
+    _default_label = "Application Registration"
 
-class Signalr(_Application):
-    _icon = "signalr.png"
-    _default_label = "Signalr"
+class ApplicationSecurityGroup(_Application):
+    _icon = "application-security-group.png"
+    _default_label = "Application Security Group"
 
-class MeshApplication(_Application):
-    _icon = "mesh-application.png"
-    _default_label = "Mesh Application"
+class ApplicationServiceCertificate(_Application):
+    _icon = "application-service-certificate.png"
+    _default_label = "Application Service Certificate"
 
-class ApplicationProxy(_Application):
-    _icon = "application-proxy.png"
-    _default_label = "Application Proxy"
+class ApplicationServiceDomain(_Application):
+    _icon = "application-service-domain.png"
+    _default_label = "Application Service Domain"
 
-class ServiceEndpointPolicy(_Application):
-    _icon = "service-endpoint-policy.png"
-    _default_label = "Service Endpoint Policy"
+class ApplicationServiceEnvironment(_Application):
+    _icon = "application-service-environment.png"
+    _default_label = "Application Service Environment"
 
-class LogicAppCustomConnecton(_Application):
-    _icon = "logic-app-custom-connecton.png"
-    _default_label = "Logic App Custom Connecton"
+class ApplicationServicePlan(_Application):
+    _icon = "application-service-plan.png"
+    _default_label = "Application Service Plan"
 
-class ManagedApplicationCenter(_Application):
-    _icon = "managed-application-center.png"
-    _default_label = "Managed Application Center"
+class ApplicationService(_Application):
+    _icon = "application-service.png"
+    _default_label = "Application Service"
 
-class StaticWebApp(_Application):
-    _icon = "static-web-app.png"
-    _default_label = "Static Web App"
+class AzureApiForFhir(_Application):
+    _icon = "azure-api-for-fhir.png"
+    _default_label = "Azure Api For Fhir"
 
-class EnterpriseApplication(_Application):
-    _icon = "enterprise-application.png"
-    _default_label = "Enterprise Application"
+class AzureMapsAccount(_Application):
+    _icon = "azure-maps-account.png"
+    _default_label = "Azure Maps Account"
 
 class ClientApplication(_Application):
     _icon = "client-application.png"
     _default_label = "Client Application"
 
-class EventGridSystemTopic(_Application):
-    _icon = "event-grid-system-topic.png"
-    _default_label = "Event Grid System Topic"
+class Cors(_Application):
+    _icon = "cors.png"
+    _default_label = "Cors"
+
+class EnterpriseApplication(_Application):
+    _icon = "enterprise-application.png"
+    _default_label = "Enterprise Application"
 
 class EventGridDomain(_Application):
     _icon = "event-grid-domain.png"
     _default_label = "Event Grid Domain"
 
-class IntegrationServiceEnvironment(_Application):
-    _icon = "integration-service-environment.png"
-    _default_label = "Integration Service Environment"
-
-class EventHub(_Application):
-    _icon = "event-hub.png"
-    _default_label = "Event Hub"
-
-class AzureMapsAccount(_Application):
-    _icon = "azure-maps-account.png"
-    _default_label = "Azure Maps Account"
+class EventGridSubscription(_Application):
+    _icon = "event-grid-subscription.png"
+    _default_label = "Event Grid Subscription"
 
-class ApplicationServiceDomain(_Application):
-    _icon = "application-service-domain.png"
-    _default_label = "Application Service Domain"
+class EventGridSystemTopic(_Application):
+    _icon = "event-grid-system-topic.png"
+    _default_label = "Event Grid System Topic"
 
 class EventGridTopic(_Application):
     _icon = "event-grid-topic.png"
     _default_label = "Event Grid Topic"
 
-class ManagedApplication(_Application):
-    _icon = "managed-application.png"
-    _default_label = "Managed Application"
-
-class ApplicationConfiguration(_Application):
-    _icon = "application-configuration.png"
-    _default_label = "Application Configuration"
-
-class LogicApp(_Application):
-    _icon = "logic-app.png"
-    _default_label = "Logic App"
+class EventHubCluster(_Application):
+    _icon = "event-hub-cluster.png"
+    _default_label = "Event Hub Cluster"
 
-class WebHook(_Application):
-    _icon = "web-hook.png"
-    _default_label = "Web Hook"
+class EventHub(_Application):
+    _icon = "event-hub.png"
+    _default_label = "Event Hub"
 
-class ApplicationRegistration(_Application):
-    _icon = "application-registration.png"
-    _default_label = "Application Registration"
+class FunctionApp(_Application):
+    _icon = "function-app.png"
+    _default_label = "Function App"
 
-class ApplicationDeploymentSlot(_Application):
-    _icon = "application-deployment-slot.png"
-    _default_label = "Application Deployment Slot"
+class IntegrationServiceEnvironment(_Application):
+    _icon = "integration-service-environment.png"
+    _default_label = "Integration Service Environment"
 
-class ApplicationGroup(_Application):
-    _icon = "application-group.png"
-    _default_label = "Application Group"
+class LogicAppCustomConnecton(_Application):
+    _icon = "logic-app-custom-connecton.png"
+    _default_label = "Logic App Custom Connecton"
 
-class AzureApiForFhir(_Application):
-    _icon = "azure-api-for-fhir.png"
-    _default_label = "Azure Api For Fhir"
+class LogicApp(_Application):
+    _icon = "logic-app.png"
+    _default_label = "Logic App"
 
-class ServiceEndpoint(_Application):
-    _icon = "service-endpoint.png"
-    _default_label = "Service Endpoint"
+class ManagedApplicationCenter(_Application):
+    _icon = "managed-application-center.png"
+    _default_label = "Managed Application Center"
 
-class ApplicationServicePlan(_Application):
-    _icon = "application-service-plan.png"
-    _default_label = "Application Service Plan"
+class ManagedApplication(_Application):
+    _icon = "managed-application.png"
+    _default_label = "Managed Application"
 
-class EventHubCluster(_Application):
-    _icon = "event-hub-cluster.png"
-    _default_label = "Event Hub Cluster"
+class MeshApplication(_Application):
+    _icon = "mesh-application.png"
+    _default_label = "Mesh Application"
 
 class NotificationHub(_Application):
     _icon = "notification-hub.png"
@@ -146,26 +134,38 @@ class SendgridAccount(_Application):
     _icon = "sendgrid-account.png"
     _default_label = "Sendgrid Account"
 
-class ApplicationSecurityGroup(_Application):
-    _icon = "application-security-group.png"
-    _default_label = "Application Security Group"
+class ServiceEndpointPolicy(_Application):
+    _icon = "service-endpoint-policy.png"
+    _default_label = "Service Endpoint Policy"
 
-class ApiConnection(_Application):
-    _icon = "api-connection.png"
-    _default_label = "Api Connection"
+class ServiceEndpoint(_Application):
+    _icon = "service-endpoint.png"
+    _default_label = "Service Endpoint"
 
-class ApplicationServiceCertificate(_Application):
-    _icon = "application-service-certificate.png"
-    _default_label = "Application Service Certificate"
+class ServicesHubConnector(_Application):
+    _icon = "services-hub-connector.png"
+    _default_label = "Services Hub Connector"
 
-class ApplicationService(_Application):
-    _icon = "application-service.png"
-    _default_label = "Application Service"
+class Signalr(_Application):
+    _icon = "signalr.png"
+    _default_label = "Signalr"
 
-class Cors(_Application):
-    _icon = "cors.png"
-    _default_label = "Cors"
+class StaticWebApp(_Application):
+    _icon = "static-web-app.png"
+    _default_label = "Static Web App"
+
+class StreamAnalyticsCluster(_Application):
+    _icon = "stream-analytics-cluster.png"
+    _default_label = "Stream Analytics Cluster"
 
 class StreamAnalyticsJob(_Application):
     _icon = "stream-analytics-job.png"
-    _default_label = "Stream Analytics Job"
\ No newline at end of file
+    _default_label = "Stream Analytics Job"
+
+class WebHook(_Application):
+    _icon = "web-hook.png"
+    _default_label = "Web Hook"
+
+class Websocket(_Application):
+    _icon = "websocket.png"
+    _default_label = "Websocket"
\ No newline at end of file
@@ -1,11 +0,0 @@
-# Do not modify this file directly. It is auto-generated with Python.
-
-from architectures.providers import _Azure
-
-class _Azure(_Azure):
-    _service_type = "azure"
-    _icon_dir = "icons/azure/azure"
-
-class (_Azure):
-    _icon = ".DS_Store"
-    _default_label = ""
\ No newline at end of file
@@ -6,258 +6,258 @@ class _Compute(_Azure):
     _service_type = "compute"
     _icon_dir = "icons/azure/compute"
 
-class BlockchainToken(_Compute):
-    _icon = "blockchain-token.png"
-    _default_label = "Blockchain Token"
-
-class CloudServiceClassic(_Compute):
-    _icon = "cloud-service-classic.png"
-    _default_label = "Cloud Service Classic"
+class AzureBlockchainService(_Compute):
+    _icon = "azure-blockchain-service.png"
+    _default_label = "Azure Blockchain Service"
 
-class AzureStackHub(_Compute):
-    _icon = "azure-stack-hub.png"
-    _default_label = "Azure Stack Hub"
+class AzureQuantum(_Compute):
+    _icon = "azure-quantum.png"
+    _default_label = "Azure Quantum"
 
-class BlockchainApplication(_Compute):
-    _icon = "blockchain-application.png"
-    _default_label = "Blockchain Application"
+class AzureSpringCloud(_Compute):
+    _icon = "azure-spring-cloud.png"
+    _default_label = "Azure Spring Cloud"
 
-class ContainerRegistry(_Compute):
-    _icon = "container-registry.png"
-    _default_label = "Container Registry"
+class AzureStackBackup(_Compute):
+    _icon = "azure-stack-backup.png"
+    _default_label = "Azure Stack Backup"
 
-class CloudSimpleNode(_Compute):
-    _icon = "cloud-simple-node.png"
-    _default_label = "Cloud Simple Node"
+class AzureStackCapacity(_Compute):
+    _icon = "azure-stack-capacity.png"
+    _default_label = "Azure Stack Capacity"
 
-class CitrixVirtualDesktopEssentials(_Compute):
-    _icon = "citrix-virtual-desktop-essentials.png"
-    _default_label = "Citrix Virtual Desktop Essentials"
+class AzureStackEdgeManagement(_Compute):
+    _icon = "azure-stack-edge-management.png"
+    _default_label = "Azure Stack Edge Management"
 
 class AzureStackHci(_Compute):
     _icon = "azure-stack-hci.png"
     _default_label = "Azure Stack Hci"
 
-class DevtestLab(_Compute):
-    _icon = "devtest-lab.png"
-    _default_label = "Devtest Lab"
+class AzureStackHub(_Compute):
+    _icon = "azure-stack-hub.png"
+    _default_label = "Azure Stack Hub"
+
+class AzureStackMultiTenant(_Compute):
+    _icon = "azure-stack-multi-tenant.png"
+    _default_label = "Azure Stack Multi Tenant"
 
 class AzureStackOffer(_Compute):
     _icon = "azure-stack-offer.png"
     _default_label = "Azure Stack Offer"
 
-class Host(_Compute):
-    _icon = "host.png"
-    _default_label = "Host"
+class AzureStackPlan(_Compute):
+    _icon = "azure-stack-plan.png"
+    _default_label = "Azure Stack Plan"
 
-class AzureStackBackup(_Compute):
-    _icon = "azure-stack-backup.png"
-    _default_label = "Azure Stack Backup"
+class AzureStackUpdate(_Compute):
+    _icon = "azure-stack-update.png"
+    _default_label = "Azure Stack Update"
 
-class ContainerKubernetesService(_Compute):
-    _icon = "container-kubernetes-service.png"
-    _default_label = "Container Kubernetes Service"
+class AzureStackUserSubscription(_Compute):
+    _icon = "azure-stack-user-subscription.png"
+    _default_label = "Azure Stack User Subscription"
 
-class ComputeAndApp(_Compute):
-    _icon = "compute-and-app.png"
-    _default_label = "Compute And App"
+class AzureVmwareSolution(_Compute):
+    _icon = "azure-vmware-solution.png"
+    _default_label = "Azure Vmware Solution"
 
-class AzureQuantum(_Compute):
-    _icon = "azure-quantum.png"
-    _default_label = "Azure Quantum"
+class BlockchainAbsMember(_Compute):
+    _icon = "blockchain-abs-member.png"
+    _default_label = "Blockchain Abs Member"
 
-class HostGroup(_Compute):
-    _icon = "host-group.png"
-    _default_label = "Host Group"
+class BlockchainApplication(_Compute):
+    _icon = "blockchain-application.png"
+    _default_label = "Blockchain Application"
 
-class VirtualMachineImage(_Compute):
-    _icon = "virtual-machine-image.png"
-    _default_label = "Virtual Machine Image"
+class BlockchainConnection(_Compute):
+    _icon = "blockchain-connection.png"
+    _default_label = "Blockchain Connection"
 
-class ContainerInstance(_Compute):
-    _icon = "container-instance.png"
-    _default_label = "Container Instance"
+class BlockchainConsortium(_Compute):
+    _icon = "blockchain-consortium.png"
+    _default_label = "Blockchain Consortium"
 
 class BlockchainDataManager(_Compute):
     _icon = "blockchain-data-manager.png"
     _default_label = "Blockchain Data Manager"
 
-class InstancePool(_Compute):
-    _icon = "instance-pool.png"
-    _default_label = "Instance Pool"
+class BlockchainDevkit(_Compute):
+    _icon = "blockchain-devkit.png"
+    _default_label = "Blockchain Devkit"
 
-class VirtualMachineNonAzure(_Compute):
-    _icon = "virtual-machine-non-azure.png"
-    _default_label = "Virtual Machine Non Azure"
+class BlockchainStreaming(_Compute):
+    _icon = "blockchain-streaming.png"
+    _default_label = "Blockchain Streaming"
 
-class AzureStackUpdate(_Compute):
-    _icon = "azure-stack-update.png"
-    _default_label = "Azure Stack Update"
+class BlockchainToken(_Compute):
+    _icon = "blockchain-token.png"
+    _default_label = "Blockchain Token"
 
-class VirtualMachineImageClassic(_Compute):
-    _icon = "virtual-machine-image-classic.png"
-    _default_label = "Virtual Machine Image Classic"
+class CitrixVirtualDesktopEssentials(_Compute):
+    _icon = "citrix-virtual-desktop-essentials.png"
+    _default_label = "Citrix Virtual Desktop Essentials"
 
-class CloudtestPool(_Compute):
-    _icon = "cloudtest-pool.png"
-    _default_label = "Cloudtest Pool"
+class CloudServiceClassic(_Compute):
+    _icon = "cloud-service-classic.png"
+    _default_label = "Cloud Service Classic"
 
-class AzureStackEdgeManagement(_Compute):
-    _icon = "azure-stack-edge-management.png"
-    _default_label = "Azure Stack Edge Management"
+class CloudSimpleNode(_Compute):
+    _icon = "cloud-simple-node.png"
+    _default_label = "Cloud Simple Node"
 
-class VirtualMachineClassic(_Compute):
-    _icon = "virtual-machine-classic.png"
-    _default_label = "Virtual Machine Classic"
+class CloudSimpleService(_Compute):
+    _icon = "cloud-simple-service.png"
+    _default_label = "Cloud Simple Service"
 
-class BlockchainConsortium(_Compute):
-    _icon = "blockchain-consortium.png"
-    _default_label = "Blockchain Consortium"
+class CloudSimpleVirtualMachine(_Compute):
+    _icon = "cloud-simple-virtual-machine.png"
+    _default_label = "Cloud Simple Virtual Machine"
 
-class VirtualMachineAvailabilitySet(_Compute):
-    _icon = "virtual-machine-availability-set.png"
-    _default_label = "Virtual Machine Availability Set"
+class CloudtestPool(_Compute):
+    _icon = "cloudtest-pool.png"
+    _default_label = "Cloudtest Pool"
 
-class ProximityPlacementGroup(_Compute):
-    _icon = "proximity-placement-group.png"
-    _default_label = "Proximity Placement Group"
+class ComputeAndApp(_Compute):
+    _icon = "compute-and-app.png"
+    _default_label = "Compute And App"
 
-class LabService(_Compute):
-    _icon = "lab-service.png"
-    _default_label = "Lab Service"
+class ContainerBatchAccount(_Compute):
+    _icon = "container-batch-account.png"
+    _default_label = "Container Batch Account"
 
-class VirtualMachineScaleSet(_Compute):
-    _icon = "virtual-machine-scale-set.png"
-    _default_label = "Virtual Machine Scale Set"
+class ContainerInstance(_Compute):
+    _icon = "container-instance.png"
+    _default_label = "Container Instance"
 
-class VirtualMachineNonAzureWindows(_Compute):
-    _icon = "virtual-machine-non-azure-windows.png"
-    _default_label = "Virtual Machine Non Azure Windows"
+class ContainerKubernetesService(_Compute):
+    _icon = "container-kubernetes-service.png"
+    _default_label = "Container Kubernetes Service"
 
-class WvdRdpProperty(_Compute):
-    _icon = "wvd-rdp-property.png"
-    _default_label = "Wvd Rdp Property"
+class ContainerRegistry(_Compute):
+    _icon = "container-registry.png"
+    _default_label = "Container Registry"
 
-class AzureStackCapacity(_Compute):
-    _icon = "azure-stack-capacity.png"
-    _default_label = "Azure Stack Capacity"
+class ContainerServiceFabricCluster(_Compute):
+    _icon = "container-service-fabric-cluster.png"
+    _default_label = "Container Service Fabric Cluster"
+
+class DevtestLab(_Compute):
+    _icon = "devtest-lab.png"
+    _default_label = "Devtest Lab"
 
 class FusionGroup(_Compute):
     _icon = "fusion-group.png"
     _default_label = "Fusion Group"
 
-class VirtualMachineImageVersion(_Compute):
-    _icon = "virtual-machine-image-version.png"
-    _default_label = "Virtual Machine Image Version"
+class HighAvailability(_Compute):
+    _icon = "high-availability.png"
+    _default_label = "High Availability"
 
-class Workspace(_Compute):
-    _icon = "workspace.png"
-    _default_label = "Workspace"
+class HostGroup(_Compute):
+    _icon = "host-group.png"
+    _default_label = "Host Group"
 
-class BlockchainStreaming(_Compute):
-    _icon = "blockchain-streaming.png"
-    _default_label = "Blockchain Streaming"
+class Host(_Compute):
+    _icon = "host.png"
+    _default_label = "Host"
+
+class InstancePool(_Compute):
+    _icon = "instance-pool.png"
+    _default_label = "Instance Pool"
+
+class LabService(_Compute):
+    _icon = "lab-service.png"
+    _default_label = "Lab Service"
+
+class ProximityPlacementGroup(_Compute):
+    _icon = "proximity-placement-group.png"
+    _default_label = "Proximity Placement Group"
 
 class Reservation(_Compute):
     _icon = "reservation.png"
     _default_label = "Reservation"
 
-class VirtualMachineNonAzureLinux(_Compute):
-    _icon = "virtual-machine-non-azure-linux.png"
-    _default_label = "Virtual Machine Non Azure Linux"
+class SharedImageGallery(_Compute):
+    _icon = "shared-image-gallery.png"
+    _default_label = "Shared Image Gallery"
 
-class VirtualMachineSql(_Compute):
-    _icon = "virtual-machine-sql.png"
-    _default_label = "Virtual Machine Sql"
+class VirtualCluster(_Compute):
+    _icon = "virtual-cluster.png"
+    _default_label = "Virtual Cluster"
 
-class BlockchainConnection(_Compute):
-    _icon = "blockchain-connection.png"
-    _default_label = "Blockchain Connection"
+class VirtualMachineAvailabilitySet(_Compute):
+    _icon = "virtual-machine-availability-set.png"
+    _default_label = "Virtual Machine Availability Set"
 
-class WindowsVirtualDesktop(_Compute):
-    _icon = "windows-virtual-desktop.png"
-    _default_label = "Windows Virtual Desktop"
+class VirtualMachineClassic(_Compute):
+    _icon = "virtual-machine-classic.png"
+    _default_label = "Virtual Machine Classic"
+
+class VirtualMachineImageClassic(_Compute):
+    _icon = "virtual-machine-image-classic.png"
+    _default_label = "Virtual Machine Image Classic"
 
 class VirtualMachineImageDefinition(_Compute):
     _icon = "virtual-machine-image-definition.png"
     _default_label = "Virtual Machine Image Definition"
 
-class WvdHostPool(_Compute):
-    _icon = "wvd-host-pool.png"
-    _default_label = "Wvd Host Pool"
-
-class VirtualMachineWindows(_Compute):
-    _icon = "virtual-machine-windows.png"
-    _default_label = "Virtual Machine Windows"
-
-class SharedImageGallery(_Compute):
-    _icon = "shared-image-gallery.png"
-    _default_label = "Shared Image Gallery"
+class VirtualMachineImageVersion(_Compute):
+    _icon = "virtual-machine-image-version.png"
+    _default_label = "Virtual Machine Image Version"
 
-class BlockchainAbsMember(_Compute):
-    _icon = "blockchain-abs-member.png"
-    _default_label = "Blockchain Abs Member"
+class VirtualMachineImage(_Compute):
+    _icon = "virtual-machine-image.png"
+    _default_label = "Virtual Machine Image"
 
 class VirtualMachineLinux(_Compute):
     _icon = "virtual-machine-linux.png"
     _default_label = "Virtual Machine Linux"
 
-class AzureStackMultiTenant(_Compute):
-    _icon = "azure-stack-multi-tenant.png"
-    _default_label = "Azure Stack Multi Tenant"
-
-class AzureBlockchainService(_Compute):
-    _icon = "azure-blockchain-service.png"
-    _default_label = "Azure Blockchain Service"
-
-class ContainerBatchAccount(_Compute):
-    _icon = "container-batch-account.png"
-    _default_label = "Container Batch Account"
-
-class BlockchainDevkit(_Compute):
-    _icon = "blockchain-devkit.png"
-    _default_label = "Blockchain Devkit"
-
-class CloudSimpleVirtualMachine(_Compute):
-    _icon = "cloud-simple-virtual-machine.png"
-    _default_label = "Cloud Simple Virtual Machine"
-
-class WvdTask(_Compute):
-    _icon = "wvd-task.png"
-    _default_label = "Wvd Task"
-
-class AzureSpringCloud(_Compute):
-    _icon = "azure-spring-cloud.png"
-    _default_label = "Azure Spring Cloud"
+class VirtualMachineNonAzureLinux(_Compute):
+    _icon = "virtual-machine-non-azure-linux.png"
+    _default_label = "Virtual Machine Non Azure Linux"
 
-class ContainerServiceFabricCluster(_Compute):
-    _icon = "container-service-fabric-cluster.png"
-    _default_label = "Container Service Fabric Cluster"
+class VirtualMachineNonAzureWindows(_Compute):
+    _icon = "virtual-machine-non-azure-windows.png"
+    _default_label = "Virtual Machine Non Azure Windows"
 
-class AzureStackUserSubscription(_Compute):
-    _icon = "azure-stack-user-subscription.png"
-    _default_label = "Azure Stack User Subscription"
+class VirtualMachineNonAzure(_Compute):
+    _icon = "virtual-machine-non-azure.png"
+    _default_label = "Virtual Machine Non Azure"
 
-class AzureVmwareSolution(_Compute):
-    _icon = "azure-vmware-solution.png"
-    _default_label = "Azure Vmware Solution"
+class VirtualMachineScaleSet(_Compute):
+    _icon = "virtual-machine-scale-set.png"
+    _default_label = "Virtual Machine Scale Set"
 
-class HighAvailability(_Compute):
-    _icon = "high-availability.png"
-    _default_label = "High Availability"
+class VirtualMachineSql(_Compute):
+    _icon = "virtual-machine-sql.png"
+    _default_label = "Virtual Machine Sql"
 
-class CloudSimpleService(_Compute):
-    _icon = "cloud-simple-service.png"
-    _default_label = "Cloud Simple Service"
+class VirtualMachineWindows(_Compute):
+    _icon = "virtual-machine-windows.png"
+    _default_label = "Virtual Machine Windows"
 
 class VirtualMachine(_Compute):
     _icon = "virtual-machine.png"
     _default_label = "Virtual Machine"
 
-class VirtualCluster(_Compute):
-    _icon = "virtual-cluster.png"
-    _default_label = "Virtual Cluster"
+class WindowsVirtualDesktop(_Compute):
+    _icon = "windows-virtual-desktop.png"
+    _default_label = "Windows Virtual Desktop"
 
-class AzureStackPlan(_Compute):
-    _icon = "azure-stack-plan.png"
-    _default_label = "Azure Stack Plan"
\ No newline at end of file
+class Workspace(_Compute):
+    _icon = "workspace.png"
+    _default_label = "Workspace"
+
+class WvdHostPool(_Compute):
+    _icon = "wvd-host-pool.png"
+    _default_label = "Wvd Host Pool"
+
+class WvdRdpProperty(_Compute):
+    _icon = "wvd-rdp-property.png"
+    _default_label = "Wvd Rdp Property"
+
+class WvdTask(_Compute):
+    _icon = "wvd-task.png"
+    _default_label = "Wvd Task"
\ No newline at end of file
@@ -6,186 +6,186 @@ class _Data(_Azure):
     _service_type = "data"
     _icon_dir = "icons/azure/data"
 
-class ManagedDatabase(_Data):
-    _icon = "managed-database.png"
-    _default_label = "Managed Database"
-
-class ElasticJobAgent(_Data):
-    _icon = "elastic-job-agent.png"
-    _default_label = "Elastic Job Agent"
-
-class DataAndStorage(_Data):
-    _icon = "data-and-storage.png"
-    _default_label = "Data And Storage"
-
-class DiskAccess(_Data):
-    _icon = "disk-access.png"
-    _default_label = "Disk Access"
-
-class TimeSeriesInsightsEnvironment(_Data):
-    _icon = "time-series-insights-environment.png"
-    _default_label = "Time Series Insights Environment"
+class AnalysisService(_Data):
+    _icon = "analysis-service.png"
+    _default_label = "Analysis Service"
 
-class DataLake(_Data):
-    _icon = "data-lake.png"
-    _default_label = "Data Lake"
+class AzureBatchAccount(_Data):
+    _icon = "azure-batch-account.png"
+    _default_label = "Azure Batch Account"
 
 class AzureBatch(_Data):
     _icon = "azure-batch.png"
     _default_label = "Azure Batch"
 
-class TimeSeriesInsightsReferenceDataSet(_Data):
-    _icon = "time-series-insights-reference-data-set.png"
-    _default_label = "Time Series Insights Reference Data Set"
-
-class SqlServerRegistry(_Data):
-    _icon = "sql-server-registry.png"
-    _default_label = "Sql Server Registry"
+class AzureCosmosDb(_Data):
+    _icon = "azure-cosmos-db.png"
+    _default_label = "Azure Cosmos Db"
 
 class AzureDataExplorerCluster(_Data):
     _icon = "azure-data-explorer-cluster.png"
     _default_label = "Azure Data Explorer Cluster"
 
-class AzureDatabaseForPostgresqlGroup(_Data):
-    _icon = "azure-database-for-postgresql-group.png"
-    _default_label = "Azure Database For Postgresql Group"
-
-class PurviewAccount(_Data):
-    _icon = "purview-account.png"
-    _default_label = "Purview Account"
+class AzureDatabaseForMariadb(_Data):
+    _icon = "azure-database-for-mariadb.png"
+    _default_label = "Azure Database For Mariadb"
 
 class AzureDatabaseForMysql(_Data):
     _icon = "azure-database-for-mysql.png"
     _default_label = "Azure Database For Mysql"
 
+class AzureDatabaseForPostgresqlGroup(_Data):
+    _icon = "azure-database-for-postgresql-group.png"
+    _default_label = "Azure Database For Postgresql Group"
+
 class AzureDatabaseForPostgresql(_Data):
     _icon = "azure-database-for-postgresql.png"
     _default_label = "Azure Database For Postgresql"
 
-class FileShare(_Data):
-    _icon = "file-share.png"
-    _default_label = "File Share"
-
-class DataLakeStorageGen1(_Data):
-    _icon = "data-lake-storage-gen1.png"
-    _default_label = "Data Lake Storage Gen1"
-
-class DataShareInvitation(_Data):
-    _icon = "data-share-invitation.png"
-    _default_label = "Data Share Invitation"
+class AzureDatabricks(_Data):
+    _icon = "azure-databricks.png"
+    _default_label = "Azure Databricks"
 
-class DataFactory(_Data):
-    _icon = "data-factory.png"
-    _default_label = "Data Factory"
+class AzureMediaServices(_Data):
+    _icon = "azure-media-services.png"
+    _default_label = "Azure Media Services"
 
 class AzureSynapseAnalyticsPrivateLinkHub(_Data):
     _icon = "azure-synapse-analytics-private-link-hub.png"
     _default_label = "Azure Synapse Analytics Private Link Hub"
 
-class HdinsightCluster(_Data):
-    _icon = "hdinsight-cluster.png"
-    _default_label = "Hdinsight Cluster"
+class AzureSynapseAnalytics(_Data):
+    _icon = "azure-synapse-analytics.png"
+    _default_label = "Azure Synapse Analytics"
+
+class DataAndStorage(_Data):
+    _icon = "data-and-storage.png"
+    _default_label = "Data And Storage"
+
+class DataFactory(_Data):
+    _icon = "data-factory.png"
+    _default_label = "Data Factory"
 
 class DataLakeAnalytics(_Data):
     _icon = "data-lake-analytics.png"
     _default_label = "Data Lake Analytics"
 
-class ServiceBusQueue(_Data):
-    _icon = "service-bus-queue.png"
-    _default_label = "Service Bus Queue"
+class DataLakeStorageGen1(_Data):
+    _icon = "data-lake-storage-gen1.png"
+    _default_label = "Data Lake Storage Gen1"
 
-class TimeSeriesInsightsEventSource(_Data):
-    _icon = "time-series-insights-event-source.png"
-    _default_label = "Time Series Insights Event Source"
+class DataLake(_Data):
+    _icon = "data-lake.png"
+    _default_label = "Data Lake"
 
-class AzureMediaServices(_Data):
-    _icon = "azure-media-services.png"
-    _default_label = "Azure Media Services"
+class DataShareInvitation(_Data):
+    _icon = "data-share-invitation.png"
+    _default_label = "Data Share Invitation"
 
-class SqlDatabase(_Data):
-    _icon = "sql-database.png"
-    _default_label = "Sql Database"
+class DataTransfer(_Data):
+    _icon = "data-transfer.png"
+    _default_label = "Data Transfer"
 
-class SapHanaOnAzure(_Data):
-    _icon = "sap-hana-on-azure.png"
-    _default_label = "Sap Hana On Azure"
+class DiskAccess(_Data):
+    _icon = "disk-access.png"
+    _default_label = "Disk Access"
 
-class SqlDataWarehouse(_Data):
-    _icon = "sql-data-warehouse.png"
-    _default_label = "Sql Data Warehouse"
+class ElasticJobAgent(_Data):
+    _icon = "elastic-job-agent.png"
+    _default_label = "Elastic Job Agent"
+
+class FileShare(_Data):
+    _icon = "file-share.png"
+    _default_label = "File Share"
+
+class HdinsightCluster(_Data):
+    _icon = "hdinsight-cluster.png"
+    _default_label = "Hdinsight Cluster"
 
 class HpcCache(_Data):
     _icon = "hpc-cache.png"
     _default_label = "Hpc Cache"
 
-class AzureBatchAccount(_Data):
-    _icon = "azure-batch-account.png"
-    _default_label = "Azure Batch Account"
-
-class AzureSynapseAnalytics(_Data):
-    _icon = "azure-synapse-analytics.png"
-    _default_label = "Azure Synapse Analytics"
-
 class ImportExportJob(_Data):
     _icon = "import-export-job.png"
     _default_label = "Import Export Job"
 
-class SqlDatabaseEdge(_Data):
-    _icon = "sql-database-edge.png"
-    _default_label = "Sql Database Edge"
-
-class SqlInstancePool(_Data):
-    _icon = "sql-instance-pool.png"
-    _default_label = "Sql Instance Pool"
-
-class ServiceBus(_Data):
-    _icon = "service-bus.png"
-    _default_label = "Service Bus"
+class ManagedDatabase(_Data):
+    _icon = "managed-database.png"
+    _default_label = "Managed Database"
 
-class StorsimpleDeviceManager(_Data):
-    _icon = "storsimple-device-manager.png"
-    _default_label = "Storsimple Device Manager"
+class OpenDataset(_Data):
+    _icon = "open-dataset.png"
+    _default_label = "Open Dataset"
 
-class SqlServer(_Data):
-    _icon = "sql-server.png"
-    _default_label = "Sql Server"
+class PurviewAccount(_Data):
+    _icon = "purview-account.png"
+    _default_label = "Purview Account"
 
-class SqlElasticPool(_Data):
-    _icon = "sql-elastic-pool.png"
-    _default_label = "Sql Elastic Pool"
+class SapHanaOnAzure(_Data):
+    _icon = "sap-hana-on-azure.png"
+    _default_label = "Sap Hana On Azure"
 
-class AzureDatabaseForMariadb(_Data):
-    _icon = "azure-database-for-mariadb.png"
-    _default_label = "Azure Database For Mariadb"
+class ServiceBusQueue(_Data):
+    _icon = "service-bus-queue.png"
+    _default_label = "Service Bus Queue"
 
 class ServiceBusTopic(_Data):
     _icon = "service-bus-topic.png"
     _default_label = "Service Bus Topic"
 
+class ServiceBus(_Data):
+    _icon = "service-bus.png"
+    _default_label = "Service Bus"
+
+class SqlDataWarehouse(_Data):
+    _icon = "sql-data-warehouse.png"
+    _default_label = "Sql Data Warehouse"
+
+class SqlDatabaseEdge(_Data):
+    _icon = "sql-database-edge.png"
+    _default_label = "Sql Database Edge"
+
+class SqlDatabase(_Data):
+    _icon = "sql-database.png"
+    _default_label = "Sql Database"
+
 class SqlElasticJobAgent(_Data):
     _icon = "sql-elastic-job-agent.png"
     _default_label = "Sql Elastic Job Agent"
 
-class AnalysisService(_Data):
-    _icon = "analysis-service.png"
-    _default_label = "Analysis Service"
+class SqlElasticPool(_Data):
+    _icon = "sql-elastic-pool.png"
+    _default_label = "Sql Elastic Pool"
 
-class AzureCosmosDb(_Data):
-    _icon = "azure-cosmos-db.png"
-    _default_label = "Azure Cosmos Db"
+class SqlInstancePool(_Data):
+    _icon = "sql-instance-pool.png"
+    _default_label = "Sql Instance Pool"
 
 class SqlManagedInstance(_Data):
     _icon = "sql-managed-instance.png"
     _default_label = "Sql Managed Instance"
 
-class OpenDataset(_Data):
-    _icon = "open-dataset.png"
-    _default_label = "Open Dataset"
+class SqlServerRegistry(_Data):
+    _icon = "sql-server-registry.png"
+    _default_label = "Sql Server Registry"
 
-class AzureDatabricks(_Data):
-    _icon = "azure-databricks.png"
-    _default_label = "Azure Databricks"
+class SqlServer(_Data):
+    _icon = "sql-server.png"
+    _default_label = "Sql Server"
 
-class DataTransfer(_Data):
-    _icon = "data-transfer.png"
-    _default_label = "Data Transfer"
\ No newline at end of file
+class StorsimpleDeviceManager(_Data):
+    _icon = "storsimple-device-manager.png"
+    _default_label = "Storsimple Device Manager"
+
+class TimeSeriesInsightsEnvironment(_Data):
+    _icon = "time-series-insights-environment.png"
+    _default_label = "Time Series Insights Environment"
+
+class TimeSeriesInsightsEventSource(_Data):
+    _icon = "time-series-insights-event-source.png"
+    _default_label = "Time Series Insights Event Source"
+
+class TimeSeriesInsightsReferenceDataSet(_Data):
+    _icon = "time-series-insights-reference-data-set.png"
+    _default_label = "Time Series Insights Reference Data Set"
\ No newline at end of file
@@ -6,37 +6,17 @@ class _Deployment(_Azure):
     _service_type = "deployment"
     _icon_dir = "icons/azure/deployment"
 
-class VisualStudio(_Deployment):
-    _icon = "visual-studio.png"
-    _default_label = "Visual Studio"
-
-class TemplateSpec(_Deployment):
-    _icon = "template-spec.png"
-    _default_label = "Template Spec"
-
-class DeploymentScript(_Deployment):
-    _icon = "deployment-script.png"
-    _default_label = "Deployment Script"
-
-class Controller(_Deployment):
-    _icon = "controller.png"
-    _default_label = "Controller"
-
-class Powershell(_Deployment):
-    _icon = "powershell.png"
-    _default_label = "Powershell"
-
 class ArmTemplate(_Deployment):
     _icon = "arm-template.png"
     _default_label = "Arm Template"
 
-class Python(_Deployment):
-    _icon = "python.png"
-    _default_label = "Python"
+class AzureArtifact(_Deployment):
+    _icon = "azure-artifact.png"
+    _default_label = "Azure Artifact"
 
-class Blueprint(_Deployment):
-    _icon = "blueprint.png"
-    _default_label = "Blueprint"
+class AzureBoard(_Deployment):
+    _icon = "azure-board.png"
+    _default_label = "Azure Board"
 
 class AzureDevOps(_Deployment):
     _icon = "azure-dev-ops.png"
@@ -46,66 +26,86 @@ class AzurePipelines(_Deployment):
     _icon = "azure-pipelines.png"
     _default_label = "Azure Pipelines"
 
-class Java(_Deployment):
-    _icon = "java.png"
-    _default_label = "Java"
+class AzureRepo(_Deployment):
+    _icon = "azure-repo.png"
+    _default_label = "Azure Repo"
 
-class OpenshiftCluster(_Deployment):
-    _icon = "openshift-cluster.png"
-    _default_label = "Openshift Cluster"
+class Blueprint(_Deployment):
+    _icon = "blueprint.png"
+    _default_label = "Blueprint"
 
-class ExportTemplate(_Deployment):
-    _icon = "export-template.png"
-    _default_label = "Export Template"
+class Controller(_Deployment):
+    _icon = "controller.png"
+    _default_label = "Controller"
 
-class NodeJs(_Deployment):
-    _icon = "node-js.png"
-    _default_label = "Node Js"
+class DeploymentScript(_Deployment):
+    _icon = "deployment-script.png"
+    _default_label = "Deployment Script"
 
-class AzureBoard(_Deployment):
-    _icon = "azure-board.png"
-    _default_label = "Azure Board"
+class Deployment(_Deployment):
+    _icon = "deployment.png"
+    _default_label = "Deployment"
 
-class AzureRepo(_Deployment):
-    _icon = "azure-repo.png"
-    _default_label = "Azure Repo"
+class DevopsStarter(_Deployment):
+    _icon = "devops-starter.png"
+    _default_label = "Devops Starter"
 
-class Rollout(_Deployment):
-    _icon = "rollout.png"
-    _default_label = "Rollout"
+class ExportTemplate(_Deployment):
+    _icon = "export-template.png"
+    _default_label = "Export Template"
 
 class IntegrationAccount(_Deployment):
     _icon = "integration-account.png"
     _default_label = "Integration Account"
 
+class Java(_Deployment):
+    _icon = "java.png"
+    _default_label = "Java"
+
 class Kafka(_Deployment):
     _icon = "kafka.png"
     _default_label = "Kafka"
 
-class Template(_Deployment):
-    _icon = "template.png"
-    _default_label = "Template"
+class NodeJs(_Deployment):
+    _icon = "node-js.png"
+    _default_label = "Node Js"
+
+class OpenshiftCluster(_Deployment):
+    _icon = "openshift-cluster.png"
+    _default_label = "Openshift Cluster"
+
+class Powershell(_Deployment):
+    _icon = "powershell.png"
+    _default_label = "Powershell"
+
+class Python(_Deployment):
+    _icon = "python.png"
+    _default_label = "Python"
 
 class Rest(_Deployment):
     _icon = "rest.png"
     _default_label = "Rest"
 
-class AzureArtifact(_Deployment):
-    _icon = "azure-artifact.png"
-    _default_label = "Azure Artifact"
+class Rollout(_Deployment):
+    _icon = "rollout.png"
+    _default_label = "Rollout"
 
-class DevopsStarter(_Deployment):
-    _icon = "devops-starter.png"
-    _default_label = "Devops Starter"
+class TemplateSpec(_Deployment):
+    _icon = "template-spec.png"
+    _default_label = "Template Spec"
+
+class Template(_Deployment):
+    _icon = "template.png"
+    _default_label = "Template"
+
+class Terraform(_Deployment):
+    _icon = "terraform.png"
+    _default_label = "Terraform"
 
 class VisualStudioCode(_Deployment):
     _icon = "visual-studio-code.png"
     _default_label = "Visual Studio Code"
 
-class Deployment(_Deployment):
-    _icon = "deployment.png"
-    _default_label = "Deployment"
-
-class Terraform(_Deployment):
-    _icon = "terraform.png"
-    _default_label = "Terraform"
\ No newline at end of file
+class VisualStudio(_Deployment):
+    _icon = "visual-studio.png"
+    _default_label = "Visual Studio"
\ No newline at end of file
@@ -6,22 +6,42 @@ class _Endpoint(_Azure):
     _service_type = "endpoint"
     _icon_dir = "icons/azure/endpoint"
 
-class IntuneExchangeAccess(_Endpoint):
-    _icon = "intune-exchange-access.png"
-    _default_label = "Intune Exchange Access"
-
 class AzureAttestation(_Endpoint):
     _icon = "azure-attestation.png"
     _default_label = "Azure Attestation"
 
-class UniversalPrintService(_Endpoint):
-    _icon = "universal-print-service.png"
-    _default_label = "Universal Print Service"
+class EndpointSecurity(_Endpoint):
+    _icon = "endpoint-security.png"
+    _default_label = "Endpoint Security"
+
+class IntuneAppProtection(_Endpoint):
+    _icon = "intune-app-protection.png"
+    _default_label = "Intune App Protection"
+
+class IntuneDeviceCompliance(_Endpoint):
+    _icon = "intune-device-compliance.png"
+    _default_label = "Intune Device Compliance"
+
+class IntuneDeviceConfiguration(_Endpoint):
+    _icon = "intune-device-configuration.png"
+    _default_label = "Intune Device Configuration"
 
 class IntuneDeviceEnrolment(_Endpoint):
     _icon = "intune-device-enrolment.png"
     _default_label = "Intune Device Enrolment"
 
+class IntuneDeviceSecurity(_Endpoint):
+    _icon = "intune-device-security.png"
+    _default_label = "Intune Device Security"
+
+class IntuneDevice(_Endpoint):
+    _icon = "intune-device.png"
+    _default_label = "Intune Device"
+
+class IntuneExchangeAccess(_Endpoint):
+    _icon = "intune-exchange-access.png"
+    _default_label = "Intune Exchange Access"
+
 class IntuneExchangeOnPremisesAccess(_Endpoint):
     _icon = "intune-exchange-on-premises-access.png"
     _default_label = "Intune Exchange On Premises Access"
@@ -30,50 +50,30 @@ class IntuneManagedDesktop(_Endpoint):
     _icon = "intune-managed-desktop.png"
     _default_label = "Intune Managed Desktop"
 
-class IntuneDeviceConfiguration(_Endpoint):
-    _icon = "intune-device-configuration.png"
-    _default_label = "Intune Device Configuration"
-
-class EndpointSecurity(_Endpoint):
-    _icon = "endpoint-security.png"
-    _default_label = "Endpoint Security"
-
-class MobileApplication(_Endpoint):
-    _icon = "mobile-application.png"
-    _default_label = "Mobile Application"
-
-class IntuneTenantStatus(_Endpoint):
-    _icon = "intune-tenant-status.png"
-    _default_label = "Intune Tenant Status"
-
-class IntuneDeviceSecurity(_Endpoint):
-    _icon = "intune-device-security.png"
-    _default_label = "Intune Device Security"
-
-class IntuneDeviceCompliance(_Endpoint):
-    _icon = "intune-device-compliance.png"
-    _default_label = "Intune Device Compliance"
+class IntuneSecurityBaseline(_Endpoint):
+    _icon = "intune-security-baseline.png"
+    _default_label = "Intune Security Baseline"
 
 class IntuneSoftwareUpdate(_Endpoint):
     _icon = "intune-software-update.png"
     _default_label = "Intune Software Update"
 
-class MobilityMdmAndMam(_Endpoint):
-    _icon = "mobility-mdm-and-mam.png"
-    _default_label = "Mobility Mdm And Mam"
+class IntuneTenantStatus(_Endpoint):
+    _icon = "intune-tenant-status.png"
+    _default_label = "Intune Tenant Status"
 
 class Intune(_Endpoint):
     _icon = "intune.png"
     _default_label = "Intune"
 
-class IntuneAppProtection(_Endpoint):
-    _icon = "intune-app-protection.png"
-    _default_label = "Intune App Protection"
+class MobileApplication(_Endpoint):
+    _icon = "mobile-application.png"
+    _default_label = "Mobile Application"
 
-class IntuneDevice(_Endpoint):
-    _icon = "intune-device.png"
-    _default_label = "Intune Device"
+class MobilityMdmAndMam(_Endpoint):
+    _icon = "mobility-mdm-and-mam.png"
+    _default_label = "Mobility Mdm And Mam"
 
-class IntuneSecurityBaseline(_Endpoint):
-    _icon = "intune-security-baseline.png"
-    _default_label = "Intune Security Baseline"
\ No newline at end of file
+class UniversalPrintService(_Endpoint):
+    _icon = "universal-print-service.png"
+    _default_label = "Universal Print Service"
\ No newline at end of file
@@ -6,97 +6,101 @@ class _General(_Azure):
     _service_type = "general"
     _icon_dir = "icons/azure/general"
 
-class TenantStatus(_General):
-    _icon = "tenant-status.png"
-    _default_label = "Tenant Status"
+class AllResources(_General):
+    _icon = "all-resources.png"
+    _default_label = "All Resources"
 
-class Internet(_General):
-    _icon = "internet.png"
-    _default_label = "Internet"
+class AzureBestPractices(_General):
+    _icon = "azure-best-practices.png"
+    _default_label = "Azure Best Practices"
 
-class QuickstartCenter(_General):
-    _icon = "quickstart-center.png"
-    _default_label = "Quickstart Center"
+class Azure(_General):
+    _icon = "azure.png"
+    _default_label = "Azure"
 
-class ResourceExplorer(_General):
-    _icon = "resource-explorer.png"
-    _default_label = "Resource Explorer"
+class CompanyBranding(_General):
+    _icon = "company-branding.png"
+    _default_label = "Company Branding"
 
-class HelpAndSupport(_General):
-    _icon = "help-and-support.png"
-    _default_label = "Help And Support"
+class Computer(_General):
+    _icon = "computer.png"
+    _default_label = "Computer"
 
-class ResourceGraphExplorer(_General):
-    _icon = "resource-graph-explorer.png"
-    _default_label = "Resource Graph Explorer"
+class Configuration(_General):
+    _icon = "configuration.png"
+    _default_label = "Configuration"
 
-class PreviewFeature(_General):
-    _icon = "preview-feature.png"
-    _default_label = "Preview Feature"
+class CustomerLockboxForMicrosoftAzure(_General):
+    _icon = "customer-lockbox-for-microsoft-azure.png"
+    _default_label = "Customer Lockbox For Microsoft Azure"
 
 class Ebook(_General):
     _icon = "ebook.png"
     _default_label = "Ebook"
 
-class VirtualAssistant(_General):
-    _icon = "virtual-assistant.png"
-    _default_label = "Virtual Assistant"
+class Education(_General):
+    _icon = "education.png"
+    _default_label = "Education"
 
 class FreeServices(_General):
     _icon = "free-services.png"
     _default_label = "Free Services"
 
-class Recent(_General):
-    _icon = "recent.png"
-    _default_label = "Recent"
-
-class AzureBestPractices(_General):
-    _icon = "azure-best-practices.png"
-    _default_label = "Azure Best Practices"
+class HelpAndSupport(_General):
+    _icon = "help-and-support.png"
+    _default_label = "Help And Support"
 
-class ResourceGraphQuery(_General):
-    _icon = "resource-graph-query.png"
-    _default_label = "Resource Graph Query"
+class Internet(_General):
+    _icon = "internet.png"
+    _default_label = "Internet"
 
-class Configuration(_General):
-    _icon = "configuration.png"
-    _default_label = "Configuration"
+class License(_General):
+    _icon = "license.png"
+    _default_label = "License"
 
 class MaintenanceConfiguration(_General):
     _icon = "maintenance-configuration.png"
     _default_label = "Maintenance Configuration"
 
+class Marketplace(_General):
+    _icon = "marketplace.png"
+    _default_label = "Marketplace"
+
 class OperationalExcellence(_General):
     _icon = "operational-excellence.png"
     _default_label = "Operational Excellence"
 
-class ServiceHealth(_General):
-    _icon = "service-health.png"
-    _default_label = "Service Health"
-
-class SoftwareAsAService(_General):
-    _icon = "software-as-a-service.png"
-    _default_label = "Software As A Service"
+class PlatformService(_General):
+    _icon = "platform-service.png"
+    _default_label = "Platform Service"
 
-class CustomerLockboxForMicrosoftAzure(_General):
-    _icon = "customer-lockbox-for-microsoft-azure.png"
-    _default_label = "Customer Lockbox For Microsoft Azure"
+class PreviewFeature(_General):
+    _icon = "preview-feature.png"
+    _default_label = "Preview Feature"
 
 class Property(_General):
     _icon = "property.png"
     _default_label = "Property"
 
-class License(_General):
-    _icon = "license.png"
-    _default_label = "License"
+class QuickstartCenter(_General):
+    _icon = "quickstart-center.png"
+    _default_label = "Quickstart Center"
 
-class PlatformService(_General):
-    _icon = "platform-service.png"
-    _default_label = "Platform Service"
+class Recent(_General):
+    _icon = "recent.png"
+    _default_label = "Recent"
 
-class Marketplace(_General):
-    _icon = "marketplace.png"
-    _default_label = "Marketplace"
+class ResourceExplorer(_General):
+    _icon = "resource-explorer.png"
+    _default_label = "Resource Explorer"
+
+class ResourceGraphExplorer(_General):
+    _icon = "resource-graph-explorer.png"
+    _default_label = "Resource Graph Explorer"
+
+class ResourceGraphQuery(_General):
+    _icon = "resource-graph-query.png"
+    _default_label = "Resource Graph Query"
 
 class ResourceHealth(_General):
     _icon = "resource-health.png"
@@ -106,26 +110,22 @@ class ServiceCatalogManagedApplicationDefinition(_General):
     _icon = "service-catalog-managed-application-definition.png"
     _default_label = "Service Catalog Managed Application Definition"
 
-class Computer(_General):
-    _icon = "computer.png"
-    _default_label = "Computer"
-
-class AllResources(_General):
-    _icon = "all-resources.png"
-    _default_label = "All Resources"
+class ServiceHealth(_General):
+    _icon = "service-health.png"
+    _default_label = "Service Health"
 
-class Education(_General):
-    _icon = "education.png"
-    _default_label = "Education"
+class SoftwareAsAService(_General):
+    _icon = "software-as-a-service.png"
+    _default_label = "Software As A Service"
 
-class Azure(_General):
-    _icon = "azure.png"
-    _default_label = "Azure"
+class TenantStatus(_General):
+    _icon = "tenant-status.png"
+    _default_label = "Tenant Status"
 
 class UserPrivacy(_General):
     _icon = "user-privacy.png"
     _default_label = "User Privacy"
 
-class CompanyBranding(_General):
-    _icon = "company-branding.png"
-    _default_label = "Company Branding"
\ No newline at end of file
+class VirtualAssistant(_General):
+    _icon = "virtual-assistant.png"
+    _default_label = "Virtual Assistant"
\ No newline at end of file
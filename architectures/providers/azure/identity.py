@@ -6,102 +6,102 @@ class _Identity(_Azure):
     _service_type = "identity"
     _icon_dir = "icons/azure/identity"
 
-class AzureActiveDirectoryGroup(_Identity):
-    _icon = "azure-active-directory-group.png"
-    _default_label = "Azure Active Directory Group"
+class AdfsProxy(_Identity):
+    _icon = "adfs-proxy.png"
+    _default_label = "Adfs Proxy"
+
+class Adfs(_Identity):
+    _icon = "adfs.png"
+    _default_label = "Adfs"
+
+class AzureActiveDirectoryAuthenticationMethod(_Identity):
+    _icon = "azure-active-directory-authentication-method.png"
+    _default_label = "Azure Active Directory Authentication Method"
+
+class AzureActiveDirectoryB2B(_Identity):
+    _icon = "azure-active-directory-b2b.png"
+    _default_label = "Azure Active Directory B2B"
+
+class AzureActiveDirectoryB2C(_Identity):
+    _icon = "azure-active-directory-b2c.png"
+    _default_label = "Azure Active Directory B2C"
 
 class AzureActiveDirectoryConnectHealth(_Identity):
     _icon = "azure-active-directory-connect-health.png"
     _default_label = "Azure Active Directory Connect Health"
 
-class ExternalIdentitiy(_Identity):
-    _icon = "external-identitiy.png"
-    _default_label = "External Identitiy"
+class AzureActiveDirectoryDomainServices(_Identity):
+    _icon = "azure-active-directory-domain-services.png"
+    _default_label = "Azure Active Directory Domain Services"
 
-class AzureActiveDirectoryRiskySignIn(_Identity):
-    _icon = "azure-active-directory-risky-sign-in.png"
-    _default_label = "Azure Active Directory Risky Sign In"
+class AzureActiveDirectoryGroup(_Identity):
+    _icon = "azure-active-directory-group.png"
+    _default_label = "Azure Active Directory Group"
 
-class AzureActiveDirectoryAuthenticationMethod(_Identity):
-    _icon = "azure-active-directory-authentication-method.png"
-    _default_label = "Azure Active Directory Authentication Method"
+class AzureActiveDirectoryIdentityProtection(_Identity):
+    _icon = "azure-active-directory-identity-protection.png"
+    _default_label = "Azure Active Directory Identity Protection"
 
 class AzureActiveDirectoryIdentitySecureScore(_Identity):
     _icon = "azure-active-directory-identity-secure-score.png"
     _default_label = "Azure Active Directory Identity Secure Score"
 
-class AzureActiveDirectoryUser(_Identity):
-    _icon = "azure-active-directory-user.png"
-    _default_label = "Azure Active Directory User"
+class AzureActiveDirectoryPrivilegedIdentityManagement(_Identity):
+    _icon = "azure-active-directory-privileged-identity-management.png"
+    _default_label = "Azure Active Directory Privileged Identity Management"
 
-class IdentityAndAccess(_Identity):
-    _icon = "identity-and-access.png"
-    _default_label = "Identity And Access"
+class AzureActiveDirectoryRiskDetection(_Identity):
+    _icon = "azure-active-directory-risk-detection.png"
+    _default_label = "Azure Active Directory Risk Detection"
 
-class Adfs(_Identity):
-    _icon = "adfs.png"
-    _default_label = "Adfs"
+class AzureActiveDirectoryRiskySignIn(_Identity):
+    _icon = "azure-active-directory-risky-sign-in.png"
+    _default_label = "Azure Active Directory Risky Sign In"
 
-class AdfsProxy(_Identity):
-    _icon = "adfs-proxy.png"
-    _default_label = "Adfs Proxy"
+class AzureActiveDirectoryRiskyUser(_Identity):
+    _icon = "azure-active-directory-risky-user.png"
+    _default_label = "Azure Active Directory Risky User"
 
 class AzureActiveDirectorySecurity(_Identity):
     _icon = "azure-active-directory-security.png"
     _default_label = "Azure Active Directory Security"
 
-class OrganisationalRelationship(_Identity):
-    _icon = "organisational-relationship.png"
-    _default_label = "Organisational Relationship"
-
-class AzureActiveDirectoryIdentityProtection(_Identity):
-    _icon = "azure-active-directory-identity-protection.png"
-    _default_label = "Azure Active Directory Identity Protection"
+class AzureActiveDirectoryUser(_Identity):
+    _icon = "azure-active-directory-user.png"
+    _default_label = "Azure Active Directory User"
 
 class AzureActiveDirectory(_Identity):
     _icon = "azure-active-directory.png"
     _default_label = "Azure Active Directory"
 
-class IdentityGovernance(_Identity):
-    _icon = "identity-governance.png"
-    _default_label = "Identity Governance"
-
-class AzureActiveDirectoryRiskyUser(_Identity):
-    _icon = "azure-active-directory-risky-user.png"
-    _default_label = "Azure Active Directory Risky User"
-
-class AzureActiveDirectoryPrivilegedIdentityManagement(_Identity):
-    _icon = "azure-active-directory-privileged-identity-management.png"
-    _default_label = "Azure Active Directory Privileged Identity Management"
-
-class WorkAccount(_Identity):
-    _icon = "work-account.png"
-    _default_label = "Work Account"
-
 class DomainController(_Identity):
     _icon = "domain-controller.png"
     _default_label = "Domain Controller"
 
-class AzureActiveDirectoryDomainServices(_Identity):
-    _icon = "azure-active-directory-domain-services.png"
-    _default_label = "Azure Active Directory Domain Services"
+class ExternalIdentitiy(_Identity):
+    _icon = "external-identitiy.png"
+    _default_label = "External Identitiy"
 
-class AzureActiveDirectoryB2B(_Identity):
-    _icon = "azure-active-directory-b2b.png"
-    _default_label = "Azure Active Directory B2B"
+class IdentityAndAccess(_Identity):
+    _icon = "identity-and-access.png"
+    _default_label = "Identity And Access"
 
-class AzureActiveDirectoryRiskDetection(_Identity):
-    _icon = "azure-active-directory-risk-detection.png"
-    _default_label = "Azure Active Directory Risk Detection"
+class IdentityGovernance(_Identity):
+    _icon = "identity-governance.png"
+    _default_label = "Identity Governance"
+
+class ManagedIdentity(_Identity):
+    _icon = "managed-identity.png"
+    _default_label = "Managed Identity"
 
 class MicrosoftAccount(_Identity):
     _icon = "microsoft-account.png"
     _default_label = "Microsoft Account"
 
-class AzureActiveDirectoryB2C(_Identity):
-    _icon = "azure-active-directory-b2c.png"
-    _default_label = "Azure Active Directory B2C"
+class OrganisationalRelationship(_Identity):
+    _icon = "organisational-relationship.png"
+    _default_label = "Organisational Relationship"
 
-class ManagedIdentity(_Identity):
-    _icon = "managed-identity.png"
-    _default_label = "Managed Identity"
\ No newline at end of file
+class WorkAccount(_Identity):
+    _icon = "work-account.png"
+    _default_label = "Work Account"
\ No newline at end of file
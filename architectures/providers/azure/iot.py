@@ -6,46 +6,46 @@ class _Iot(_Azure):
     _service_type = "iot"
     _icon_dir = "icons/azure/iot"
 
-class IotHub(_Iot):
-    _icon = "iot-hub.png"
-    _default_label = "Iot Hub"
+class IotCentral(_Iot):
+    _icon = "iot-central.png"
+    _default_label = "Iot Central"
 
-class IotEdge(_Iot):
-    _icon = "iot-edge.png"
-    _default_label = "Iot Edge"
+class IotDefender(_Iot):
+    _icon = "iot-defender.png"
+    _default_label = "Iot Defender"
 
 class IotDeviceProvisioningService(_Iot):
     _icon = "iot-device-provisioning-service.png"
     _default_label = "Iot Device Provisioning Service"
 
-class IotWindows10Core(_Iot):
-    _icon = "iot-windows-10-core.png"
-    _default_label = "Iot Windows 10 Core"
-
-class IotSphere(_Iot):
-    _icon = "iot-sphere.png"
-    _default_label = "Iot Sphere"
-
-class IotDefender(_Iot):
-    _icon = "iot-defender.png"
-    _default_label = "Iot Defender"
-
 class IotDigitalTwin(_Iot):
     _icon = "iot-digital-twin.png"
     _default_label = "Iot Digital Twin"
 
+class IotEdgeDevice(_Iot):
+    _icon = "iot-edge-device.png"
+    _default_label = "Iot Edge Device"
+
+class IotEdge(_Iot):
+    _icon = "iot-edge.png"
+    _default_label = "Iot Edge"
+
 class IotHubSecurity(_Iot):
     _icon = "iot-hub-security.png"
     _default_label = "Iot Hub Security"
 
+class IotHub(_Iot):
+    _icon = "iot-hub.png"
+    _default_label = "Iot Hub"
+
 class IotSolutionAccelerator(_Iot):
     _icon = "iot-solution-accelerator.png"
     _default_label = "Iot Solution Accelerator"
 
-class IotEdgeDevice(_Iot):
-    _icon = "iot-edge-device.png"
-    _default_label = "Iot Edge Device"
+class IotSphere(_Iot):
+    _icon = "iot-sphere.png"
+    _default_label = "Iot Sphere"
 
-class IotCentral(_Iot):
-    _icon = "iot-central.png"
-    _default_label = "Iot Central"
\ No newline at end of file
+class IotWindows10Core(_Iot):
+    _icon = "iot-windows-10-core.png"
+    _default_label = "Iot Windows 10 Core"
\ No newline at end of file
@@ -6,177 +6,189 @@ class _Management(_Azure):
     _service_type = "management"
     _icon_dir = "icons/azure/management"
 
-class CostManagement(_Management):
-    _icon = "cost-management.png"
-    _default_label = "Cost Management"
+class Alert(_Management):
+    _icon = "alert.png"
+    _default_label = "Alert"
 
-class Subscription(_Management):
-    _icon = "subscription.png"
-    _default_label = "Subscription"
+class ApiManagementService(_Management):
+    _icon = "api-management-service.png"
+    _default_label = "Api Management Service"
 
-class PerformanceDiagnostics(_Management):
-    _icon = "performance-diagnostics.png"
-    _default_label = "Performance Diagnostics"
+class ApplicationChangeAnalysis(_Management):
+    _icon = "application-change-analysis.png"
+    _default_label = "Application Change Analysis"
 
-class CostAnalysis(_Management):
-    _icon = "cost-analysis.png"
-    _default_label = "Cost Analysis"
+class ApplicationInsights(_Management):
+    _icon = "application-insights.png"
+    _default_label = "Application Insights"
 
-class VirtualMachineBestPractices(_Management):
-    _icon = "virtual-machine-best-practices.png"
-    _default_label = "Virtual Machine Best Practices"
+class AutomationAccount(_Management):
+    _icon = "automation-account.png"
+    _default_label = "Automation Account"
 
-class Event(_Management):
-    _icon = "event.png"
-    _default_label = "Event"
+class AzureAdvisor(_Management):
+    _icon = "azure-advisor.png"
+    _default_label = "Azure Advisor"
 
-class Compliance(_Management):
-    _icon = "compliance.png"
-    _default_label = "Compliance"
+class AzureArcDataController(_Management):
+    _icon = "azure-arc-data-controller.png"
+    _default_label = "Azure Arc Data Controller"
 
-class AzureLighthouseProtection(_Management):
-    _icon = "azure-lighthouse-protection.png"
-    _default_label = "Azure Lighthouse Protection"
+class AzureArcKubernetes(_Management):
+    _icon = "azure-arc-kubernetes.png"
+    _default_label = "Azure Arc Kubernetes"
 
-class ConditionalAccess(_Management):
-    _icon = "conditional-access.png"
-    _default_label = "Conditional Access"
+class AzureArcMachine(_Management):
+    _icon = "azure-arc-machine.png"
+    _default_label = "Azure Arc Machine"
 
-class AzureLighthouseMyCustomers(_Management):
-    _icon = "azure-lighthouse-my-customers.png"
-    _default_label = "Azure Lighthouse My Customers"
+class AzureArcPostgresqlServerGroup(_Management):
+    _icon = "azure-arc-postgresql-server-group.png"
+    _default_label = "Azure Arc Postgresql Server Group"
 
-class AzureLighthouseServiceProvider(_Management):
-    _icon = "azure-lighthouse-service-provider.png"
-    _default_label = "Azure Lighthouse Service Provider"
+class AzureArcService(_Management):
+    _icon = "azure-arc-service.png"
+    _default_label = "Azure Arc Service"
 
-class UsageAndQuota(_Management):
-    _icon = "usage-and-quota.png"
-    _default_label = "Usage And Quota"
+class AzureArcSqlServer(_Management):
+    _icon = "azure-arc-sql-server.png"
+    _default_label = "Azure Arc Sql Server"
 
 class AzureAutomationRunbook(_Management):
     _icon = "azure-automation-runbook.png"
     _default_label = "Azure Automation Runbook"
 
-class AzureArcPostgresqlServerGroup(_Management):
-    _icon = "azure-arc-postgresql-server-group.png"
-    _default_label = "Azure Arc Postgresql Server Group"
+class AzureCli(_Management):
+    _icon = "azure-cli.png"
+    _default_label = "Azure Cli"
+
+class AzureLighthouseManagement(_Management):
+    _icon = "azure-lighthouse-management.png"
+    _default_label = "Azure Lighthouse Management"
 
 class AzureLighthouseMyAuditHistory(_Management):
     _icon = "azure-lighthouse-my-audit-history.png"
     _default_label = "Azure Lighthouse My Audit History"
 
-class Workbook(_Management):
-    _icon = "workbook.png"
-    _default_label = "Workbook"
-
-class AzureArcKubernetes(_Management):
-    _icon = "azure-arc-kubernetes.png"
-    _default_label = "Azure Arc Kubernetes"
-
-class CostAlert(_Management):
-    _icon = "cost-alert.png"
-    _default_label = "Cost Alert"
+class AzureLighthouseMyCustomers(_Management):
+    _icon = "azure-lighthouse-my-customers.png"
+    _default_label = "Azure Lighthouse My Customers"
 
 class AzureLighthouseMyPermission(_Management):
     _icon = "azure-lighthouse-my-permission.png"
     _default_label = "Azure Lighthouse My Permission"
 
+class AzureLighthouseMyRequest(_Management):
+    _icon = "azure-lighthouse-my-request.png"
+    _default_label = "Azure Lighthouse My Request"
+
+class AzureLighthouseMyRole(_Management):
+    _icon = "azure-lighthouse-my-role.png"
+    _default_label = "Azure Lighthouse My Role"
+
 class AzureLighthouseProjection(_Management):
     _icon = "azure-lighthouse-projection.png"
     _default_label = "Azure Lighthouse Projection"
 
-class ResourceGroup(_Management):
-    _icon = "resource-group.png"
-    _default_label = "Resource Group"
+class AzureLighthouseProtection(_Management):
+    _icon = "azure-lighthouse-protection.png"
+    _default_label = "Azure Lighthouse Protection"
 
-class AzureArcService(_Management):
-    _icon = "azure-arc-service.png"
-    _default_label = "Azure Arc Service"
+class AzureLighthouseRbac(_Management):
+    _icon = "azure-lighthouse-rbac.png"
+    _default_label = "Azure Lighthouse Rbac"
 
-class RecoveryServices(_Management):
-    _icon = "recovery-services.png"
-    _default_label = "Recovery Services"
+class AzureLighthouseServiceProvider(_Management):
+    _icon = "azure-lighthouse-service-provider.png"
+    _default_label = "Azure Lighthouse Service Provider"
 
-class SharedDashboard(_Management):
-    _icon = "shared-dashboard.png"
-    _default_label = "Shared Dashboard"
+class AzureLighthouse(_Management):
+    _icon = "azure-lighthouse.png"
+    _default_label = "Azure Lighthouse"
 
-class Policy(_Management):
-    _icon = "policy.png"
-    _default_label = "Policy"
+class AzureMigrate(_Management):
+    _icon = "azure-migrate.png"
+    _default_label = "Azure Migrate"
 
-class ReviewAccess(_Management):
-    _icon = "review-access.png"
-    _default_label = "Review Access"
+class AzureMonitorForSapSolution(_Management):
+    _icon = "azure-monitor-for-sap-solution.png"
+    _default_label = "Azure Monitor For Sap Solution"
 
-class WorkflowAutomation(_Management):
-    _icon = "workflow-automation.png"
-    _default_label = "Workflow Automation"
+class AzureMonitorPrivateLinkScope(_Management):
+    _icon = "azure-monitor-private-link-scope.png"
+    _default_label = "Azure Monitor Private Link Scope"
 
 class AzureMonitor(_Management):
     _icon = "azure-monitor.png"
     _default_label = "Azure Monitor"
 
-class LogAnalyticsWorkspace(_Management):
-    _icon = "log-analytics-workspace.png"
-    _default_label = "Log Analytics Workspace"
+class AzureResourceMover(_Management):
+    _icon = "azure-resource-mover.png"
+    _default_label = "Azure Resource Mover"
 
 class AzureRoleBasedAccessControl(_Management):
     _icon = "azure-role-based-access-control.png"
     _default_label = "Azure Role Based Access Control"
 
-class Metric(_Management):
-    _icon = "metric.png"
-    _default_label = "Metric"
-
-class ApplicationChangeAnalysis(_Management):
-    _icon = "application-change-analysis.png"
-    _default_label = "Application Change Analysis"
-
 class AzureTestPlan(_Management):
     _icon = "azure-test-plan.png"
     _default_label = "Azure Test Plan"
 
-class Tag(_Management):
-    _icon = "tag.png"
-    _default_label = "Tag"
-
 class AzureWorkbook(_Management):
     _icon = "azure-workbook.png"
     _default_label = "Azure Workbook"
 
-class SchedulerJobCollection(_Management):
-    _icon = "scheduler-job-collection.png"
-    _default_label = "Scheduler Job Collection"
+class BackupCenter(_Management):
+    _icon = "backup-center.png"
+    _default_label = "Backup Center"
 
-class AzureMonitorForSapSolution(_Management):
-    _icon = "azure-monitor-for-sap-solution.png"
-    _default_label = "Azure Monitor For Sap Solution"
+class BackupVault(_Management):
+    _icon = "backup-vault.png"
+    _default_label = "Backup Vault"
 
-class ManagementCertificate(_Management):
-    _icon = "management-certificate.png"
-    _default_label = "Management Certificate"
+class Budget(_Management):
+    _icon = "budget.png"
+    _default_label = "Budget"
 
-class Alert(_Management):
-    _icon = "alert.png"
-    _default_label = "Alert"
+class Compliance(_Management):
+    _icon = "compliance.png"
+    _default_label = "Compliance"
 
-class UpdateManagement(_Management):
-    _icon = "update-management.png"
-    _default_label = "Update Management"
+class ConditionalAccess(_Management):
+    _icon = "conditional-access.png"
+    _default_label = "Conditional Access"
 
-class RunCommand(_Management):
-    _icon = "run-command.png"
-    _default_label = "Run Command"
+class ConfigurationManagement(_Management):
+    _icon = "configuration-management.png"
+    _default_label = "Configuration Management"
 
-class ResourceLock(_Management):
-    _icon = "resource-lock.png"
-    _default_label = "Resource Lock"
+class ConnectionMonitor(_Management):
+    _icon = "connection-monitor.png"
+    _default_label = "Connection Monitor"
 
-class Role(_Management):
-    _icon = "role.png"
-    _default_label = "Role"
+class CostAlert(_Management):
+    _icon = "cost-alert.png"
+    _default_label = "Cost Alert"
+
+class CostAnalysis(_Management):
+    _icon = "cost-analysis.png"
+    _default_label = "Cost Analysis"
+
+class CostManagementAndBilling(_Management):
+    _icon = "cost-management-and-billing.png"
+    _default_label = "Cost Management And Billing"
+
+class CostManagement(_Management):
+    _icon = "cost-management.png"
+    _default_label = "Cost Management"
+
+class Cost(_Management):
+    _icon = "cost.png"
+    _default_label = "Cost"
+
+class DatabaseMigrationProject(_Management):
+    _icon = "database-migration-project.png"
+    _default_label = "Database Migration Project"
 
 class DatabaseMigrationService(_Management):
     _icon = "database-migration-service.png"
@@ -186,162 +198,150 @@ class DiagnosticsSetting(_Management):
     _icon = "diagnostics-setting.png"
     _default_label = "Diagnostics Setting"
 
-class AzureResourceMover(_Management):
-    _icon = "azure-resource-mover.png"
-    _default_label = "Azure Resource Mover"
-
-class RecoveryServicesBackupInfrastructure(_Management):
-    _icon = "recovery-services-backup-infrastructure.png"
-    _default_label = "Recovery Services Backup Infrastructure"
-
-class AzureMonitorPrivateLinkScope(_Management):
-    _icon = "azure-monitor-private-link-scope.png"
-    _default_label = "Azure Monitor Private Link Scope"
-
-class RecoveryServicesPlan(_Management):
-    _icon = "recovery-services-plan.png"
-    _default_label = "Recovery Services Plan"
-
-class AzureArcMachine(_Management):
-    _icon = "azure-arc-machine.png"
-    _default_label = "Azure Arc Machine"
+class Event(_Management):
+    _icon = "event.png"
+    _default_label = "Event"
 
-class Playbook(_Management):
-    _icon = "playbook.png"
-    _default_label = "Playbook"
+class Extension(_Management):
+    _icon = "extension.png"
+    _default_label = "Extension"
 
-class Monitor(_Management):
-    _icon = "monitor.png"
-    _default_label = "Monitor"
+class LogAnalyticsQueryPack(_Management):
+    _icon = "log-analytics-query-pack.png"
+    _default_label = "Log Analytics Query Pack"
 
-class RecoveryServicesAlert(_Management):
-    _icon = "recovery-services-alert.png"
-    _default_label = "Recovery Services Alert"
+class LogAnalyticsSolution(_Management):
+    _icon = "log-analytics-solution.png"
+    _default_label = "Log Analytics Solution"
 
-class RecoveryServicesVault(_Management):
-    _icon = "recovery-services-vault.png"
-    _default_label = "Recovery Services Vault"
+class LogAnalyticsWorkspace(_Management):
+    _icon = "log-analytics-workspace.png"
+    _default_label = "Log Analytics Workspace"
 
-class ApplicationInsights(_Management):
-    _icon = "application-insights.png"
-    _default_label = "Application Insights"
+class ManagementCertificate(_Management):
+    _icon = "management-certificate.png"
+    _default_label = "Management Certificate"
 
 class ManagementGroup(_Management):
     _icon = "management-group.png"
     _default_label = "Management Group"
 
-class AzureLighthouse(_Management):
-    _icon = "azure-lighthouse.png"
-    _default_label = "Azure Lighthouse"
-
-class CostManagementAndBilling(_Management):
-    _icon = "cost-management-and-billing.png"
-    _default_label = "Cost Management And Billing"
-
-class SignIn(_Management):
-    _icon = "sign-in.png"
-    _default_label = "Sign In"
-
-class BackupVault(_Management):
-    _icon = "backup-vault.png"
-    _default_label = "Backup Vault"
+class Metric(_Management):
+    _icon = "metric.png"
+    _default_label = "Metric"
 
-class AzureCli(_Management):
-    _icon = "azure-cli.png"
-    _default_label = "Azure Cli"
+class Monitor(_Management):
+    _icon = "monitor.png"
+    _default_label = "Monitor"
 
-class AzureLighthouseRbac(_Management):
-    _icon = "azure-lighthouse-rbac.png"
-    _default_label = "Azure Lighthouse Rbac"
+class PerformanceDiagnostics(_Management):
+    _icon = "performance-diagnostics.png"
+    _default_label = "Performance Diagnostics"
 
-class DatabaseMigrationProject(_Management):
-    _icon = "database-migration-project.png"
-    _default_label = "Database Migration Project"
+class Performance(_Management):
+    _icon = "performance.png"
+    _default_label = "Performance"
 
-class Tags(_Management):
-    _icon = "tags.png"
-    _default_label = "Tags"
+class Playbook(_Management):
+    _icon = "playbook.png"
+    _default_label = "Playbook"
 
-class AzureLighthouseMyRole(_Management):
-    _icon = "azure-lighthouse-my-role.png"
-    _default_label = "Azure Lighthouse My Role"
+class Policy(_Management):
+    _icon = "policy.png"
+    _default_label = "Policy"
 
-class LogAnalyticsSolution(_Management):
-    _icon = "log-analytics-solution.png"
-    _default_label = "Log Analytics Solution"
+class RecoveryServicesAlert(_Management):
+    _icon = "recovery-services-alert.png"
+    _default_label = "Recovery Services Alert"
 
-class LogAnalyticsQueryPack(_Management):
-    _icon = "log-analytics-query-pack.png"
-    _default_label = "Log Analytics Query Pack"
+class RecoveryServicesBackupInfrastructure(_Management):
+    _icon = "recovery-services-backup-infrastructure.png"
+    _default_label = "Recovery Services Backup Infrastructure"
 
-class AutomationAccount(_Management):
-    _icon = "automation-account.png"
-    _default_label = "Automation Account"
+class RecoveryServicesBackupReport(_Management):
+    _icon = "recovery-services-backup-report.png"
+    _default_label = "Recovery Services Backup Report"
 
-class Performance(_Management):
-    _icon = "performance.png"
-    _default_label = "Performance"
+class RecoveryServicesPlan(_Management):
+    _icon = "recovery-services-plan.png"
+    _default_label = "Recovery Services Plan"
 
-class AzureArcDataController(_Management):
-    _icon = "azure-arc-data-controller.png"
-    _default_label = "Azure Arc Data Controller"
+class RecoveryServicesVault(_Management):
+    _icon = "recovery-services-vault.png"
+    _default_label = "Recovery Services Vault"
 
-class AzureMigrate(_Management):
-    _icon = "azure-migrate.png"
-    _default_label = "Azure Migrate"
+class RecoveryServices(_Management):
+    _icon = "recovery-services.png"
+    _default_label = "Recovery Services"
 
-class Extension(_Management):
-    _icon = "extension.png"
-    _default_label = "Extension"
+class ResourceGroup(_Management):
+    _icon = "resource-group.png"
+    _default_label = "Resource Group"
 
-class AzureLighthouseManagement(_Management):
-    _icon = "azure-lighthouse-management.png"
-    _default_label = "Azure Lighthouse Management"
+class ResourceLock(_Management):
+    _icon = "resource-lock.png"
+    _default_label = "Resource Lock"
 
-class ApiManagementService(_Management):
-    _icon = "api-management-service.png"
-    _default_label = "Api Management Service"
+class ReviewAccess(_Management):
+    _icon = "review-access.png"
+    _default_label = "Review Access"
 
 class RoleAzuread(_Management):
     _icon = "role-azuread.png"
     _default_label = "Role Azuread"
 
-class AzureAdvisor(_Management):
-    _icon = "azure-advisor.png"
-    _default_label = "Azure Advisor"
+class RoleCustom(_Management):
+    _icon = "role-custom.png"
+    _default_label = "Role Custom"
 
-class AzureLighthouseMyRequest(_Management):
-    _icon = "azure-lighthouse-my-request.png"
-    _default_label = "Azure Lighthouse My Request"
+class Role(_Management):
+    _icon = "role.png"
+    _default_label = "Role"
 
-class Budget(_Management):
-    _icon = "budget.png"
-    _default_label = "Budget"
+class RunCommand(_Management):
+    _icon = "run-command.png"
+    _default_label = "Run Command"
 
-class BackupCenter(_Management):
-    _icon = "backup-center.png"
-    _default_label = "Backup Center"
+class SchedulerJobCollection(_Management):
+    _icon = "scheduler-job-collection.png"
+    _default_label = "Scheduler Job Collection"
 
-class RecoveryServicesBackupReport(_Management):
-    _icon = "recovery-services-backup-report.png"
-    _default_label = "Recovery Services Backup Report"
+class SharedDashboard(_Management):
+    _icon = "shared-dashboard.png"
+    _default_label = "Shared Dashboard"
 
-class ConfigurationManagement(_Management):
-    _icon = "configuration-management.png"
-    _default_label = "Configuration Management"
+class SignIn(_Management):
+    _icon = "sign-in.png"
+    _default_label = "Sign In"
 
-class ConnectionMonitor(_Management):
-    _icon = "connection-monitor.png"
-    _default_label = "Connection Monitor"
+class Subscription(_Management):
+    _icon = "subscription.png"
+    _default_label = "Subscription"
 
-class RoleCustom(_Management):
-    _icon = "role-custom.png"
-    _default_label = "Role Custom"
+class Tag(_Management):
+    _icon = "tag.png"
+    _default_label = "Tag"
 
-class Cost(_Management):
-    _icon = "cost.png"
-    _default_label = "Cost"
+class Tags(_Management):
+    _icon = "tags.png"
+    _default_label = "Tags"
 
-class AzureArcSqlServer(_Management):
-    _icon = "azure-arc-sql-server.png"
-    _default_label = "Azure Arc Sql Server"
\ No newline at end of file
+class UpdateManagement(_Management):
+    _icon = "update-management.png"
+    _default_label = "Update Management"
+
+class UsageAndQuota(_Management):
+    _icon = "usage-and-quota.png"
+    _default_label = "Usage And Quota"
+
+class VirtualMachineBestPractices(_Management):
+    _icon = "virtual-machine-best-practices.png"
+    _default_label = "Virtual Machine Best Practices"
+
+class Workbook(_Management):
+    _icon = "workbook.png"
+    _default_label = "Workbook"
+
+class WorkflowAutomation(_Management):
+    _icon = "workflow-automation.png"
+    _default_label = "Workflow Automation"
\ No newline at end of file
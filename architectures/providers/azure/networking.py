@@ -6,141 +6,165 @@ class _Networking(_Azure):
     _service_type = "networking"
     _icon_dir = "icons/azure/networking"
 
-class VirtualNetworkGateway(_Networking):
-    _icon = "virtual-network-gateway.png"
-    _default_label = "Virtual Network Gateway"
-
-class InternetAnalyzerProfile(_Networking):
-    _icon = "internet-analyzer-profile.png"
-    _default_label = "Internet Analyzer Profile"
+class ApplicationGateway(_Networking):
+    _icon = "application-gateway.png"
+    _default_label = "Application Gateway"
 
-class VirtualNetworkFirewall(_Networking):
-    _icon = "virtual-network-firewall.png"
-    _default_label = "Virtual Network Firewall"
+class AzureCacheForRedis(_Networking):
+    _icon = "azure-cache-for-redis.png"
+    _default_label = "Azure Cache For Redis"
 
-class NatGateway(_Networking):
-    _icon = "nat-gateway.png"
-    _default_label = "Nat Gateway"
+class AzureFrontDoor(_Networking):
+    _icon = "azure-front-door.png"
+    _default_label = "Azure Front Door"
 
-class Relay(_Networking):
-    _icon = "relay.png"
-    _default_label = "Relay"
+class Bastion(_Networking):
+    _icon = "bastion.png"
+    _default_label = "Bastion"
 
-class LocalNetworkGateway(_Networking):
-    _icon = "local-network-gateway.png"
-    _default_label = "Local Network Gateway"
+class CdnProfile(_Networking):
+    _icon = "cdn-profile.png"
+    _default_label = "Cdn Profile"
 
 class DdosProtectionPlan(_Networking):
     _icon = "ddos-protection-plan.png"
     _default_label = "Ddos Protection Plan"
 
-class Networking(_Networking):
-    _icon = "networking.png"
-    _default_label = "Networking"
+class DnsZonePrivate(_Networking):
+    _icon = "dns-zone-private.png"
+    _default_label = "Dns Zone Private"
 
-class VirtualNetwork(_Networking):
-    _icon = "virtual-network.png"
-    _default_label = "Virtual Network"
+class DnsZonePublic(_Networking):
+    _icon = "dns-zone-public.png"
+    _default_label = "Dns Zone Public"
 
-class NetworkWatcher(_Networking):
-    _icon = "network-watcher.png"
-    _default_label = "Network Watcher"
+class ExpressrouteCircuit(_Networking):
+    _icon = "expressroute-circuit.png"
+    _default_label = "Expressroute Circuit"
 
 class ExpressrouteConnection(_Networking):
     _icon = "expressroute-connection.png"
     _default_label = "Expressroute Connection"
 
-class RouteFilter(_Networking):
-    _icon = "route-filter.png"
-    _default_label = "Route Filter"
+class ExpressrouteDirect(_Networking):
+    _icon = "expressroute-direct.png"
+    _default_label = "Expressroute Direct"
 
-class AzureFrontDoor(_Networking):
-    _icon = "azure-front-door.png"
-    _default_label = "Azure Front Door"
+class ExpressrouteFilter(_Networking):
+    _icon = "expressroute-filter.png"
+    _default_label = "Expressroute Filter"
+
+class GeoReplication(_Networking):
+    _icon = "geo-replication.png"
+    _default_label = "Geo Replication"
+
+class HybridConnection(_Networking):
+    _icon = "hybrid-connection.png"
+    _default_label = "Hybrid Connection"
+
+class InternetAnalyzerProfile(_Networking):
+    _icon = "internet-analyzer-profile.png"
+    _default_label = "Internet Analyzer Profile"
+
+class IpGroup(_Networking):
+    _icon = "ip-group.png"
+    _default_label = "Ip Group"
 
 class LoadBalancer(_Networking):
     _icon = "load-balancer.png"
     _default_label = "Load Balancer"
 
-class ReservedIpAddressClassic(_Networking):
-    _icon = "reserved-ip-address-classic.png"
-    _default_label = "Reserved Ip Address Classic"
+class LocalNetworkGateway(_Networking):
+    _icon = "local-network-gateway.png"
+    _default_label = "Local Network Gateway"
 
-class VirtualWan(_Networking):
-    _icon = "virtual-wan.png"
-    _default_label = "Virtual Wan"
+class NatGateway(_Networking):
+    _icon = "nat-gateway.png"
+    _default_label = "Nat Gateway"
 
-class ApplicationGateway(_Networking):
-    _icon = "application-gateway.png"
-    _default_label = "Application Gateway"
+class NetworkInterface(_Networking):
+    _icon = "network-interface.png"
+    _default_label = "Network Interface"
 
-class ExpressrouteCircuit(_Networking):
-    _icon = "expressroute-circuit.png"
-    _default_label = "Expressroute Circuit"
+class NetworkSecurityGroupClassic(_Networking):
+    _icon = "network-security-group-classic.png"
+    _default_label = "Network Security Group Classic"
 
-class VirtualNetworkPeering(_Networking):
-    _icon = "virtual-network-peering.png"
-    _default_label = "Virtual Network Peering"
+class NetworkWatcher(_Networking):
+    _icon = "network-watcher.png"
+    _default_label = "Network Watcher"
 
-class HybridConnection(_Networking):
-    _icon = "hybrid-connection.png"
-    _default_label = "Hybrid Connection"
+class Networking(_Networking):
+    _icon = "networking.png"
+    _default_label = "Networking"
 
-class PublicIpPrefix(_Networking):
-    _icon = "public-ip-prefix.png"
-    _default_label = "Public Ip Prefix"
+class OnPremisesDataGateway(_Networking):
+    _icon = "on-premises-data-gateway.png"
+    _default_label = "On Premises Data Gateway"
+
+class PeeringService(_Networking):
+    _icon = "peering-service.png"
+    _default_label = "Peering Service"
+
+class Peering(_Networking):
+    _icon = "peering.png"
+    _default_label = "Peering"
 
 class PrivateEndpoint(_Networking):
     _icon = "private-endpoint.png"
     _default_label = "Private Endpoint"
 
-class VirtualNetworkClassic(_Networking):
-    _icon = "virtual-network-classic.png"
-    _default_label = "Virtual Network Classic"
+class PrivateLink(_Networking):
+    _icon = "private-link.png"
+    _default_label = "Private Link"
 
-class ExpressrouteFilter(_Networking):
-    _icon = "expressroute-filter.png"
-    _default_label = "Expressroute Filter"
+class PublicIpAddress(_Networking):
+    _icon = "public-ip-address.png"
+    _default_label = "Public Ip Address"
 
-class DnsZonePublic(_Networking):
-    _icon = "dns-zone-public.png"
-    _default_label = "Dns Zone Public"
+class PublicIpPrefix(_Networking):
+    _icon = "public-ip-prefix.png"
+    _default_label = "Public Ip Prefix"
 
-class AzureCacheForRedis(_Networking):
-    _icon = "azure-cache-for-redis.png"
-    _default_label = "Azure Cache For Redis"
+class Relay(_Networking):
+    _icon = "relay.png"
+    _default_label = "Relay"
 
-class DnsZonePrivate(_Networking):
-    _icon = "dns-zone-private.png"
-    _default_label = "Dns Zone Private"
+class ReservedIpAddressClassic(_Networking):
+    _icon = "reserved-ip-address-classic.png"
+    _default_label = "Reserved Ip Address Classic"
 
-class Peering(_Networking):
-    _icon = "peering.png"
-    _default_label = "Peering"
+class RouteFilter(_Networking):
+    _icon = "route-filter.png"
+    _default_label = "Route Filter"
 
 class RouteTable(_Networking):
     _icon = "route-table.png"
     _default_label = "Route Table"
 
-class NetworkInterface(_Networking):
-    _icon = "network-interface.png"
-    _default_label = "Network Interface"
+class TrafficManagerProfile(_Networking):
+    _icon = "traffic-manager-profile.png"
+    _default_label = "Traffic Manager Profile"
 
-class PeeringService(_Networking):
-    _icon = "peering-service.png"
-    _default_label = "Peering Service"
+class VirtualNetworkClassic(_Networking):
+    _icon = "virtual-network-classic.png"
+    _default_label = "Virtual Network Classic"
 
-class PublicIpAddress(_Networking):
-    _icon = "public-ip-address.png"
-    _default_label = "Public Ip Address"
+class VirtualNetworkFirewall(_Networking):
+    _icon = "virtual-network-firewall.png"
+    _default_label = "Virtual Network Firewall"
 
-class PrivateLink(_Networking):
-    _icon = "private-link.png"
-    _default_label = "Private Link"
+class VirtualNetworkGateway(_Networking):
+    _icon = "virtual-network-gateway.png"
+    _default_label = "Virtual Network Gateway"
 
-class CdnProfile(_Networking):
-    _icon = "cdn-profile.png"
-    _default_label = "Cdn Profile"
+class VirtualNetworkPeering(_Networking):
+    _icon = "virtual-network-peering.png"
+    _default_label = "Virtual Network Peering"
+
+class VirtualNetwork(_Networking):
+    _icon = "virtual-network.png"
+    _default_label = "Virtual Network"
 
 class VirtualSubnet(_Networking):
     _icon = "virtual-subnet.png"
@@ -150,30 +174,6 @@ class VirtualWanGateway(_Networking):
     _icon = "virtual-wan-gateway.png"
     _default_label = "Virtual Wan Gateway"
 
-class ExpressrouteDirect(_Networking):
-    _icon = "expressroute-direct.png"
-    _default_label = "Expressroute Direct"
-
-class IpGroup(_Networking):
-    _icon = "ip-group.png"
-    _default_label = "Ip Group"
-
-class GeoReplication(_Networking):
-    _icon = "geo-replication.png"
-    _default_label = "Geo Replication"
-
-class TrafficManagerProfile(_Networking):
-    _icon = "traffic-manager-profile.png"
-    _default_label = "Traffic Manager Profile"
-
-class Bastion(_Networking):
-    _icon = "bastion.png"
-    _default_label = "Bastion"
-
-class NetworkSecurityGroupClassic(_Networking):
-    _icon = "network-security-group-classic.png"
-    _default_label = "Network Security Group Classic"
-
-class OnPremisesDataGateway(_Networking):
-    _icon = "on-premises-data-gateway.png"
-    _default_label = "On Premises Data Gateway"
\ No newline at end of file
+class VirtualWan(_Networking):
+    _icon = "virtual-wan.png"
+    _default_label = "Virtual Wan"
\ No newline at end of file
@@ -6,86 +6,86 @@ class _Office365(_Azure):
     _service_type = "office365"
     _icon_dir = "icons/azure/office365"
 
-class O365Stream(_Office365):
-    _icon = "o365-stream.png"
-    _default_label = "O365 Stream"
+class O365Access(_Office365):
+    _icon = "o365-access.png"
+    _default_label = "O365 Access"
 
-class O365Publisher(_Office365):
-    _icon = "o365-publisher.png"
-    _default_label = "O365 Publisher"
+class O365Delve(_Office365):
+    _icon = "o365-delve.png"
+    _default_label = "O365 Delve"
 
-class O365Visio(_Office365):
-    _icon = "o365-visio.png"
-    _default_label = "O365 Visio"
+class O365Dynamics(_Office365):
+    _icon = "o365-dynamics.png"
+    _default_label = "O365 Dynamics"
+
+class O365Excel(_Office365):
+    _icon = "o365-excel.png"
+    _default_label = "O365 Excel"
+
+class O365Exchange(_Office365):
+    _icon = "o365-exchange.png"
+    _default_label = "O365 Exchange"
+
+class O365Forms(_Office365):
+    _icon = "o365-forms.png"
+    _default_label = "O365 Forms"
+
+class O365List(_Office365):
+    _icon = "o365-list.png"
+    _default_label = "O365 List"
+
+class O365Onedrive(_Office365):
+    _icon = "o365-onedrive.png"
+    _default_label = "O365 Onedrive"
 
 class O365Onenote(_Office365):
     _icon = "o365-onenote.png"
     _default_label = "O365 Onenote"
 
-class O365Delve(_Office365):
-    _icon = "o365-delve.png"
-    _default_label = "O365 Delve"
-
 class O365Outlook(_Office365):
     _icon = "o365-outlook.png"
     _default_label = "O365 Outlook"
 
-class O365Yammer(_Office365):
-    _icon = "o365-yammer.png"
-    _default_label = "O365 Yammer"
-
-class O365Sharepoint(_Office365):
-    _icon = "o365-sharepoint.png"
-    _default_label = "O365 Sharepoint"
+class O365Planner(_Office365):
+    _icon = "o365-planner.png"
+    _default_label = "O365 Planner"
 
 class O365Powerpoint(_Office365):
     _icon = "o365-powerpoint.png"
     _default_label = "O365 Powerpoint"
 
-class O365Access(_Office365):
-    _icon = "o365-access.png"
-    _default_label = "O365 Access"
+class O365Project(_Office365):
+    _icon = "o365-project.png"
+    _default_label = "O365 Project"
 
-class O365Dynamics(_Office365):
-    _icon = "o365-dynamics.png"
-    _default_label = "O365 Dynamics"
+class O365Publisher(_Office365):
+    _icon = "o365-publisher.png"
+    _default_label = "O365 Publisher"
+
+class O365Sharepoint(_Office365):
+    _icon = "o365-sharepoint.png"
+    _default_label = "O365 Sharepoint"
+
+class O365Stream(_Office365):
+    _icon = "o365-stream.png"
+    _default_label = "O365 Stream"
 
 class O365Sway(_Office365):
     _icon = "o365-sway.png"
     _default_label = "O365 Sway"
 
-class O365Forms(_Office365):
-    _icon = "o365-forms.png"
-    _default_label = "O365 Forms"
-
 class O365Teams(_Office365):
     _icon = "o365-teams.png"
     _default_label = "O365 Teams"
 
-class O365List(_Office365):
-    _icon = "o365-list.png"
-    _default_label = "O365 List"
+class O365Visio(_Office365):
+    _icon = "o365-visio.png"
+    _default_label = "O365 Visio"
 
-class O365Excel(_Office365):
-    _icon = "o365-excel.png"
-    _default_label = "O365 Excel"
+class O365Yammer(_Office365):
+    _icon = "o365-yammer.png"
+    _default_label = "O365 Yammer"
 
 class O365(_Office365):
     _icon = "o365.png"
-    _default_label = "O365"
-
-class O365Planner(_Office365):
-    _icon = "o365-planner.png"
-    _default_label = "O365 Planner"
-
-class O365Exchange(_Office365):
-    _icon = "o365-exchange.png"
-    _default_label = "O365 Exchange"
-
-class O365Onedrive(_Office365):
-    _icon = "o365-onedrive.png"
-    _default_label = "O365 Onedrive"
-
-class O365Project(_Office365):
-    _icon = "o365-project.png"
-    _default_label = "O365 Project"
\ No newline at end of file
+    _default_label = "O365"
\ No newline at end of file
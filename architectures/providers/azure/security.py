@@ -6,81 +6,77 @@ class _Security(_Azure):
     _service_type = "security"
     _icon_dir = "icons/azure/security"
 
-class SshKey(_Security):
-    _icon = "ssh-key.png"
-    _default_label = "Ssh Key"
+class ActivityLog(_Security):
+    _icon = "activity-log.png"
+    _default_label = "Activity Log"
+
+class Activity(_Security):
+    _icon = "activity.png"
+    _default_label = "Activity"
 
 class AdaptiveApplicationControl(_Security):
     _icon = "adaptive-application-control.png"
     _default_label = "Adaptive Application Control"
 
-class FileIntegrityMonitoring(_Security):
-    _icon = "file-integrity-monitoring.png"
-    _default_label = "File Integrity Monitoring"
+class AdaptiveNetworkHardening(_Security):
+    _icon = "adaptive-network-hardening.png"
+    _default_label = "Adaptive Network Hardening"
 
-class WafPolicy(_Security):
-    _icon = "waf-policy.png"
-    _default_label = "Waf Policy"
+class AzureDefender(_Security):
+    _icon = "azure-defender.png"
+    _default_label = "Azure Defender"
 
-class SecurityCenter(_Security):
-    _icon = "security-center.png"
-    _default_label = "Security Center"
+class AzureInformationProtection(_Security):
+    _icon = "azure-information-protection.png"
+    _default_label = "Azure Information Protection"
 
 class AzureMultifactorAuthentication(_Security):
     _icon = "azure-multifactor-authentication.png"
     _default_label = "Azure Multifactor Authentication"
 
-class SecureScore(_Security):
-    _icon = "secure-score.png"
-    _default_label = "Secure Score"
-
-class Firewall(_Security):
-    _icon = "firewall.png"
-    _default_label = "Firewall"
+class CloudAppSecurity(_Security):
+    _icon = "cloud-app-security.png"
+    _default_label = "Cloud App Security"
 
-class SecurityBaseline(_Security):
-    _icon = "security-baseline.png"
-    _default_label = "Security Baseline"
+class DdosProtection(_Security):
+    _icon = "ddos-protection.png"
+    _default_label = "Ddos Protection"
 
 class ExtendedSecurityUpdates(_Security):
     _icon = "extended-security-updates.png"
     _default_label = "Extended Security Updates"
 
-class AdaptiveNetworkHardening(_Security):
-    _icon = "adaptive-network-hardening.png"
-    _default_label = "Adaptive Network Hardening"
+class FileIntegrityMonitoring(_Security):
+    _icon = "file-integrity-monitoring.png"
+    _default_label = "File Integrity Monitoring"
 
-class CloudAppSecurity(_Security):
-    _icon = "cloud-app-security.png"
-    _default_label = "Cloud App Security"
+class FirewallManager(_Security):
+    _icon = "firewall-manager.png"
+    _default_label = "Firewall Manager"
+
+class FirewallPolicy(_Security):
+    _icon = "firewall-policy.png"
+    _default_label = "Firewall Policy"
+
+class Firewall(_Security):
+    _icon = "firewall.png"
+    _default_label = "Firewall"
 
 class Hunting(_Security):
     _icon = "hunting.png"
     _default_label = "Hunting"
 
+class Incident(_Security):
+    _icon = "incident.png"
+    _default_label = "Incident"
+
 class KeyVaultHsm(_Security):
     _icon = "key-vault-hsm.png"
     _default_label = "Key Vault Hsm"
 
-class SecurityAlert(_Security):
-    _icon = "security-alert.png"
-    _default_label = "Security Alert"
-
-class FirewallPolicy(_Security):
-    _icon = "firewall-policy.png"
-    _default_label = "Firewall Policy"
-
-class AzureInformationProtection(_Security):
-    _icon = "azure-information-protection.png"
-    _default_label = "Azure Information Protection"
-
-class ActivityLog(_Security):
-    _icon = "activity-log.png"
-    _default_label = "Activity Log"
-
-class SecurityCenterCoverage(_Security):
-    _icon = "security-center-coverage.png"
-    _default_label = "Security Center Coverage"
+class KeyVault(_Security):
+    _icon = "key-vault.png"
+    _default_label = "Key Vault"
 
 class NetworkSecurityGroup(_Security):
     _icon = "network-security-group.png"
@@ -90,34 +86,38 @@ class RegulatoryCompliance(_Security):
     _icon = "regulatory-compliance.png"
     _default_label = "Regulatory Compliance"
 
-class Activity(_Security):
-    _icon = "activity.png"
-    _default_label = "Activity"
+class SecureScore(_Security):
+    _icon = "secure-score.png"
+    _default_label = "Secure Score"
 
-class KeyVault(_Security):
-    _icon = "key-vault.png"
-    _default_label = "Key Vault"
+class SecurityAlert(_Security):
+    _icon = "security-alert.png"
+    _default_label = "Security Alert"
 
-class AzureDefender(_Security):
-    _icon = "azure-defender.png"
-    _default_label = "Azure Defender"
+class SecurityBaseline(_Security):
+    _icon = "security-baseline.png"
+    _default_label = "Security Baseline"
 
-class Incident(_Security):
-    _icon = "incident.png"
-    _default_label = "Incident"
+class SecurityCenterCoverage(_Security):
+    _icon = "security-center-coverage.png"
+    _default_label = "Security Center Coverage"
 
-class FirewallManager(_Security):
-    _icon = "firewall-manager.png"
-    _default_label = "Firewall Manager"
+class SecurityCenter(_Security):
+    _icon = "security-center.png"
+    _default_label = "Security Center"
+
+class SecurityDetonationChamber(_Security):
+    _icon = "security-detonation-chamber.png"
+    _default_label = "Security Detonation Chamber"
 
 class Sentinel(_Security):
     _icon = "sentinel.png"
     _default_label = "Sentinel"
 
-class SecurityDetonationChamber(_Security):
-    _icon = "security-detonation-chamber.png"
-    _default_label = "Security Detonation Chamber"
+class SshKey(_Security):
+    _icon = "ssh-key.png"
+    _default_label = "Ssh Key"
 
-class DdosProtection(_Security):
-    _icon = "ddos-protection.png"
-    _default_label = "Ddos Protection"
\ No newline at end of file
+class WafPolicy(_Security):
+    _icon = "waf-policy.png"
+    _default_label = "Waf Policy"
\ No newline at end of file
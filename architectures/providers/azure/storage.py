@@ -6,94 +6,94 @@ class _Storage(_Azure):
     _service_type = "storage"
     _icon_dir = "icons/azure/storage"
 
-class StorsimpleDataManager(_Storage):
-    _icon = "storsimple-data-manager.png"
-    _default_label = "Storsimple Data Manager"
+class ArchiveStorage(_Storage):
+    _icon = "archive-storage.png"
+    _default_label = "Archive Storage"
 
-class StorageAccountBlob(_Storage):
-    _icon = "storage-account-blob.png"
-    _default_label = "Storage Account Blob"
+class AzureNetappFiles(_Storage):
+    _icon = "azure-netapp-files.png"
+    _default_label = "Azure Netapp Files"
 
-class ManagedDiskStandardHdd(_Storage):
-    _icon = "managed-disk-standard-hdd.png"
-    _default_label = "Managed Disk Standard Hdd"
+class DataBoxEdgeAndGateway(_Storage):
+    _icon = "data-box-edge-and-gateway.png"
+    _default_label = "Data Box Edge And Gateway"
 
-class StorageSyncService(_Storage):
-    _icon = "storage-sync-service.png"
-    _default_label = "Storage Sync Service"
+class DataBox(_Storage):
+    _icon = "data-box.png"
+    _default_label = "Data Box"
+
+class DataCatalog(_Storage):
+    _icon = "data-catalog.png"
+    _default_label = "Data Catalog"
+
+class DataShare(_Storage):
+    _icon = "data-share.png"
+    _default_label = "Data Share"
 
 class DiskEncryptionSet(_Storage):
     _icon = "disk-encryption-set.png"
     _default_label = "Disk Encryption Set"
 
-class ManagedDiskUltraSsd(_Storage):
-    _icon = "managed-disk-ultra-ssd.png"
-    _default_label = "Managed Disk Ultra Ssd"
-
-class ArchiveStorage(_Storage):
-    _icon = "archive-storage.png"
-    _default_label = "Archive Storage"
-
-class StorageAccountBlobHot(_Storage):
-    _icon = "storage-account-blob-hot.png"
-    _default_label = "Storage Account Blob Hot"
-
-class StorageAccountTable(_Storage):
-    _icon = "storage-account-table.png"
-    _default_label = "Storage Account Table"
+class ManagedDiskPremiumSsd(_Storage):
+    _icon = "managed-disk-premium-ssd.png"
+    _default_label = "Managed Disk Premium Ssd"
 
 class ManagedDiskSnapshot(_Storage):
     _icon = "managed-disk-snapshot.png"
     _default_label = "Managed Disk Snapshot"
 
-class DataShare(_Storage):
-    _icon = "data-share.png"
-    _default_label = "Data Share"
+class ManagedDiskStandardHdd(_Storage):
+    _icon = "managed-disk-standard-hdd.png"
+    _default_label = "Managed Disk Standard Hdd"
 
-class DataCatalog(_Storage):
-    _icon = "data-catalog.png"
-    _default_label = "Data Catalog"
+class ManagedDiskStandardSsd(_Storage):
+    _icon = "managed-disk-standard-ssd.png"
+    _default_label = "Managed Disk Standard Ssd"
+
+class ManagedDiskUltraSsd(_Storage):
+    _icon = "managed-disk-ultra-ssd.png"
+    _default_label = "Managed Disk Ultra Ssd"
 
 class StorageAccountBlobCool(_Storage):
     _icon = "storage-account-blob-cool.png"
     _default_label = "Storage Account Blob Cool"
 
-class DataBox(_Storage):
-    _icon = "data-box.png"
-    _default_label = "Data Box"
+class StorageAccountBlobHot(_Storage):
+    _icon = "storage-account-blob-hot.png"
+    _default_label = "Storage Account Blob Hot"
 
-class StorageExplorer(_Storage):
-    _icon = "storage-explorer.png"
-    _default_label = "Storage Explorer"
+class StorageAccountBlob(_Storage):
+    _icon = "storage-account-blob.png"
+    _default_label = "Storage Account Blob"
+
+class StorageAccountClassic(_Storage):
+    _icon = "storage-account-classic.png"
+    _default_label = "Storage Account Classic"
 
 class StorageAccountContainer(_Storage):
     _icon = "storage-account-container.png"
     _default_label = "Storage Account Container"
 
-class DataBoxEdgeAndGateway(_Storage):
-    _icon = "data-box-edge-and-gateway.png"
-    _default_label = "Data Box Edge And Gateway"
-
-class AzureNetappFiles(_Storage):
-    _icon = "azure-netapp-files.png"
-    _default_label = "Azure Netapp Files"
-
 class StorageAccountQueue(_Storage):
     _icon = "storage-account-queue.png"
     _default_label = "Storage Account Queue"
 
-class ManagedDiskStandardSsd(_Storage):
-    _icon = "managed-disk-standard-ssd.png"
-    _default_label = "Managed Disk Standard Ssd"
+class StorageAccountTable(_Storage):
+    _icon = "storage-account-table.png"
+    _default_label = "Storage Account Table"
 
 class StorageAccount(_Storage):
     _icon = "storage-account.png"
     _default_label = "Storage Account"
 
-class ManagedDiskPremiumSsd(_Storage):
-    _icon = "managed-disk-premium-ssd.png"
-    _default_label = "Managed Disk Premium Ssd"
+class StorageExplorer(_Storage):
+    _icon = "storage-explorer.png"
+    _default_label = "Storage Explorer"
 
-class StorageAccountClassic(_Storage):
-    _icon = "storage-account-classic.png"
-    _default_label = "Storage Account Classic"
\ No newline at end of file
+class StorageSyncService(_Storage):
+    _icon = "storage-sync-service.png"
+    _default_label = "Storage Sync Service"
+
+class StorsimpleDataManager(_Storage):
+    _icon = "storsimple-data-manager.png"
+    _default_label = "Storsimple Data Manager"
\ No newline at end of file
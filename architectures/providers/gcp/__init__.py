@@ -0,0 +1,5 @@
+# Do not modify this file directly. It is auto-generated with Python.
+
+from architectures.catalog import lazy_loader
+
+__getattr__, __dir__ = lazy_loader(__name__)
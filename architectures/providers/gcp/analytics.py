@@ -6,42 +6,42 @@ class _Analytics(_Gcp):
     _service_type = "analytics"
     _icon_dir = "icons/gcp/analytics"
 
-class Dataflow(_Analytics):
-    _icon = "dataflow.png"
-    _default_label = "Dataflow"
-
-class Dataprep(_Analytics):
-    _icon = "dataprep.png"
-    _default_label = "Dataprep"
+class Bigquery(_Analytics):
+    _icon = "bigquery.png"
+    _default_label = "Bigquery"
 
-class Dataproc(_Analytics):
-    _icon = "dataproc.png"
-    _default_label = "Dataproc"
+class Composer(_Analytics):
+    _icon = "composer.png"
+    _default_label = "Composer"
 
 class DataCatalog(_Analytics):
     _icon = "data-catalog.png"
     _default_label = "Data Catalog"
 
-class Composer(_Analytics):
-    _icon = "composer.png"
-    _default_label = "Composer"
+class DataFusion(_Analytics):
+    _icon = "data-fusion.png"
+    _default_label = "Data Fusion"
+
+class Dataflow(_Analytics):
+    _icon = "dataflow.png"
+    _default_label = "Dataflow"
 
 class Datalab(_Analytics):
     _icon = "datalab.png"
     _default_label = "Datalab"
 
-class Bigquery(_Analytics):
-    _icon = "bigquery.png"
-    _default_label = "Bigquery"
+class Dataprep(_Analytics):
+    _icon = "dataprep.png"
+    _default_label = "Dataprep"
+
+class Dataproc(_Analytics):
+    _icon = "dataproc.png"
+    _default_label = "Dataproc"
 
 class Genomics(_Analytics):
     _icon = "genomics.png"
     _default_label = "Genomics"
 
-class DataFusion(_Analytics):
-    _icon = "data-fusion.png"
-    _default_label = "Data Fusion"
-
 class Pubsub(_Analytics):
     _icon = "pubsub.png"
     _default_label = "Pubsub"
\ No newline at end of file
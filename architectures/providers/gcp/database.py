@@ -6,26 +6,26 @@ class _Database(_Gcp):
     _service_type = "database"
     _icon_dir = "icons/gcp/database"
 
-class Memorystore(_Database):
-    _icon = "memorystore.png"
-    _default_label = "Memorystore"
-
-class Firestore(_Database):
-    _icon = "firestore.png"
-    _default_label = "Firestore"
+class Bigtable(_Database):
+    _icon = "bigtable.png"
+    _default_label = "Bigtable"
 
 class Datastore(_Database):
     _icon = "datastore.png"
     _default_label = "Datastore"
 
-class Sql(_Database):
-    _icon = "sql.png"
-    _default_label = "Sql"
+class Firestore(_Database):
+    _icon = "firestore.png"
+    _default_label = "Firestore"
 
-class Bigtable(_Database):
-    _icon = "bigtable.png"
-    _default_label = "Bigtable"
+class Memorystore(_Database):
+    _icon = "memorystore.png"
+    _default_label = "Memorystore"
 
 class Spanner(_Database):
     _icon = "spanner.png"
-    _default_label = "Spanner"
\ No newline at end of file
+    _default_label = "Spanner"
+
+class Sql(_Database):
+    _icon = "sql.png"
+    _default_label = "Sql"
\ No newline at end of file
@@ -6,29 +6,41 @@ class _Devtools(_Gcp):
     _service_type = "devtools"
     _icon_dir = "icons/gcp/devtools"
 
-class ToolsForPowershell(_Devtools):
-    _icon = "tools-for-powershell.png"
-    _default_label = "Tools For Powershell"
+class Build(_Devtools):
+    _icon = "build.png"
+    _default_label = "Build"
 
-class ContainerRegistry(_Devtools):
-    _icon = "container-registry.png"
-    _default_label = "Container Registry"
+class CodeForIntellij(_Devtools):
+    _icon = "code-for-intellij.png"
+    _default_label = "Code For Intellij"
 
 class Code(_Devtools):
     _icon = "code.png"
     _default_label = "Code"
 
+class ContainerRegistry(_Devtools):
+    _icon = "container-registry.png"
+    _default_label = "Container Registry"
+
+class GradleAppEnginePlugin(_Devtools):
+    _icon = "gradle-app-engine-plugin.png"
+    _default_label = "Gradle App Engine Plugin"
+
+class IdePlugins(_Devtools):
+    _icon = "ide-plugins.png"
+    _default_label = "Ide Plugins"
+
 class MavenAppEnginePlugin(_Devtools):
     _icon = "maven-app-engine-plugin.png"
     _default_label = "Maven App Engine Plugin"
 
-class ToolsForVisualStudio(_Devtools):
-    _icon = "tools-for-visual-studio.png"
-    _default_label = "Tools For Visual Studio"
+class Scheduler(_Devtools):
+    _icon = "scheduler.png"
+    _default_label = "Scheduler"
 
-class Build(_Devtools):
-    _icon = "build.png"
-    _default_label = "Build"
+class Sdk(_Devtools):
+    _icon = "sdk.png"
+    _default_label = "Sdk"
 
 class SourceRepositories(_Devtools):
     _icon = "source-repositories.png"
@@ -38,30 +50,18 @@ class Tasks(_Devtools):
     _icon = "tasks.png"
     _default_label = "Tasks"
 
-class Sdk(_Devtools):
-    _icon = "sdk.png"
-    _default_label = "Sdk"
-
 class TestLab(_Devtools):
     _icon = "test-lab.png"
     _default_label = "Test Lab"
 
-class CodeForIntellij(_Devtools):
-    _icon = "code-for-intellij.png"
-    _default_label = "Code For Intellij"
-
 class ToolsForEclipse(_Devtools):
     _icon = "tools-for-eclipse.png"
     _default_label = "Tools For Eclipse"
 
-class GradleAppEnginePlugin(_Devtools):
-    _icon = "gradle-app-engine-plugin.png"
-    _default_label = "Gradle App Engine Plugin"
-
-class Scheduler(_Devtools):
-    _icon = "scheduler.png"
-    _default_label = "Scheduler"
+class ToolsForPowershell(_Devtools):
+    _icon = "tools-for-powershell.png"
+    _default_label = "Tools For Powershell"
 
-class IdePlugins(_Devtools):
-    _icon = "ide-plugins.png"
-    _default_label = "Ide Plugins"
\ No newline at end of file
+class ToolsForVisualStudio(_Devtools):
+    _icon = "tools-for-visual-studio.png"
+    _default_label = "Tools For Visual Studio"
\ No newline at end of file
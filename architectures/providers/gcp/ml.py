@@ -6,86 +6,86 @@ class _Ml(_Gcp):
     _service_type = "ml"
     _icon_dir = "icons/gcp/ml"
 
-class DialogFlowEnterpriseEdition(_Ml):
-    _icon = "dialog-flow-enterprise-edition.png"
-    _default_label = "Dialog Flow Enterprise Edition"
+class AdvancedSolutionsLab(_Ml):
+    _icon = "advanced-solutions-lab.png"
+    _default_label = "Advanced Solutions Lab"
 
-class AutomlTables(_Ml):
-    _icon = "automl-tables.png"
-    _default_label = "Automl Tables"
+class AiHub(_Ml):
+    _icon = "ai-hub.png"
+    _default_label = "Ai Hub"
 
-class TranslationApi(_Ml):
-    _icon = "translation-api.png"
-    _default_label = "Translation Api"
+class AiPlatformDataLabelingService(_Ml):
+    _icon = "ai-platform-data-labeling-service.png"
+    _default_label = "Ai Platform Data Labeling Service"
 
-class VisionApi(_Ml):
-    _icon = "vision-api.png"
-    _default_label = "Vision Api"
+class AiPlatform(_Ml):
+    _icon = "ai-platform.png"
+    _default_label = "Ai Platform"
 
-class NaturalLanguageApi(_Ml):
-    _icon = "natural-language-api.png"
-    _default_label = "Natural Language Api"
+class AutomlNaturalLanguage(_Ml):
+    _icon = "automl-natural-language.png"
+    _default_label = "Automl Natural Language"
 
-class RecommendationsAi(_Ml):
-    _icon = "recommendations-ai.png"
-    _default_label = "Recommendations Ai"
+class AutomlTables(_Ml):
+    _icon = "automl-tables.png"
+    _default_label = "Automl Tables"
 
-class AiPlatformDataLabelingService(_Ml):
-    _icon = "ai-platform-data-labeling-service.png"
-    _default_label = "Ai Platform Data Labeling Service"
+class AutomlTranslation(_Ml):
+    _icon = "automl-translation.png"
+    _default_label = "Automl Translation"
+
+class AutomlVideoIntelligence(_Ml):
+    _icon = "automl-video-intelligence.png"
+    _default_label = "Automl Video Intelligence"
 
 class AutomlVision(_Ml):
     _icon = "automl-vision.png"
     _default_label = "Automl Vision"
 
-class JobsApi(_Ml):
-    _icon = "jobs-api.png"
-    _default_label = "Jobs Api"
-
-class VideoIntelligenceApi(_Ml):
-    _icon = "video-intelligence-api.png"
-    _default_label = "Video Intelligence Api"
-
 class Automl(_Ml):
     _icon = "automl.png"
     _default_label = "Automl"
 
+class DialogFlowEnterpriseEdition(_Ml):
+    _icon = "dialog-flow-enterprise-edition.png"
+    _default_label = "Dialog Flow Enterprise Edition"
+
 class InferenceApi(_Ml):
     _icon = "inference-api.png"
     _default_label = "Inference Api"
 
-class AutomlTranslation(_Ml):
-    _icon = "automl-translation.png"
-    _default_label = "Automl Translation"
-
-class AutomlNaturalLanguage(_Ml):
-    _icon = "automl-natural-language.png"
-    _default_label = "Automl Natural Language"
-
-class AutomlVideoIntelligence(_Ml):
-    _icon = "automl-video-intelligence.png"
-    _default_label = "Automl Video Intelligence"
+class JobsApi(_Ml):
+    _icon = "jobs-api.png"
+    _default_label = "Jobs Api"
 
-class AdvancedSolutionsLab(_Ml):
-    _icon = "advanced-solutions-lab.png"
-    _default_label = "Advanced Solutions Lab"
+class NaturalLanguageApi(_Ml):
+    _icon = "natural-language-api.png"
+    _default_label = "Natural Language Api"
 
-class TextToSpeech(_Ml):
-    _icon = "text-to-speech.png"
-    _default_label = "Text To Speech"
+class RecommendationsAi(_Ml):
+    _icon = "recommendations-ai.png"
+    _default_label = "Recommendations Ai"
 
 class SpeechToText(_Ml):
     _icon = "speech-to-text.png"
     _default_label = "Speech To Text"
 
-class AiHub(_Ml):
-    _icon = "ai-hub.png"
-    _default_label = "Ai Hub"
+class TextToSpeech(_Ml):
+    _icon = "text-to-speech.png"
+    _default_label = "Text To Speech"
 
 class Tpu(_Ml):
     _icon = "tpu.png"
     _default_label = "Tpu"
 
-class AiPlatform(_Ml):
-    _icon = "ai-platform.png"
-    _default_label = "Ai Platform"
\ No newline at end of file
+class TranslationApi(_Ml):
+    _icon = "translation-api.png"
+    _default_label = "Translation Api"
+
+class VideoIntelligenceApi(_Ml):
+    _icon = "video-intelligence-api.png"
+    _default_label = "Video Intelligence Api"
+
+class VisionApi(_Ml):
+    _icon = "vision-api.png"
+    _default_label = "Vision Api"
\ No newline at end of file
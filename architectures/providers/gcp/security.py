@@ -6,21 +6,13 @@ class _Security(_Gcp):
     _service_type = "security"
     _icon_dir = "icons/gcp/security"
 
-class SecurityCommandCenter(_Security):
-    _icon = "security-command-center.png"
-    _default_label = "Security Command Center"
-
-class Iap(_Security):
-    _icon = "iap.png"
-    _default_label = "Iap"
-
 class Iam(_Security):
     _icon = "iam.png"
     _default_label = "Iam"
 
-class SecurityScanner(_Security):
-    _icon = "security-scanner.png"
-    _default_label = "Security Scanner"
+class Iap(_Security):
+    _icon = "iap.png"
+    _default_label = "Iap"
 
 class KeyManagementService(_Security):
     _icon = "key-management-service.png"
@@ -28,4 +20,12 @@ class KeyManagementService(_Security):
 
 class ResourceManager(_Security):
     _icon = "resource-manager.png"
-    _default_label = "Resource Manager"
\ No newline at end of file
+    _default_label = "Resource Manager"
+
+class SecurityCommandCenter(_Security):
+    _icon = "security-command-center.png"
+    _default_label = "Security Command Center"
+
+class SecurityScanner(_Security):
+    _icon = "security-scanner.png"
+    _default_label = "Security Scanner"
\ No newline at end of file
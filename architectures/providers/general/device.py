@@ -6,10 +6,10 @@ class _Device(_General):
     _service_type = "device"
     _icon_dir = "icons/general/device"
 
-class Tablet(_Device):
-    _icon = "tablet.png"
-    _default_label = "Tablet"
-
 class Mobile(_Device):
     _icon = "mobile.png"
-    _default_label = "Mobile"
\ No newline at end of file
+    _default_label = "Mobile"
+
+class Tablet(_Device):
+    _icon = "tablet.png"
+    _default_label = "Tablet"
\ No newline at end of file
@@ -10,13 +10,17 @@ class Android(_Os):
     _icon = "android.png"
     _default_label = "Android"
 
+class Centos(_Os):
+    _icon = "centos.png"
+    _default_label = "Centos"
+
 class Ios(_Os):
     _icon = "ios.png"
     _default_label = "Ios"
 
-class Windows(_Os):
-    _icon = "windows.png"
-    _default_label = "Windows"
+class LinuxGeneral(_Os):
+    _icon = "linux-general.png"
+    _default_label = "Linux General"
 
 class Suse(_Os):
     _icon = "suse.png"
@@ -26,10 +30,6 @@ class Ubuntu(_Os):
     _icon = "ubuntu.png"
     _default_label = "Ubuntu"
 
-class Centos(_Os):
-    _icon = "centos.png"
-    _default_label = "Centos"
-
-class LinuxGeneral(_Os):
-    _icon = "linux-general.png"
-    _default_label = "Linux General"
\ No newline at end of file
+class Windows(_Os):
+    _icon = "windows.png"
+    _default_label = "Windows"
\ No newline at end of file
@@ -6,130 +6,130 @@ class _Programming(_General):
     _service_type = "programming"
     _icon_dir = "icons/general/programming"
 
-class Flask(_Programming):
-    _icon = "flask.png"
-    _default_label = "Flask"
-
-class Erlang(_Programming):
-    _icon = "erlang.png"
-    _default_label = "Erlang"
-
-class Backbone(_Programming):
-    _icon = "backbone.png"
-    _default_label = "Backbone"
-
-class Python(_Programming):
-    _icon = "python.png"
-    _default_label = "Python"
-
-class Ruby(_Programming):
-    _icon = "ruby.png"
-    _default_label = "Ruby"
-
-class Flutter(_Programming):
-    _icon = "flutter.png"
-    _default_label = "Flutter"
-
-class Scala(_Programming):
-    _icon = "scala.png"
-    _default_label = "Scala"
-
 class Angular(_Programming):
     _icon = "angular.png"
     _default_label = "Angular"
 
-class Cpp(_Programming):
-    _icon = "cpp.png"
-    _default_label = "Cpp"
+class Backbone(_Programming):
+    _icon = "backbone.png"
+    _default_label = "Backbone"
 
 class Bash(_Programming):
     _icon = "bash.png"
     _default_label = "Bash"
 
-class Java(_Programming):
-    _icon = "java.png"
-    _default_label = "Java"
-
-class Rust(_Programming):
-    _icon = "rust.png"
-    _default_label = "Rust"
-
-class Vue(_Programming):
-    _icon = "vue.png"
-    _default_label = "Vue"
-
-class Javascript(_Programming):
-    _icon = "javascript.png"
-    _default_label = "Javascript"
-
-class Matlab(_Programming):
-    _icon = "matlab.png"
-    _default_label = "Matlab"
-
-class Spring(_Programming):
-    _icon = "spring.png"
-    _default_label = "Spring"
+class C(_Programming):
+    _icon = "c.png"
+    _default_label = "C"
 
-class Go(_Programming):
-    _icon = "go.png"
-    _default_label = "Go"
+class Cpp(_Programming):
+    _icon = "cpp.png"
+    _default_label = "Cpp"
 
 class Csharp(_Programming):
     _icon = "csharp.png"
     _default_label = "Csharp"
 
+class Dart(_Programming):
+    _icon = "dart.png"
+    _default_label = "Dart"
+
 class Django(_Programming):
     _icon = "django.png"
     _default_label = "Django"
 
+class Elixir(_Programming):
+    _icon = "elixir.png"
+    _default_label = "Elixir"
+
 class Ember(_Programming):
     _icon = "ember.png"
     _default_label = "Ember"
 
-class Swift(_Programming):
-    _icon = "swift.png"
-    _default_label = "Swift"
+class Erlang(_Programming):
+    _icon = "erlang.png"
+    _default_label = "Erlang"
 
-class React(_Programming):
-    _icon = "react.png"
-    _default_label = "React"
+class Flask(_Programming):
+    _icon = "flask.png"
+    _default_label = "Flask"
 
-class Rails(_Programming):
-    _icon = "rails.png"
-    _default_label = "Rails"
+class Flutter(_Programming):
+    _icon = "flutter.png"
+    _default_label = "Flutter"
 
-class C(_Programming):
-    _icon = "c.png"
-    _default_label = "C"
+class Go(_Programming):
+    _icon = "go.png"
+    _default_label = "Go"
 
-class Typescript(_Programming):
-    _icon = "typescript.png"
-    _default_label = "Typescript"
+class Java(_Programming):
+    _icon = "java.png"
+    _default_label = "Java"
+
+class Javascript(_Programming):
+    _icon = "javascript.png"
+    _default_label = "Javascript"
+
+class Kotlin(_Programming):
+    _icon = "kotlin.png"
+    _default_label = "Kotlin"
+
+class Laravel(_Programming):
+    _icon = "laravel.png"
+    _default_label = "Laravel"
+
+class Matlab(_Programming):
+    _icon = "matlab.png"
+    _default_label = "Matlab"
+
+class Nodejs(_Programming):
+    _icon = "nodejs.png"
+    _default_label = "Nodejs"
 
 class Php(_Programming):
     _icon = "php.png"
     _default_label = "Php"
 
-class Dart(_Programming):
-    _icon = "dart.png"
-    _default_label = "Dart"
+class Python(_Programming):
+    _icon = "python.png"
+    _default_label = "Python"
 
 class R(_Programming):
     _icon = "r.png"
     _default_label = "R"
 
-class Laravel(_Programming):
-    _icon = "laravel.png"
-    _default_label = "Laravel"
+class Rails(_Programming):
+    _icon = "rails.png"
+    _default_label = "Rails"
 
-class Kotlin(_Programming):
-    _icon = "kotlin.png"
-    _default_label = "Kotlin"
+class React(_Programming):
+    _icon = "react.png"
+    _default_label = "React"
 
-class Elixir(_Programming):
-    _icon = "elixir.png"
-    _default_label = "Elixir"
+class Ruby(_Programming):
+    _icon = "ruby.png"
+    _default_label = "Ruby"
 
-class Nodejs(_Programming):
-    _icon = "nodejs.png"
-    _default_label = "Nodejs"
\ No newline at end of file
+class Rust(_Programming):
+    _icon = "rust.png"
+    _default_label = "Rust"
+
+class Scala(_Programming):
+    _icon = "scala.png"
+    _default_label = "Scala"
+
+class Spring(_Programming):
+    _icon = "spring.png"
+    _default_label = "Spring"
+
+class Swift(_Programming):
+    _icon = "swift.png"
+    _default_label = "Swift"
+
+class Typescript(_Programming):
+    _icon = "typescript.png"
+    _default_label = "Typescript"
+
+class Vue(_Programming):
+    _icon = "vue.png"
+    _default_label = "Vue"
\ No newline at end of file
@@ -6,10 +6,10 @@ class _Chaos(_Kubernetes):
     _service_type = "chaos"
     _icon_dir = "icons/kubernetes/chaos"
 
-class LitmusChaos(_Chaos):
-    _icon = "litmus-chaos.png"
-    _default_label = "Litmus Chaos"
-
 class ChaosMesh(_Chaos):
     _icon = "chaos-mesh.png"
-    _default_label = "Chaos Mesh"
\ No newline at end of file
+    _default_label = "Chaos Mesh"
+
+class LitmusChaos(_Chaos):
+    _icon = "litmus-chaos.png"
+    _default_label = "Litmus Chaos"
\ No newline at end of file
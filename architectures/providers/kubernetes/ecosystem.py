@@ -6,9 +6,9 @@ class _Ecosystem(_Kubernetes):
     _service_type = "ecosystem"
     _icon_dir = "icons/kubernetes/ecosystem"
 
-class Kustomize(_Ecosystem):
-    _icon = "kustomize.png"
-    _default_label = "Kustomize"
+class ExternalDns(_Ecosystem):
+    _icon = "external-dns.png"
+    _default_label = "External Dns"
 
 class Helm(_Ecosystem):
     _icon = "helm.png"
@@ -18,6 +18,6 @@ class Krew(_Ecosystem):
     _icon = "krew.png"
     _default_label = "Krew"
 
-class ExternalDns(_Ecosystem):
-    _icon = "external-dns.png"
-    _default_label = "External Dns"
\ No newline at end of file
+class Kustomize(_Ecosystem):
+    _icon = "kustomize.png"
+    _default_label = "Kustomize"
\ No newline at end of file
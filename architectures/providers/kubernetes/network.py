@@ -6,10 +6,6 @@ class _Network(_Kubernetes):
     _service_type = "network"
     _icon_dir = "icons/kubernetes/network"
 
-class Netpol(_Network):
-    _icon = "netpol.png"
-    _default_label = "Netpol"
-
 class Ep(_Network):
     _icon = "ep.png"
     _default_label = "Ep"
@@ -18,6 +14,10 @@ class Ing(_Network):
     _icon = "ing.png"
     _default_label = "Ing"
 
+class Netpol(_Network):
+    _icon = "netpol.png"
+    _default_label = "Netpol"
+
 class Svc(_Network):
     _icon = "svc.png"
     _default_label = "Svc"
\ No newline at end of file
@@ -6,10 +6,10 @@ class _Others(_Kubernetes):
     _service_type = "others"
     _icon_dir = "icons/kubernetes/others"
 
-class Psp(_Others):
-    _icon = "psp.png"
-    _default_label = "Psp"
-
 class Crd(_Others):
     _icon = "crd.png"
-    _default_label = "Crd"
\ No newline at end of file
+    _default_label = "Crd"
+
+class Psp(_Others):
+    _icon = "psp.png"
+    _default_label = "Psp"
\ No newline at end of file
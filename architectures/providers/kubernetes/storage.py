@@ -6,18 +6,18 @@ class _Storage(_Kubernetes):
     _service_type = "storage"
     _icon_dir = "icons/kubernetes/storage"
 
-class Vol(_Storage):
-    _icon = "vol.png"
-    _default_label = "Vol"
-
-class Sc(_Storage):
-    _icon = "sc.png"
-    _default_label = "Sc"
+class Pv(_Storage):
+    _icon = "pv.png"
+    _default_label = "Pv"
 
 class Pvc(_Storage):
     _icon = "pvc.png"
     _default_label = "Pvc"
 
-class Pv(_Storage):
-    _icon = "pv.png"
-    _default_label = "Pv"
\ No newline at end of file
+class Sc(_Storage):
+    _icon = "sc.png"
+    _default_label = "Sc"
+
+class Vol(_Storage):
+    _icon = "vol.png"
+    _default_label = "Vol"
\ No newline at end of file
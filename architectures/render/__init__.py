@@ -0,0 +1,814 @@
+"""
+This module contains the functions used to run Graphviz on generated DOT source.
+
+Available Classes:
+- RenderCache
+
+Available Functions:
+- render_lines
+- render_lines_async
+- pipe_lines
+- pipe_lines_async
+- copy_file
+- write_lines
+- read_layout
+- inline_svg_images
+- inline_svg_file
+
+Details for each can be found in the docstrings for the respective class or function.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+from typing import Any, Iterable, Union
+
+from graphviz import ExecutableNotFound
+
+from architectures.icons import _atomic_write, _get_cache_directory, _temp_path
+
+# The amount of DOT source written to an asyncio subprocess at a time
+_ASYNC_CHUNK_SIZE = 65536
+
+# Attributes that only change how a laid out graph is drawn, never where anything is placed
+COSMETIC_ATTRIBUTES = frozenset((
+    "bgcolor", "class", "color", "colorscheme", "fillcolor", "fontcolor", "gradientangle",
+    "href", "labelfontcolor", "pencolor", "penwidth", "style", "target", "tooltip", "url",
+))
+
+# Image elements and their attributes as written by the Graphviz SVG renderer
+_SVG_IMAGE_PATTERN = re.compile(r"<image\b([^>]*?)/?>(?:\s*</image>)?")
+_SVG_ATTRIBUTE_PATTERN = re.compile(r'([\w:-]+)="([^"]*)"')
+_SVG_TAG_PATTERN = re.compile(r"<svg\b[^>]*>")
+
+# Attributes Graphviz adds when laying out a graph, which are kept to render from the layout
+_LAYOUT_ATTRIBUTES = ("bb", "pos", "lp", "lwidth", "lheight", "width", "height", "xlp", "head_lp", "tail_lp")
+
+
+def render_lines(lines: Iterable[str], output_file: Union[str, list],
+                 output_file_format: Union[str, list] = "png",
+                 engine: str = "dot",
+                 source_file: Union[None, str] = None,
+                 timeout: Union[None, float] = None,
+                 options: Iterable[str] = ()
+                 ) -> Union[str, list]:
+    """Stream DOT source into a Graphviz layout process and write the output files.
+
+    The lines are written to the process as they are generated so the full source
+    never has to be held in memory or written to disk.  When several formats are
+    given, the graph is laid out once and every output is written from that layout.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of DOT source
+    output_file : str, list
+        The path, or list of paths, of the files to create
+    output_file_format : str, list
+        The Graphviz output format, or a list with one format per output file (defaults to png)
+    engine : str
+        The Graphviz layout engine (defaults to dot)
+    source_file : str
+        An optional path to also write the DOT source to
+    timeout : float
+        The number of seconds to wait for Graphviz before killing it (defaults to no limit)
+    options : Iterable[str]
+        Extra Graphviz command line options, such as -n2 to use the positions in the source
+
+    Returns
+    -------
+    str, list
+        The path, or list of paths, of the output files
+    """
+    output_files = [output_file] if isinstance(output_file, str) else list(output_file)
+    output_file_formats = [output_file_format] if isinstance(output_file_format, str) else list(output_file_format)
+    if len(output_files) != len(output_file_formats):
+        raise ValueError("One output file is required for each output file format.")
+
+    cmd, paths = _output_command(output_files, output_file_formats, engine, source_file, options)
+    try:
+        _run(cmd, lines, source_file=paths[-1][0] if source_file else None, timeout=timeout)
+        _replace_paths(paths)
+    finally:
+        _remove_paths(paths)
+
+    if isinstance(output_file, str):
+        return output_file
+    return output_files
+
+
+def pipe_lines(lines: Iterable[str], output_file_format: str = "png", engine: str = "dot",
+               timeout: Union[None, float] = None
+               ) -> bytes:
+    """Stream DOT source into a Graphviz layout process and return the rendered output.
+
+    Nothing is written to disk, the source and output are passed over pipes.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of DOT source
+    output_file_format : str
+        The Graphviz output format (defaults to png)
+    engine : str
+        The Graphviz layout engine (defaults to dot)
+    timeout : float
+        The number of seconds to wait for Graphviz before killing it (defaults to no limit)
+
+    Returns
+    -------
+    bytes
+        The rendered output
+    """
+    cmd = [engine, f"-T{output_file_format}"]
+    return _run(cmd, lines, capture_output=True, timeout=timeout)
+
+
+async def render_lines_async(lines: Iterable[str], output_file: Union[str, list],
+                             output_file_format: Union[str, list] = "png",
+                             engine: str = "dot",
+                             source_file: Union[None, str] = None,
+                             timeout: Union[None, float] = None,
+                             options: Iterable[str] = ()
+                             ) -> Union[str, list]:
+    """Asynchronously stream DOT source into a Graphviz layout process and write the output files.
+
+    This works like render_lines without blocking the event loop while Graphviz runs.  If the
+    timeout expires or the task is cancelled, the layout process is killed and no output files
+    are written.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of DOT source
+    output_file : str, list
+        The path, or list of paths, of the files to create
+    output_file_format : str, list
+        The Graphviz output format, or a list with one format per output file (defaults to png)
+    engine : str
+        The Graphviz layout engine (defaults to dot)
+    source_file : str
+        An optional path to also write the DOT source to
+    timeout : float
+        The number of seconds to wait for Graphviz before giving up (defaults to no limit)
+    options : Iterable[str]
+        Extra Graphviz command line options, such as -n2 to use the positions in the source
+
+    Returns
+    -------
+    str, list
+        The path, or list of paths, of the output files
+    """
+    output_files = [output_file] if isinstance(output_file, str) else list(output_file)
+    output_file_formats = [output_file_format] if isinstance(output_file_format, str) else list(output_file_format)
+    if len(output_files) != len(output_file_formats):
+        raise ValueError("One output file is required for each output file format.")
+
+    cmd, paths = _output_command(output_files, output_file_formats, engine, source_file, options)
+    try:
+        await asyncio.wait_for(_run_async(cmd, lines, source_file=paths[-1][0] if source_file else None), timeout)
+        _replace_paths(paths)
+    finally:
+        _remove_paths(paths)
+
+    if isinstance(output_file, str):
+        return output_file
+    return output_files
+
+
+async def pipe_lines_async(lines: Iterable[str], output_file_format: str = "png",
+                           engine: str = "dot",
+                           timeout: Union[None, float] = None
+                           ) -> bytes:
+    """Asynchronously stream DOT source into a Graphviz layout process and return the rendered output.
+
+    This works like pipe_lines without blocking the event loop while Graphviz runs.  If the
+    timeout expires or the task is cancelled, the layout process is killed.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of DOT source
+    output_file_format : str
+        The Graphviz output format (defaults to png)
+    engine : str
+        The Graphviz layout engine (defaults to dot)
+    timeout : float
+        The number of seconds to wait for Graphviz before giving up (defaults to no limit)
+
+    Returns
+    -------
+    bytes
+        The rendered output
+    """
+    cmd = [engine, f"-T{output_file_format}"]
+    return await asyncio.wait_for(_run_async(cmd, lines, capture_output=True), timeout)
+
+
+def copy_file(source_file: str, output_file: str) -> str:
+    """Copy a file by writing a temporary file and renaming it into place.
+
+    Parameters
+    ----------
+    source_file : str
+        The path of the file to copy
+    output_file : str
+        The path of the copy
+
+    Returns
+    -------
+    str
+        The path of the copy
+    """
+    with open(source_file, "rb") as source, _atomic_write(output_file) as f:
+        shutil.copyfileobj(source, f)
+
+    return output_file
+
+
+def write_lines(lines: Iterable[str], output_file: str) -> str:
+    """Write lines of text by writing a temporary file and renaming it into place.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines to write
+    output_file : str
+        The path of the file to create
+
+    Returns
+    -------
+    str
+        The path of the file
+    """
+    with _atomic_write(output_file, "w") as f:
+        f.writelines(lines)
+
+    return output_file
+
+
+def read_layout(data: bytes) -> dict:
+    """Extract the positions from a graph laid out by Graphviz in the json format.
+
+    Parameters
+    ----------
+    data : bytes
+        The Graphviz json output
+
+    Returns
+    -------
+    dict
+        The layout attributes of the graph, and of each cluster and node by name and each edge by id
+    """
+    graph = json.loads(data)
+    layout = {
+        "graph": {key: graph[key] for key in _LAYOUT_ATTRIBUTES if key in graph},
+        "clusters": {},
+        "nodes": {},
+        "edges": {},
+    }
+
+    # Clusters have a bounding box and nodes have a position, other subgraphs have neither
+    for obj in graph.get("objects", []):
+        attrs = {key: obj[key] for key in _LAYOUT_ATTRIBUTES if key in obj}
+        if "bb" in obj:
+            layout["clusters"][obj["name"]] = attrs
+        elif "pos" in obj:
+            layout["nodes"][obj["name"]] = attrs
+    for edge in graph.get("edges", []):
+        if "id" in edge:
+            layout["edges"][edge["id"]] = {key: edge[key] for key in _LAYOUT_ATTRIBUTES if key in edge}
+
+    return layout
+
+
+def inline_svg_images(svg: str) -> str:
+    """Embed the images referenced by an SVG document so it doesn't depend on any other files.
+
+    Each distinct image is embedded once as a symbol and every image element that used it is
+    replaced with a reference to the symbol, so the size of the document grows with the number
+    of distinct icons rather than the number of nodes.  Images that can't be read are left as
+    they are.
+
+    Parameters
+    ----------
+    svg : str
+        The SVG document
+
+    Returns
+    -------
+    str
+        The SVG document with its images embedded
+    """
+    svg_tag = _SVG_TAG_PATTERN.search(svg)
+    if not svg_tag:
+        return svg
+    href_name = "xlink:href" if "xmlns:xlink" in svg_tag.group(0) else "href"
+
+    symbols = {}
+    definitions = []
+
+    def replace(match: re.Match) -> str:
+        attrs = dict(_SVG_ATTRIBUTE_PATTERN.findall(match.group(1)))
+        href = attrs.pop("xlink:href", None) or attrs.pop("href", None)
+        if not href or href.startswith(("data:", "#", "http:", "https:")):
+            return match.group(0)
+
+        path = os.path.abspath(html.unescape(href[len("file://"):] if href.startswith("file://") else href))
+        preserve_aspect_ratio = attrs.pop("preserveAspectRatio", "xMidYMid meet")
+        key = (path, preserve_aspect_ratio)
+        if key not in symbols:
+            symbol_id = f"image{len(symbols)}"
+            symbol = _svg_symbol(path, symbol_id, preserve_aspect_ratio, href_name)
+            if symbol is None:
+                return match.group(0)
+            symbols[key] = symbol_id
+            definitions.append(symbol)
+
+        attrs = "".join(f' {name}="{value}"' for name, value in attrs.items())
+        return f'<use {href_name}="#{symbols[key]}"{attrs}/>'
+
+    svg = _SVG_IMAGE_PATTERN.sub(replace, svg)
+    if not definitions:
+        return svg
+
+    end = svg_tag.end()
+    return svg[:end] + "\n<defs>\n" + "\n".join(definitions) + "\n</defs>" + svg[end:]
+
+
+def inline_svg_file(output_file: str) -> str:
+    """Embed the images referenced by an SVG file, rewriting it in place.
+
+    Parameters
+    ----------
+    output_file : str
+        The path of the SVG file
+
+    Returns
+    -------
+    str
+        The path of the file
+    """
+    with open(output_file, "r", encoding="utf-8") as f:
+        svg = f.read()
+    inlined = inline_svg_images(svg)
+    if inlined != svg:
+        write_lines([inlined], output_file)
+    return output_file
+
+
+def _svg_symbol(path: str, symbol_id: str, preserve_aspect_ratio: str, href_name: str) -> Union[None, str]:
+    """
+    Return a symbol element embedding a PNG image, or None if it can't be read or isn't a PNG.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    size = _png_size(data)
+    if size is None:
+        return None
+
+    uri = f"data:image/png;base64,{base64.b64encode(data).decode('ascii')}"
+    width, height = size
+    return (f'<symbol id="{symbol_id}" viewBox="0 0 {width} {height}" preserveAspectRatio="{preserve_aspect_ratio}">'
+            f'<image width="{width}" height="{height}" {href_name}="{uri}"/></symbol>')
+
+
+def _png_size(data: bytes) -> Union[None, tuple]:
+    """
+    Return the width and height of a PNG image from its header, or None if it isn't a PNG.
+    """
+    if data[:8] != b"\x89PNG\r\n\x1a\n" or data[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", data[16:24])
+
+
+def _output_command(output_files: list, output_file_formats: list, engine: str,
+                    source_file: Union[None, str] = None,
+                    options: Iterable[str] = ()
+                    ) -> tuple:
+    """
+    Return a Graphviz command that writes each format to a temporary file, along with
+    the (temporary path, final path) pairs, ending with the source file if one is given.
+
+    Output is written next to the final files and moved into place once rendering succeeds,
+    so concurrent renders never see or clobber partial files.
+    """
+    paths = [(_temp_path(current_file), current_file) for current_file in output_files]
+    if source_file:
+        paths.append((_temp_path(source_file), source_file))
+
+    cmd = [engine, *options]
+    for current_format, (temp_file, current_file) in zip(output_file_formats, paths):
+        cmd += [f"-T{current_format}", f"-o{temp_file}"]
+
+    return cmd, paths
+
+
+def _replace_paths(paths: list) -> None:
+    """
+    Move temporary files into place.
+    """
+    for temp_file, current_file in paths:
+        os.replace(temp_file, current_file)
+
+
+def _remove_paths(paths: list) -> None:
+    """
+    Remove any temporary files that were not moved into place.
+    """
+    for temp_file, current_file in paths:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def _run(cmd: list, lines: Iterable[str],
+         source_file: Union[None, str] = None,
+         capture_output: bool = False,
+         timeout: Union[None, float] = None
+         ) -> Union[None, bytes]:
+    """
+    Run a Graphviz command, writing the lines of DOT source to its stdin.
+
+    If the timeout expires the process is killed and subprocess.TimeoutExpired is raised.
+    """
+    # Send errors to a file rather than a pipe so a chatty layout can't block on a full buffer
+    with tempfile.TemporaryFile() as stderr:
+        stdout = subprocess.PIPE if capture_output else subprocess.DEVNULL
+        try:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=stdout, stderr=stderr)
+        except FileNotFoundError as e:
+            raise ExecutableNotFound(cmd) from e
+
+        # Kill the process if it runs too long, which also unblocks any pending pipe writes
+        expired = threading.Event()
+
+        def kill() -> None:
+            expired.set()
+            proc.kill()
+
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, kill)
+            timer.daemon = True
+            timer.start()
+
+        # Read the output while the source is being written so neither pipe fills up
+        output = []
+        if capture_output:
+            reader = threading.Thread(target=lambda: output.append(proc.stdout.read()), daemon=True)
+            reader.start()
+
+        source = open(source_file, "w", encoding="utf-8") if source_file else None
+        try:
+            for line in lines:
+                proc.stdin.write(line.encode("utf-8"))
+                if source:
+                    source.write(line)
+        except BrokenPipeError:
+            # The process exited early, the error is reported below
+            pass
+        except BaseException:
+            if timer:
+                timer.cancel()
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            if source:
+                source.close()
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        if capture_output:
+            reader.join()
+            proc.stdout.close()
+
+        returncode = proc.wait()
+        if timer:
+            timer.cancel()
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if returncode:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr.read().decode("utf-8", "replace"))
+
+    if capture_output:
+        return output[0] if output else b""
+    return None
+
+
+async def _run_async(cmd: list, lines: Iterable[str],
+                     source_file: Union[None, str] = None,
+                     capture_output: bool = False
+                     ) -> Union[None, bytes]:
+    """
+    Run a Graphviz command as an asyncio subprocess, writing the lines of DOT source to its stdin.
+    """
+    stdout = asyncio.subprocess.PIPE if capture_output else asyncio.subprocess.DEVNULL
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=asyncio.subprocess.PIPE, stdout=stdout, stderr=asyncio.subprocess.PIPE
+        )
+    except FileNotFoundError as e:
+        raise ExecutableNotFound(cmd) from e
+
+    async def write() -> None:
+        source = open(source_file, "w", encoding="utf-8") if source_file else None
+        try:
+            # Write in chunks and wait for the pipe to drain so memory use stays flat
+            chunk = []
+            chunk_size = 0
+            for line in lines:
+                chunk.append(line)
+                chunk_size += len(line)
+                if chunk_size >= _ASYNC_CHUNK_SIZE:
+                    await _write_chunk(proc, chunk, source)
+                    chunk = []
+                    chunk_size = 0
+            await _write_chunk(proc, chunk, source)
+        except (BrokenPipeError, ConnectionResetError):
+            # The process exited early, the error is reported below
+            pass
+        finally:
+            if source:
+                source.close()
+            proc.stdin.close()
+
+    async def read(stream: Union[None, asyncio.StreamReader]) -> bytes:
+        if stream is None:
+            return b""
+        return await stream.read()
+
+    try:
+        _, output, errors = await asyncio.gather(write(), read(proc.stdout), read(proc.stderr))
+        returncode = await proc.wait()
+    except BaseException:
+        # Cancelled, timed out or failed while writing, so don't leave the process running
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=errors.decode("utf-8", "replace"))
+
+    if capture_output:
+        return output
+    return None
+
+
+async def _write_chunk(proc: asyncio.subprocess.Process, chunk: list, source: Any) -> None:
+    """
+    Write a chunk of DOT source to a process and optionally a source file.
+    """
+    text = "".join(chunk)
+    proc.stdin.write(text.encode("utf-8"))
+    if source:
+        source.write(text)
+    await proc.stdin.drain()
+
+
+class RenderCache():
+    """
+    An on-disk cache of rendered output keyed by the content that produced it.
+
+    Entries are keyed by a hash of the DOT source, output format, layout engine and the
+    contents of any referenced files such as icons.  When the cache grows beyond its size
+    limit the least recently used entries are removed, down to a fraction of the limit so the
+    cache directory is only scanned again once enough new entries have been written.
+
+    When layouts are cached, the positions Graphviz computes are also stored, keyed by the
+    source without its cosmetic attributes, so recolored variants of a graph such as light
+    and dark themes are drawn from the cached layout instead of being laid out again.
+    """
+
+    # Bump when the key layout changes so stale entries are never reused
+    _key_version = "1"
+
+    # Environment variables used to turn on the cache without changing diagram scripts
+    _directory_variable = "ARCHITECTURES_RENDER_CACHE"
+    _max_size_variable = "ARCHITECTURES_RENDER_CACHE_SIZE"
+    _layouts_variable = "ARCHITECTURES_RENDER_CACHE_LAYOUTS"
+
+    # The fraction of the size limit the cache is reduced to when it is full
+    _evict_ratio = 0.9
+
+    def __init__(self, directory: Union[None, str] = None, max_size: int = 256 * 1024 * 1024,
+                 layouts: bool = False
+                 ) -> None:
+        """
+        :param str directory: The cache directory (defaults to architectures/render under the user cache directory).
+        :param int max_size: The maximum total size of cached files in bytes.
+        :param bool layouts: Flag used to determine whether or not graph layouts are cached so graphs that only differ in colors and styles are not laid out again.
+        """
+        if directory is None:
+            directory = _get_cache_directory("render")
+
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_size = max_size
+        self.layouts = layouts
+
+        # File digests memoized by path, modification time and size
+        self._file_digests = {}
+
+        # The total size of the cache, counted when it is first scanned and kept up to date by every write
+        self._size = None
+        self._size_lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> Union[None, RenderCache]:
+        """
+        Return a cache configured from the environment, or None if it is not turned on.
+        """
+        directory = os.environ.get(cls._directory_variable)
+        if not directory:
+            return None
+
+        kwargs = {}
+        max_size = os.environ.get(cls._max_size_variable)
+        if max_size:
+            kwargs["max_size"] = int(max_size)
+        if os.environ.get(cls._layouts_variable, "false").lower() not in ("0", "false", "no"):
+            kwargs["layouts"] = True
+        return cls(directory, **kwargs)
+
+    def key(self, lines: Iterable[str], output_file_format: str, engine: str = "dot", files: Iterable[str] = ()) -> str:
+        """
+        Return the cache key for rendering the DOT source with the given settings.
+        """
+        return self.keys(lines, [output_file_format], engine, files)[0]
+
+    def keys(self, lines: Iterable[str], output_file_formats: list, engine: str = "dot", files: Iterable[str] = ()) -> list:
+        """
+        Return the cache keys for rendering the DOT source to each format, reading the source once.
+        """
+        digest = hashlib.sha256()
+        for line in lines:
+            digest.update(line.encode("utf-8"))
+        for path in sorted(set(files)):
+            digest.update(f"\0{path}\0{self._file_digest(path)}".encode("utf-8"))
+        source_digest = digest.hexdigest()
+
+        return [
+            hashlib.sha256(f"{self._key_version}\0{output_file_format}\0{engine}\0{source_digest}".encode("utf-8")).hexdigest()
+            for output_file_format in output_file_formats
+        ]
+
+    def get(self, key: str, output_file: str) -> bool:
+        """
+        Copy a cached entry to the output file, returning whether or not it was found.
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return False
+        try:
+            copy_file(path, output_file)
+        except FileNotFoundError:
+            # The entry was evicted by another process
+            return False
+
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return True
+
+    def put(self, key: str, output_file: str) -> None:
+        """
+        Add a rendered output file to the cache and evict old entries if needed.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replaced_size = self._get_size(path)
+        copy_file(output_file, path)
+        self._add_size(self._get_size(path) - replaced_size)
+
+    def read(self, key: str) -> Union[None, bytes]:
+        """
+        Return the contents of a cached entry, or None if it was not found.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data
+
+    def write(self, key: str, data: bytes) -> None:
+        """
+        Add rendered output to the cache and evict old entries if needed.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replaced_size = self._get_size(path)
+        with _atomic_write(path) as f:
+            f.write(data)
+        self._add_size(len(data) - replaced_size)
+
+    def evict(self, max_size: Union[None, int] = None) -> None:
+        """
+        Remove the least recently used entries until the cache fits its size limit.
+
+        :param int max_size: The size to reduce the cache to (defaults to the size limit).
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        entries = []
+        total_size = 0
+        for root, dirs, files in os.walk(self.directory):
+            for file in files:
+                if file.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+
+        for mtime, size, path in sorted(entries):
+            if total_size <= max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+        with self._size_lock:
+            self._size = total_size
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
+        with self._size_lock:
+            self._size = 0
+
+    def _add_size(self, size: int) -> None:
+        """
+        Count the bytes written to the cache, scanning and evicting entries only when the total is unknown or over the limit.
+
+        Entries written by other processes are only counted by the next scan.
+        """
+        with self._size_lock:
+            if self._size is None:
+                max_size = self.max_size
+            else:
+                self._size += size
+                if self._size <= self.max_size:
+                    return
+                max_size = int(self.max_size * self._evict_ratio)
+        self.evict(max_size)
+
+    @staticmethod
+    def _get_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _file_digest(self, path: str) -> str:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return ""
+
+        memo_key = (path, stat.st_mtime_ns, stat.st_size)
+        if memo_key not in self._file_digests:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(65536), b""):
+                    digest.update(chunk)
+            self._file_digests[memo_key] = digest.hexdigest()
+        return self._file_digests[memo_key]
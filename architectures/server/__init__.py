@@ -0,0 +1,630 @@
+"""
+This module contains a local render service for running architectures as a shared service.
+
+Available Classes:
+- RenderQueueFull
+- RenderJob
+- RenderService
+- RenderServer
+
+Available Functions:
+- build_graph
+- serve
+
+Details for each can be found in the docstrings for the respective class or function.
+"""
+from __future__ import annotations
+
+import collections
+import itertools
+import json
+import os
+import queue
+import re
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, Union
+from urllib.parse import parse_qs, urlsplit
+
+from architectures import themes
+from architectures.catalog import lookup
+from architectures.core import Cluster, Edge, Graph, Node
+from architectures.render import RenderCache, pipe_lines
+
+# Only Graphviz layout engines may be run, since the engine is the command being executed
+ENGINES = ("dot", "neato", "fdp", "sfdp", "circo", "twopi", "osage", "patchwork")
+
+# Content types for common output formats, anything else is sent as binary data
+_CONTENT_TYPES = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "pdf": "application/pdf",
+    "json": "application/json",
+    "dot": "text/vnd.graphviz",
+    "gv": "text/vnd.graphviz",
+    "canon": "text/vnd.graphviz",
+    "plain": "text/plain",
+}
+
+# The number of recent jobs used to calculate latency percentiles
+_LATENCY_WINDOW = 1024
+
+# The keys a diagram specification may have
+_SPEC_KEYS = frozenset({"name", "theme", "attrs", "nodes", "clusters", "edges"})
+
+# Attributes that make Graphviz read local files, which a remote client must never choose
+_FILE_ATTRIBUTES = frozenset({"image", "imagepath", "shapefile", "fontpath"})
+
+_ATTRIBUTE_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def build_graph(spec: dict) -> Graph:
+    """Build a graph from a JSON-style diagram specification.
+
+    The specification describes the graph with plain data so diagrams can be rendered
+    without running any Python.  Nodes may be a label or a dict with a label, an optional
+    provider service such as "aws.compute.Batch", an optional id used to refer to the node
+    from edges, and any other node attributes.  Clusters are dicts with a label, optional
+    id, and nested nodes and clusters.  Edges are dicts with start and end ids (or labels),
+    or lists of them, and any other edge attributes.
+
+    Parameters
+    ----------
+    spec : dict
+        The diagram specification with the optional keys name, theme, attrs, nodes, clusters and edges
+
+    Returns
+    -------
+    Graph
+        The graph, which is not rendered
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("A diagram specification must be an object.")
+    unknown_keys = set(spec) - _SPEC_KEYS
+    if unknown_keys:
+        raise ValueError(f"Unknown diagram specification keys: {', '.join(sorted(map(str, unknown_keys)))}")
+
+    theme = spec.get("theme")
+    if theme is not None:
+        theme_class = getattr(themes, str(theme), None)
+        if not (isinstance(theme_class, type) and issubclass(theme_class, themes._Theme)):
+            raise ValueError(f"Unknown theme: {theme}")
+        theme = theme_class()
+
+    name = spec.get("name", "My Architecture")
+    if not isinstance(name, str):
+        raise ValueError("The diagram name must be a string.")
+
+    # Attributes only ever set DOT graph attributes, never the options of the graph object itself
+    graph = Graph(name, theme=theme, show=False, render_on_exit=False)
+    graph.graph_attr.update(_check_attrs(spec.get("attrs", {}), "graph"))
+
+    objects = {}
+    with graph:
+        _add_nodes(spec.get("nodes", []), objects)
+        _add_clusters(spec.get("clusters", []), objects)
+        for edge in spec.get("edges", []):
+            edge = dict(edge)
+            start = _get_objects(edge.pop("start", None), objects)
+            end = _get_objects(edge.pop("end", None), objects)
+            Edge(start, end, **_check_attrs(edge, "edge"))
+
+    return graph
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, workers: Union[None, int] = None,
+          max_queue: int = 64, timeout: Union[None, float] = 60.0,
+          cache: Union[None, RenderCache] = None, allow_source: bool = False
+          ) -> None:
+    """Run a render server until interrupted.
+
+    Parameters
+    ----------
+    host : str
+        The address to listen on (defaults to 127.0.0.1)
+    port : int
+        The port to listen on (defaults to 8000)
+    workers : int
+        The number of renders to run at once (defaults to the number of CPUs)
+    max_queue : int
+        The number of jobs that can wait for a worker before new jobs are rejected (defaults to 64)
+    timeout : float
+        The default number of seconds a job may take from submission to completion (defaults to 60)
+    cache : RenderCache
+        The cache shared by every job (defaults to the ARCHITECTURES_RENDER_CACHE environment variable)
+    allow_source : bool
+        Accept raw DOT source, which can read files on the server, so only use it for trusted clients (defaults to False)
+    """
+    with RenderService(workers, max_queue=max_queue, timeout=timeout, cache=cache) as service:
+        with RenderServer((host, port), service, allow_source=allow_source) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+class RenderQueueFull(Exception):
+    """
+    Raised when a job is submitted to a render service whose queue is full.
+    """
+
+
+class RenderJob():
+    """
+    A request to render DOT source, tracked from submission to completion.
+    """
+
+    def __init__(self, source: str, output_file_format: str = "png", engine: str = "dot",
+                 priority: int = 0, timeout: Union[None, float] = None,
+                 files: Iterable[str] = ()
+                 ) -> None:
+        """
+        :param str source: The DOT source.
+        :param str output_file_format: The Graphviz output format.
+        :param str engine: The Graphviz layout engine.
+        :param int priority: Jobs with a higher priority are started first.
+        :param float timeout: The number of seconds the job may take from submission to completion.
+        :param files: The paths of files referenced by the source, such as node icons.
+        """
+        self.source = source
+        self.output_file_format = output_file_format
+        self.engine = engine
+        self.priority = priority
+        self.timeout = timeout
+        self.files = list(files)
+
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.cache_hit = False
+
+        self._done = threading.Event()
+        self._output = None
+        self._error = None
+
+    @property
+    def deadline(self) -> Union[None, float]:
+        """
+        The monotonic time the job must finish by.
+        """
+        if self.timeout is None:
+            return None
+        return self.submitted + self.timeout
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether or not the job has finished.
+        """
+        return self._done.is_set()
+
+    def result(self, timeout: Union[None, float] = None) -> bytes:
+        """
+        Wait for the job to finish and return the rendered output, raising its error if it failed.
+
+        :param float timeout: The number of seconds to wait (defaults to no limit).
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError("The render job did not finish in time.")
+        if self._error is not None:
+            raise self._error
+        return self._output
+
+    def _finish(self, output: Union[None, bytes] = None, error: Union[None, BaseException] = None) -> None:
+        self.finished = time.monotonic()
+        self._output = output
+        self._error = error
+        self._done.set()
+
+
+class RenderService():
+    """
+    Render DOT source with a bounded pool of worker threads.
+
+    Jobs wait in a priority queue with a size limit, so bursts of requests are either
+    queued or rejected straight away rather than starting an unbounded number of layout
+    processes.  Each worker runs Graphviz as a subprocess, so threads render in parallel.
+    """
+
+    def __init__(self, workers: Union[None, int] = None, max_queue: int = 64,
+                 timeout: Union[None, float] = 60.0,
+                 cache: Union[None, RenderCache] = None
+                 ) -> None:
+        """
+        :param int workers: The number of renders to run at once (defaults to the number of CPUs).
+        :param int max_queue: The number of jobs that can wait for a worker before new jobs are rejected.
+        :param float timeout: The default number of seconds a job may take from submission to completion.
+        :param RenderCache cache: The cache shared by every job (defaults to the ARCHITECTURES_RENDER_CACHE environment variable).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.cache = RenderCache.from_environment() if cache is None else cache
+
+        self._queue = queue.PriorityQueue(maxsize=max_queue)
+        self._sequence = itertools.count()
+        self._threads = []
+
+        # Counters are updated by every worker so they are guarded by a lock
+        self._lock = threading.Lock()
+        self._started = None
+        self._active = 0
+        self._counters = dict.fromkeys(
+            ("submitted", "rejected", "completed", "failed", "timed_out", "cache_hits"), 0
+        )
+        self._latencies = collections.deque(maxlen=_LATENCY_WINDOW)
+
+    def __enter__(self) -> RenderService:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Start the worker threads.
+        """
+        if self._threads:
+            return
+        self._started = time.monotonic()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"architectures-render-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """
+        Finish the queued jobs and stop the worker threads.
+        """
+        # Sentinels sort after every job so the queue drains first
+        for thread in self._threads:
+            self._queue.put((float("inf"), next(self._sequence), None))
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, source: str, output_file_format: str = "png", engine: str = "dot",
+               priority: int = 0, timeout: Union[None, float] = None,
+               files: Iterable[str] = ()
+               ) -> RenderJob:
+        """
+        Queue DOT source to be rendered and return the job without waiting for it.
+
+        Raises RenderQueueFull if the queue is full.
+
+        :param str source: The DOT source.
+        :param str output_file_format: The Graphviz output format.
+        :param str engine: The Graphviz layout engine.
+        :param int priority: Jobs with a higher priority are started first.
+        :param float timeout: The number of seconds the job may take from submission to completion (defaults to the service timeout).
+        :param files: The paths of files referenced by the source, such as node icons.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown layout engine: {engine}")
+        if not output_file_format or not all(c.isalnum() or c in ":_-" for c in output_file_format):
+            raise ValueError(f"Invalid output format: {output_file_format}")
+
+        job = RenderJob(source, output_file_format, engine, priority,
+                        self.timeout if timeout is None else timeout, files)
+        try:
+            self._queue.put_nowait((-priority, next(self._sequence), job))
+        except queue.Full:
+            self._count("rejected")
+            raise RenderQueueFull(f"The render queue is full ({self.max_queue} jobs).") from None
+        self._count("submitted")
+        return job
+
+    def submit_graph(self, graph: Graph, output_file_format: Union[None, str] = None,
+                     priority: int = 0, timeout: Union[None, float] = None
+                     ) -> RenderJob:
+        """
+        Queue a graph to be rendered and return the job without waiting for it.
+
+        :param Graph graph: The graph.
+        :param str output_file_format: The Graphviz output format (defaults to the first output file format of the graph).
+        :param int priority: Jobs with a higher priority are started first.
+        :param float timeout: The number of seconds the job may take from submission to completion (defaults to the service timeout).
+        """
+        if output_file_format is None:
+            output_file_format = graph.output_file_formats[0]
+        return self.submit(graph.source, output_file_format, graph.engine, priority, timeout,
+                           graph._iter_files())
+
+    def render(self, source: str, output_file_format: str = "png", engine: str = "dot",
+               priority: int = 0, timeout: Union[None, float] = None
+               ) -> bytes:
+        """
+        Render DOT source and wait for the output.
+
+        :param str source: The DOT source.
+        :param str output_file_format: The Graphviz output format.
+        :param str engine: The Graphviz layout engine.
+        :param int priority: Jobs with a higher priority are started first.
+        :param float timeout: The number of seconds the job may take from submission to completion (defaults to the service timeout).
+        """
+        return self.submit(source, output_file_format, engine, priority, timeout).result()
+
+    def stats(self) -> dict:
+        """
+        Return counters describing the throughput and latency of the service.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            latencies = sorted(self._latencies)
+            active = self._active
+
+        uptime = time.monotonic() - self._started if self._started else 0.0
+        stats = {
+            "workers": self.workers,
+            "active": active,
+            "queued": self._queue.qsize(),
+            "max_queue": self.max_queue,
+            "uptime": round(uptime, 4),
+            "throughput": round(counters["completed"] / uptime, 4) if uptime else 0.0,
+            **counters,
+            "latency": {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0},
+        }
+        if latencies:
+            stats["latency"] = {
+                "mean": round(sum(latencies) / len(latencies), 4),
+                "p50": round(latencies[int(0.5 * (len(latencies) - 1))], 4),
+                "p95": round(latencies[int(0.95 * (len(latencies) - 1))], 4),
+                "max": round(latencies[-1], 4),
+            }
+        return stats
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _work(self) -> None:
+        while True:
+            _, _, job = self._queue.get()
+            if job is None:
+                return
+
+            with self._lock:
+                self._active += 1
+            try:
+                self._run(job)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    if job.finished is not None:
+                        self._latencies.append(job.finished - job.submitted)
+
+    def _run(self, job: RenderJob) -> None:
+        job.started = time.monotonic()
+
+        remaining = None
+        if job.deadline is not None:
+            remaining = job.deadline - job.started
+            if remaining <= 0:
+                self._count("timed_out")
+                job._finish(error=TimeoutError("The render job timed out while queued."))
+                return
+
+        try:
+            key = None
+            if self.cache:
+                key = self.cache.key([job.source], job.output_file_format, job.engine, job.files)
+                output = self.cache.read(key)
+                if output is not None:
+                    job.cache_hit = True
+                    self._count("cache_hits")
+                    self._count("completed")
+                    job._finish(output)
+                    return
+
+            output = pipe_lines([job.source], job.output_file_format, engine=job.engine, timeout=remaining)
+            if key:
+                self.cache.write(key, output)
+        except subprocess.TimeoutExpired:
+            self._count("timed_out")
+            job._finish(error=TimeoutError("The render job timed out while rendering."))
+        except Exception as e:
+            self._count("failed")
+            job._finish(error=e)
+        else:
+            self._count("completed")
+            job._finish(output)
+
+
+class RenderServer(ThreadingHTTPServer):
+    """
+    A local HTTP server that renders diagrams with a render service.
+
+    Endpoints:
+    - POST /render renders a JSON diagram specification, or DOT source if the server allows it
+    - GET /stats returns the service counters as JSON
+    - GET /health returns the status of the server
+
+    The format, engine, priority and timeout of a render can be set with query parameters
+    or, for JSON requests, keys of the same name.
+
+    Raw DOT source, posted as the request body or the source key of a JSON object, is passed to
+    Graphviz as is, so it can read files on the server through attributes such as image.  It is
+    only accepted when the server is created with allow_source for trusted clients.
+    """
+
+    daemon_threads = True
+
+    # The largest request body accepted in bytes
+    max_request_size = 16 * 1024 * 1024
+
+    def __init__(self, address: tuple, service: RenderService, quiet: bool = False,
+                 allow_source: bool = False) -> None:
+        """
+        :param tuple address: The host and port to listen on.
+        :param RenderService service: The service used to render diagrams.
+        :param bool quiet: Flag used to determine whether or not requests are logged.
+        :param bool allow_source: Flag used to determine whether or not raw DOT source from trusted clients is rendered.
+        """
+        super().__init__(address, _RenderRequestHandler)
+        self.service = service
+        self.quiet = quiet
+        self.allow_source = allow_source
+
+
+class _RenderRequestHandler(BaseHTTPRequestHandler):
+
+    server_version = "architectures"
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/stats":
+            self._send_json(200, self.server.service.stats())
+        else:
+            self._send_json(404, {"error": f"Not found: {path}"})
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != "/render":
+            self._send_json(404, {"error": f"Not found: {url.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > self.server.max_request_size:
+            self._send_json(413, {"error": "The request body is too large."})
+            return
+        body = self.rfile.read(length)
+
+        options = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            spec = None
+            if self.headers.get("Content-Type", "").split(";")[0].strip() == "application/json":
+                spec = json.loads(body)
+                if not isinstance(spec, dict):
+                    raise ValueError("A diagram specification must be an object.")
+                for key in ("format", "engine", "priority", "timeout"):
+                    if key in spec:
+                        options[key] = spec.pop(key)
+
+            if spec is not None and "source" not in spec:
+                graph = build_graph(spec)
+                source, files = graph.source, graph._iter_files()
+            elif not self.server.allow_source:
+                self._send_json(403, {"error": "Raw DOT source is not accepted by this server, post a diagram specification."})
+                return
+            elif spec is not None:
+                source, files = str(spec["source"]), ()
+            else:
+                source, files = body.decode("utf-8"), ()
+
+            output_file_format = str(options.get("format", "png"))
+            timeout = options.get("timeout")
+            job = self.server.service.submit(
+                source,
+                output_file_format,
+                engine=str(options.get("engine", "dot")),
+                priority=int(options.get("priority", 0)),
+                timeout=float(timeout) if timeout is not None else None,
+                files=files,
+            )
+        except RenderQueueFull as e:
+            self._send_json(503, {"error": str(e)}, {"Retry-After": "1"})
+            return
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        # Never hold the connection past the deadline of the job, even if it is still queued
+        remaining = None
+        if job.deadline is not None:
+            remaining = max(0.0, job.deadline - time.monotonic())
+
+        try:
+            output = job.result(remaining)
+        except TimeoutError as e:
+            self._send_json(504, {"error": str(e)})
+        except subprocess.CalledProcessError as e:
+            self._send_json(400, {"error": (e.stderr or str(e)).strip()})
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+        else:
+            content_type = _CONTENT_TYPES.get(output_file_format.split(":")[0], "application/octet-stream")
+            self._send(200, output, content_type, {"X-Cache": "hit" if job.cache_hit else "miss"})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, data: dict, headers: Union[None, dict] = None) -> None:
+        self._send(status, json.dumps(data).encode("utf-8"), "application/json", headers)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Union[None, dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _add_nodes(items: list, objects: dict) -> None:
+    """
+    Create the nodes in a diagram specification in the current graph or cluster.
+    """
+    for item in items:
+        if isinstance(item, str):
+            item = {"label": item}
+        item = dict(item)
+        ref = item.pop("id", None)
+        service = item.pop("service", None)
+        node_class = lookup(str(service)) if service else Node
+        node = node_class(**_check_attrs(item, "node"))
+        objects[ref or item.get("label") or node.label] = node
+
+
+def _add_clusters(items: list, objects: dict) -> None:
+    """
+    Create the clusters in a diagram specification, and their contents, in the current graph or cluster.
+    """
+    for item in items:
+        item = dict(item)
+        ref = item.pop("id", None)
+        nodes = item.pop("nodes", [])
+        clusters = item.pop("clusters", [])
+        with Cluster(**_check_attrs(item, "cluster")) as cluster:
+            objects[ref or cluster.label] = cluster
+            _add_nodes(nodes, objects)
+            _add_clusters(clusters, objects)
+
+
+def _get_objects(refs: Union[str, list], objects: dict) -> Union[Cluster, Node, list]:
+    """
+    Look up the nodes or clusters an edge in a diagram specification refers to.
+    """
+    if isinstance(refs, list):
+        return [_get_objects(ref, objects) for ref in refs]
+    if refs not in objects:
+        raise ValueError(f"Unknown node or cluster: {refs}")
+    return objects[refs]
+
+
+def _check_attrs(attrs: dict, kind: str) -> dict:
+    """
+    Return the attributes of an object in a diagram specification, rejecting any that could read local files.
+    """
+    if not isinstance(attrs, dict):
+        raise ValueError(f"The {kind} attributes must be an object.")
+    for key, value in attrs.items():
+        if not isinstance(key, str) or not _ATTRIBUTE_PATTERN.match(key):
+            raise ValueError(f"Invalid {kind} attribute: {key}")
+        if key.lower() in _FILE_ATTRIBUTES:
+            raise ValueError(f"The {key} attribute is not allowed.")
+        if not isinstance(value, (str, int, float, bool)):
+            raise ValueError(f"The {key} {kind} attribute must be a string, number or boolean.")
+        # HTML-like labels can include images from local files
+        if isinstance(value, str) and value.strip().startswith("<") and value.strip().endswith(">"):
+            raise ValueError(f"The {key} {kind} attribute can't be an HTML-like value.")
+    return attrs
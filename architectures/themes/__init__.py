@@ -1,18 +1,144 @@
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
 from architectures.themes.settings import GraphSettings, ClusterSettings, NodeSettings, EdgeSettings, _Settings
 
+# Themes by class and overrides, shared by every graph that uses the same theme, least recently used first
+_THEMES = OrderedDict()
+_THEMES_LOCK = threading.Lock()
+
+# The least recently used themes are forgotten beyond this many, so generated overrides can't grow the memo without bound
+_MAX_THEMES = 256
+
 class _Theme():
+    """
+    The base class of themes.
+
+    Themes are immutable and memoized, so creating a theme with the same overrides again returns
+    the same object without merging and validating its settings again, and a theme can be shared
+    safely between graphs and threads.  Each theme class sets its own settings and colors.
+    """
+
+    _graph_settings = {}
+    _cluster_settings = {}
+    _node_settings = {}
+    _edge_settings = {}
+    _colors = ()
+
+    def __new__(
+        cls,
+        graph_settings=None,
+        cluster_settings=None,
+        node_settings=None,
+        edge_settings=None,
+        color_settings=None
+    ):
+        overrides = tuple(
+            _get_settings(settings) for settings in (graph_settings, cluster_settings, node_settings, edge_settings)
+        ) + (tuple(color_settings) if color_settings else None,)
+
+        try:
+            # Include the type of each value since True, 1 and 1.0 are equal but written differently
+            key = (cls, overrides[4]) + tuple(
+                tuple(sorted((k, type(v), v) for k, v in settings.items())) if settings else None
+                for settings in overrides[:4]
+            )
+            hash(key)
+        except TypeError:
+            # Overrides that can't be hashed, such as lists of values, are not memoized
+            return cls._create(overrides)
+
+        with _THEMES_LOCK:
+            theme = _THEMES.get(key)
+            if theme is None:
+                if len(_THEMES) >= _MAX_THEMES:
+                    _THEMES.popitem(last=False)
+                theme = _THEMES[key] = cls._create(overrides)
+            else:
+                _THEMES.move_to_end(key)
+        return theme
+
+    def __init__(
+        self,
+        graph_settings=None,
+        cluster_settings=None,
+        node_settings=None,
+        edge_settings=None,
+        color_settings=None
+    ):
+        """
+        :param graph_settings: A GraphSettings object or dictionary of graph attributes that override the theme.
+        :param cluster_settings: A ClusterSettings object or dictionary of cluster attributes that override the theme.
+        :param node_settings: A NodeSettings object or dictionary of node attributes that override the theme.
+        :param edge_settings: An EdgeSettings object or dictionary of edge attributes that override the theme.
+        :param color_settings: The background colors of nested clusters that override the theme.
+        """
+        # The theme is built once by __new__
+
+    @classmethod
+    def _create(cls, overrides):
+        graph_settings, cluster_settings, node_settings, edge_settings, color_settings = overrides
+        theme = super().__new__(cls)
+        theme.__dict__.update({
+            "graph_attrs": MappingProxyType(cls._graph_settings | (graph_settings or {})),
+            "cluster_attrs": MappingProxyType(cls._cluster_settings | (cluster_settings or {})),
+            "node_attrs": MappingProxyType(cls._node_settings | (node_settings or {})),
+            "edge_attrs": MappingProxyType(cls._edge_settings | (edge_settings or {})),
+            "colors": color_settings or tuple(cls._colors),
+            "_overrides": overrides,
+        })
+
+        # Precompute the cluster attributes for each step of the colors cycle, with and without a border
+        theme.__dict__["_cluster_templates"] = {
+            (index, hide_border): MappingProxyType(theme._build_cluster_attrs(index, hide_border))
+            for index in range(max(len(theme.colors), 1)) for hide_border in (False, True)
+        }
+        return theme
+
+    def _build_cluster_attrs(self, index, hide_border):
+        attrs = dict(self.cluster_attrs)
+        if self.colors:
+            attrs["bgcolor"] = self.colors[index]
+
+        # Reserve the position of the label so the attributes keep the order clusters have always written them in
+        attrs["label"] = ""
+        if hide_border:
+            attrs["penwidth"] = "0"
+            attrs["bgcolor"] = "invis"
+        return attrs
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} themes can't be changed, create a theme with overrides instead.")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{type(self).__name__} themes can't be changed, create a theme with overrides instead.")
 
     def __setitem__(self, key, value):
-        self.__dict__[key] = value
+        self.__setattr__(key, value)
 
     def __getitem__(self, item):
         return self.__dict__[item]
 
     def __repr__(self):
-        return str(self.__dict__)
+        return str({k: v for k, v in self.__dict__.items() if not k.startswith("_")})
 
     def __iter__(self):
-        return iter(self.__dict__.items())
+        return iter((k, v) for k, v in self.__dict__.items() if not k.startswith("_"))
+
+    def __reduce__(self):
+        # Rebuild the theme from its overrides, so unpickled themes are memoized in the receiving process
+        graph_settings, cluster_settings, node_settings, edge_settings, color_settings = self._overrides
+        return type(self), (graph_settings, cluster_settings, node_settings, edge_settings, color_settings)
+
+    def get_cluster_attrs(self, depth, hide_border=False):
+        """
+        Return the attributes of a cluster nested at a depth, with the background color for that depth.
+
+        The attributes are shared and read-only, so copy them before setting the label and overrides.
+        """
+        index = depth % len(self.colors) if self.colors else 0
+        return self._cluster_templates[(index, hide_border)]
 
     def get_delta_dict(self, first_dict, second_dict):
         """
@@ -32,43 +158,20 @@ class _Theme():
 
         return new_dict
 
-class Default(_Theme):
+
+def _get_settings(settings):
     """
-    The Graphviz default theme.
+    Return the attributes set by a settings object or dictionary, or None if there are none.
     """
+    if isinstance(settings, _Settings):
+        settings = settings.get_attributes()
+    return dict(settings) if settings else None
 
-    def __init__(
-        self, 
-        graph_settings=GraphSettings(),
-        cluster_settings=ClusterSettings(),
-        node_settings=NodeSettings(),
-        edge_settings=EdgeSettings(),
-        color_settings=None
-    ):
-        theme_graph_settings = GraphSettings().get_attributes()
-        theme_cluster_settings = ClusterSettings().get_attributes()
-        theme_node_settings = NodeSettings().get_attributes()
-        theme_edge_settings = EdgeSettings().get_attributes()
-        self.colors = []
-
-        if isinstance(graph_settings, _Settings):
-            graph_settings = graph_settings.get_attributes()
 
-        if isinstance(cluster_settings, _Settings):
-            cluster_settings = cluster_settings.get_attributes()
-
-        if isinstance(node_settings, _Settings):
-            node_settings = node_settings.get_attributes()
-
-        if isinstance(edge_settings, _Settings):
-            edge_settings = edge_settings.get_attributes()
-
-        self.graph_attrs = theme_graph_settings | graph_settings
-        self.cluster_attrs = theme_cluster_settings | cluster_settings
-        self.node_attrs = theme_node_settings | node_settings
-        self.edge_attrs = theme_edge_settings | edge_settings
-        if color_settings:
-            self.colors = color_settings
+class Default(_Theme):
+    """
+    The Graphviz default theme.
+    """
 
 
 class LightMode(_Theme):
@@ -76,156 +179,99 @@ class LightMode(_Theme):
     A clean, light theme for general diagram creation.
     """
 
-    def __init__(
-        self, 
-        graph_settings=GraphSettings(),
-        cluster_settings=ClusterSettings(),
-        node_settings=NodeSettings(),
-        edge_settings=EdgeSettings(),
-        color_settings=None
-    ):
-
-        theme_graph_settings = GraphSettings(
-            bgcolor = "#FFFFFF",
-            compound = True,
-            fontcolor = "#2D3436",
-            fontname = "calibri",
-            fontsize = 24.0,
-            labeljust = "l",
-            labelloc = 't',
-            nodesep = 1.0,
-            pad = 1.0,
-            rankdir = "LR",
-            ranksep = 1.0,
-            splines = "ortho",
-            style = "rounded",
-        ).get_attributes()
-        theme_cluster_settings = ClusterSettings(
-            fontname = "calibri",
-            fontsize = 12.0,
-            labeljust = "l",
-            margin = 30.0,
-            pencolor = "#AEB6BE",
-            style = "rounded",
-        ).get_attributes()
-        theme_node_settings = NodeSettings(
-            color = "invis",
-            fillcolor = "invis",
-            fixedsize = True,
-            fontcolor = "#2D3436",
-            fontname = "calibri",
-            fontsize = 13.0,
-            height = 1.0,
-            imagepos = "tc",
-            imagescale = True,
-            labelloc = "b",
-            shape = "rectangle",
-            style = "filled",
-            width = 1.0,
-        ).get_attributes()
-        theme_edge_settings = EdgeSettings(
-            fontname = "calibri",
-            minlen = 2.0,
-            penwidth = 2.0,
-        ).get_attributes()
-        self.colors = ["#FBFBFB", "#EDEDED", "#E0E0E0", "#D3D3D3"]
-
-        if isinstance(graph_settings, _Settings):
-            graph_settings = graph_settings.get_attributes()
-
-        if isinstance(cluster_settings, _Settings):
-            cluster_settings = cluster_settings.get_attributes()
-
-        if isinstance(node_settings, _Settings):
-            node_settings = node_settings.get_attributes()
-
-        if isinstance(edge_settings, _Settings):
-            edge_settings = edge_settings.get_attributes()
-
-        self.graph_attrs = theme_graph_settings | graph_settings
-        self.cluster_attrs = theme_cluster_settings | cluster_settings
-        self.node_attrs = theme_node_settings | node_settings
-        self.edge_attrs = theme_edge_settings | edge_settings
-        if color_settings:
-            self.colors = color_settings
+    _graph_settings = GraphSettings(
+        bgcolor = "#FFFFFF",
+        compound = True,
+        fontcolor = "#2D3436",
+        fontname = "calibri",
+        fontsize = 24.0,
+        labeljust = "l",
+        labelloc = 't',
+        nodesep = 1.0,
+        pad = 1.0,
+        rankdir = "LR",
+        ranksep = 1.0,
+        splines = "ortho",
+        style = "rounded",
+    ).get_attributes()
+    _cluster_settings = ClusterSettings(
+        fontname = "calibri",
+        fontsize = 12.0,
+        labeljust = "l",
+        margin = 30.0,
+        pencolor = "#AEB6BE",
+        style = "rounded",
+    ).get_attributes()
+    _node_settings = NodeSettings(
+        color = "invis",
+        fillcolor = "invis",
+        fixedsize = True,
+        fontcolor = "#2D3436",
+        fontname = "calibri",
+        fontsize = 13.0,
+        height = 1.0,
+        imagepos = "tc",
+        imagescale = True,
+        labelloc = "b",
+        shape = "rectangle",
+        style = "filled",
+        width = 1.0,
+    ).get_attributes()
+    _edge_settings = EdgeSettings(
+        fontname = "calibri",
+        minlen = 2.0,
+        penwidth = 2.0,
+    ).get_attributes()
+    _colors = ("#FBFBFB", "#EDEDED", "#E0E0E0", "#D3D3D3")
 
 class DarkMode(_Theme):
     """
     Lightmode, but cooler.
     """
 
-    def __init__(
-        self, 
-        graph_settings=GraphSettings(),
-        cluster_settings=ClusterSettings(),
-        node_settings=NodeSettings(),
-        edge_settings=EdgeSettings(),
-        color_settings=None
-    ):
-
-        theme_graph_settings = GraphSettings(
-            bgcolor = "#17202A",
-            compound = True,
-            fontcolor = "#EEEEEE",
-            fontname = "calibri",
-            fontsize = 24.0,
-            labeljust = "l",
-            labelloc = 't',
-            nodesep = 1.0,
-            pad = 1.0,
-            splines = "ortho",
-            style = "rounded",
-            rankdir = "LR",
-            ranksep = 1.0,
-        ).get_attributes()
-        theme_cluster_settings = ClusterSettings(
-            fontcolor = "#EEEEEE",
-            fontname = "calibri",
-            fontsize = 12.0,
-            labeljust = "l",
-            margin = 30.0,
-            pencolor = "#AEB6BE",
-            style = "rounded",
-        ).get_attributes()
-        theme_node_settings = NodeSettings(
-            color = "invis",
-            fillcolor = "invis",
-            fixedsize = True,
-            fontcolor = "#EEEEEE",
-            fontname = "calibri",
-            fontsize = 13.0,
-            height = 1.0,
-            imagepos = "tc",
-            imagescale = True,
-            labelloc = "b",
-            shape = "rectangle",
-            style = "filled",
-            width = 1.0,
-        ).get_attributes()
-        theme_edge_settings = EdgeSettings(
-            color = "#EEEEEE",
-            fontname = "calibri",
-            minlen = 2.0,
-            penwidth = 2.0,
-        ).get_attributes()
-        self.colors = ["#1C2833", "#212F3D", "#273746", "#2C3E50", "#566573"]
-
-        if isinstance(graph_settings, _Settings):
-            graph_settings = graph_settings.get_attributes()
-
-        if isinstance(cluster_settings, _Settings):
-            cluster_settings = cluster_settings.get_attributes()
-
-        if isinstance(node_settings, _Settings):
-            node_settings = node_settings.get_attributes()
-
-        if isinstance(edge_settings, _Settings):
-            edge_settings = edge_settings.get_attributes()
-
-        self.graph_attrs = theme_graph_settings | graph_settings
-        self.cluster_attrs = theme_cluster_settings | cluster_settings
-        self.node_attrs = theme_node_settings | node_settings
-        self.edge_attrs = theme_edge_settings | edge_settings
-
-        if color_settings:
-            self.colors = color_settings
\ No newline at end of file
+    _graph_settings = GraphSettings(
+        bgcolor = "#17202A",
+        compound = True,
+        fontcolor = "#EEEEEE",
+        fontname = "calibri",
+        fontsize = 24.0,
+        labeljust = "l",
+        labelloc = 't',
+        nodesep = 1.0,
+        pad = 1.0,
+        splines = "ortho",
+        style = "rounded",
+        rankdir = "LR",
+        ranksep = 1.0,
+    ).get_attributes()
+    _cluster_settings = ClusterSettings(
+        fontcolor = "#EEEEEE",
+        fontname = "calibri",
+        fontsize = 12.0,
+        labeljust = "l",
+        margin = 30.0,
+        pencolor = "#AEB6BE",
+        style = "rounded",
+    ).get_attributes()
+    _node_settings = NodeSettings(
+        color = "invis",
+        fillcolor = "invis",
+        fixedsize = True,
+        fontcolor = "#EEEEEE",
+        fontname = "calibri",
+        fontsize = 13.0,
+        height = 1.0,
+        imagepos = "tc",
+        imagescale = True,
+        labelloc = "b",
+        shape = "rectangle",
+        style = "filled",
+        width = 1.0,
+    ).get_attributes()
+    _edge_settings = EdgeSettings(
+        color = "#EEEEEE",
+        fontname = "calibri",
+        minlen = 2.0,
+        penwidth = 2.0,
+    ).get_attributes()
+    _colors = ("#1C2833", "#212F3D", "#273746", "#2C3E50", "#566573")
@@ -2,6 +2,43 @@ color_schemes = ["x11","svg","accent3","accent4","accent5","accent6","accent7","
 x11_colors = [
     
 ]
+
+
+def _string_validator(field, checks):
+    allowed = frozenset(checks)
+    expected = ', '.join(checks)
+
+    def validate(value):
+        if not isinstance(value, str):
+            raise TypeError(f"The {field} attribute expects a string.")
+        if value not in allowed and value != "":
+            raise ValueError(f"The {field} attribute is set to a value of {value} but expects {expected}.")
+
+    return validate
+
+
+def _boolean_validator(field):
+
+    def validate(value):
+        if not isinstance(value, bool):
+            raise TypeError(f"The {field} attribute expects a boolean.")
+
+    return validate
+
+
+def _number_validator(field, number_type, type_name, minimum, maximum):
+    # A maximum of None (or zero) leaves the values unbounded above
+    maximum = maximum or None
+
+    def validate(value):
+        if not isinstance(value, number_type):
+            raise TypeError(f"The {field} attribute expects {type_name}.")
+        if value < minimum or (maximum is not None and value > maximum):
+            raise ValueError(f"The {field} attribute is set to a value of {value} but expects a value between {minimum} and {maximum}.")
+
+    return validate
+
+
 class _Settings():
 
     # String Checks
@@ -98,71 +135,35 @@ class _Settings():
     def __iter__(self):
         return iter(self.__dict__.items())
 
-    # TODO: ADD DOCSTRINGS
-    def _check_string_settings(self):
-        for field, checks in self._string_field_checks.items():
-            if field in dict(self):
-                value = dict(self)[field] # .lower()
-                valid_value = value in checks
-                if value != None:
-                    if not isinstance(value, str): 
-                        raise TypeError(f"The {field} attribute expects a string.")
-                    if not valid_value and value != "":
-                        raise ValueError(f"The {field} attribute is set to a value of {value} but expects {', '.join(checks)}.")
-
-    def _check_boolean_settings(self):
-        for field in self._boolean_field_checks:
-            if field in dict(self):
-                value = dict(self)[field]
-                if value != None:
-                    if not isinstance(value, bool): 
-                        raise TypeError(f"The {field} attribute expects a boolean.")
-
-    def _check_float_settings(self):
-        for field, checks in self._float_field_checks.items():
-            if field in dict(self):
-                value = dict(self)[field]
-                minimum = checks["min"]
-                maximum = checks["max"]
-                if value != None:
-                    if maximum:
-                        valid_value = value >= minimum and value <= maximum
-                    else:
-                        valid_value = value >= minimum
-                    if not isinstance(value, float): 
-                        raise TypeError(f"The {field} attribute expects a float.")
-                    if not valid_value:
-                        raise ValueError(f"The {field} attribute is set to a value of {value} but expects a value between {minimum} and {maximum}.")
-
-    def _check_integer_settings(self):
-        for field, checks in self._integer_field_checks.items():
-            if field in dict(self):
-                value = dict(self)[field]
-                minimum = checks["min"]
-                maximum = checks["max"]
-                if value != None:
-                    if maximum:
-                        valid_value = value >= minimum and value <= maximum
-                    else:
-                        valid_value = value >= minimum
-                    if not isinstance(value, int): 
-                        raise TypeError(f"The {field} attribute expects a integer.")
-                    if not valid_value:
-                        raise ValueError(f"The {field} attribute is set to a value of {value} but expects a value between {minimum} and {maximum}.")
+    @classmethod
+    def _get_validators(cls):
+        """
+        Return the validator of each checked field, compiling the field checks the first time the class is used.
+        """
+        validators = cls.__dict__.get("_validators")
+        if validators is None:
+            validators = {}
+            for field, checks in cls._string_field_checks.items():
+                validators[field] = _string_validator(field, checks)
+            for field in cls._boolean_field_checks:
+                validators[field] = _boolean_validator(field)
+            for field, checks in cls._float_field_checks.items():
+                validators[field] = _number_validator(field, float, "a float", checks["min"], checks["max"])
+            for field, checks in cls._integer_field_checks.items():
+                validators[field] = _number_validator(field, int, "a integer", checks["min"], checks["max"])
+            cls._validators = validators
+        return validators
 
     def _check_settings(self):
-        # Check string settings
-        self._check_string_settings()
-        # Check boolean settings
-        self._check_boolean_settings()
-        # Check float settings
-        self._check_float_settings()
-        # Check integer settings
-        self._check_integer_settings()
+        # Check each field that is set in a single pass
+        validators = self._get_validators()
+        for field, value in self.__dict__.items():
+            if value is not None and field in validators:
+                validators[field](value)
 
 
     def get_attributes(self):
-        return {k: v for (k, v) in dict(self).items() if v != None}
+        return {k: v for (k, v) in self.__dict__.items() if v != None}
 
     def set_attributes(self, **kwargs):
         for k, v in kwargs.items():
@@ -173,7 +174,7 @@ class _Settings():
         return dict(self)
 
     def get_attribute(self, attribute: str):
-        return dict(self)[attribute]
+        return self.__dict__[attribute]
 
     def set_attribute(self, attribute: str, attribute_value: any):
         self[attribute] = str(attribute_value)
@@ -0,0 +1,304 @@
+"""
+This module contains the tools used to re-render a diagram script whenever it changes.
+
+Available Classes:
+- Watcher
+- WatchServer
+
+Available Functions:
+- watch
+
+Details for each can be found in the docstrings for the respective class or function.
+"""
+from __future__ import annotations
+
+import html
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Union
+from urllib.parse import urlsplit
+
+from architectures.cli import _is_user_module, run_script
+from architectures.core import set_render_log
+
+# Content types for the output files shown on the watch page
+_CONTENT_TYPES = {
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+}
+
+# The page reloads itself when the version reported by the server changes
+_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+img {{ max-width: 100%; display: block; margin-bottom: 2em; }}
+pre {{ color: #C0392B; white-space: pre-wrap; }}
+</style>
+</head>
+<body>
+{body}
+<script>
+const version = {version};
+setInterval(async () => {{
+    try {{
+        const response = await fetch("/version");
+        if ((await response.json()).version !== version) location.reload();
+    }} catch (e) {{}}
+}}, 1000);
+</script>
+</body>
+</html>
+"""
+
+
+def watch(script: str, output_directory: Union[None, str] = None,
+          port: Union[None, int] = None, host: str = "127.0.0.1",
+          interval: float = 0.5, debounce: float = 0.3
+          ) -> None:
+    """Render a diagram script and render it again whenever it or a module it imports changes.
+
+    Parameters
+    ----------
+    script : str
+        The path of the script
+    output_directory : str
+        The directory to write output files to (defaults to the current directory)
+    port : int
+        The port of a local page showing the latest output (defaults to no page)
+    host : str
+        The address the page is served on (defaults to 127.0.0.1)
+    interval : float
+        The number of seconds between checks for changes (defaults to 0.5)
+    debounce : float
+        The number of seconds files must stay unchanged before rendering (defaults to 0.3)
+    """
+    watcher = Watcher(script, output_directory, interval=interval, debounce=debounce)
+
+    server = None
+    if port is not None:
+        server = WatchServer((host, port), watcher)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Serving the latest output on http://{host}:{server.server_address[1]}/", file=sys.stderr)
+
+    try:
+        watcher.watch()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+
+class Watcher():
+    """
+    Run a diagram script in this interpreter each time it, or a module it imports, changes.
+
+    Modules imported by the script from outside the standard library, installed packages and
+    architectures itself are reloaded on every run, while everything else, including provider
+    modules, stays imported so each run starts warm.  Graphs whose DOT source has not changed
+    since the previous run are not rendered again.
+    """
+
+    def __init__(self, script: str, output_directory: Union[None, str] = None,
+                 interval: float = 0.5, debounce: float = 0.3
+                 ) -> None:
+        """
+        :param str script: The path of the script.
+        :param str output_directory: The directory to write output files to (defaults to the current directory).
+        :param float interval: The number of seconds between checks for changes.
+        :param float debounce: The number of seconds files must stay unchanged before rendering.
+        """
+        self.script = os.path.abspath(script)
+        self.output_directory = os.path.abspath(output_directory) if output_directory else None
+        self.interval = interval
+        self.debounce = debounce
+
+        # Incremented after every run so pages showing the output know to reload
+        self.version = 0
+        self.result = None
+
+        self._render_log = {}
+        self._modules = set()
+        self._files = set()
+        self._mtimes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def files(self) -> list:
+        """
+        The paths of the script and the modules it imported.
+        """
+        return sorted(self._files | {self.script})
+
+    @property
+    def output_files(self) -> list:
+        """
+        The first output file of each graph rendered by the last run.
+        """
+        with self._lock:
+            return [entry["output_files"][0] for entry in self._render_log.values()]
+
+    def run(self) -> dict:
+        """
+        Run the script once and return its result from run_script, including the graphs it skipped.
+        """
+        # Forget the modules imported by the previous run so edits to them are picked up
+        for name in self._modules:
+            sys.modules.pop(name, None)
+
+        with self._lock:
+            previous = dict(self._render_log)
+            modules = set(sys.modules)
+
+            # Graphs compare their source with the previous run and replace their entries
+            set_render_log(self._render_log)
+            try:
+                result = run_script(self.script, self.output_directory, keep_modules=True)
+            finally:
+                set_render_log(None)
+
+            # Drop the graphs the script no longer renders
+            self._render_log = {
+                path: entry for path, entry in self._render_log.items() if entry is not previous.get(path)
+            }
+            self._modules = {name for name in set(sys.modules) - modules if _is_user_module(name)}
+
+            # Keep watching the modules from earlier runs if this one failed part way through
+            files = {os.path.abspath(sys.modules[name].__file__) for name in self._modules}
+            self._files = files if result["success"] else self._files | files
+
+            result["unchanged"] = bool(self._render_log) and self._render_log == previous
+            self.result = result
+            self.version += 1
+
+        self._mtimes = self._get_mtimes()
+        return result
+
+    def changed(self) -> bool:
+        """
+        Return whether or not any watched file changed since the last check.
+        """
+        mtimes = self._get_mtimes()
+        changed = mtimes != self._mtimes
+        self._mtimes = mtimes
+        return changed
+
+    def watch(self, stop: Union[None, threading.Event] = None) -> None:
+        """
+        Run the script, then run it again after each change until stopped.
+
+        :param threading.Event stop: An event used to stop watching (defaults to watching until interrupted).
+        """
+        stop = stop or threading.Event()
+        self._report(self.run())
+
+        changed_at = None
+        while not stop.wait(self.interval):
+            if self.changed():
+                changed_at = time.monotonic()
+            elif changed_at is not None and time.monotonic() - changed_at >= self.debounce:
+                changed_at = None
+                self._report(self.run())
+
+    def _get_mtimes(self) -> dict:
+        mtimes = {}
+        for path in self.files:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = None
+        return mtimes
+
+    def _report(self, result: dict) -> None:
+        if not result["success"]:
+            status = "FAILED"
+        elif result["unchanged"]:
+            status = "same"
+        else:
+            status = "ok"
+        print(f"{status:<6} {result['seconds']:>8.2f}s  {os.path.relpath(result['script'])}")
+        if result["error"]:
+            print(result["error"], file=sys.stderr)
+
+
+class WatchServer(ThreadingHTTPServer):
+    """
+    A local HTTP server showing the latest output of a watcher that reloads when it changes.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, watcher: Watcher) -> None:
+        """
+        :param tuple address: The host and port to listen on.
+        :param Watcher watcher: The watcher whose output is shown.
+        """
+        super().__init__(address, _WatchRequestHandler)
+        self.watcher = watcher
+
+
+class _WatchRequestHandler(BaseHTTPRequestHandler):
+
+    server_version = "architectures"
+
+    def do_GET(self) -> None:
+        watcher = self.server.watcher
+        path = urlsplit(self.path).path
+
+        if path == "/":
+            self._send(200, self._page().encode("utf-8"), "text/html; charset=utf-8")
+        elif path == "/version":
+            self._send(200, json.dumps({"version": watcher.version}).encode("utf-8"), "application/json")
+        elif path.startswith("/output/"):
+            output_files = watcher.output_files
+            index = path[len("/output/"):]
+            if not index.isdigit() or int(index) >= len(output_files):
+                self._send(404, b"Not found", "text/plain")
+                return
+            output_file = output_files[int(index)]
+            try:
+                with open(output_file, "rb") as f:
+                    body = f.read()
+            except FileNotFoundError:
+                self._send(404, b"Not found", "text/plain")
+                return
+            content_type = _CONTENT_TYPES.get(os.path.splitext(output_file)[1].lower(), "application/octet-stream")
+            self._send(200, body, content_type)
+        else:
+            self._send(404, b"Not found", "text/plain")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _page(self) -> str:
+        watcher = self.server.watcher
+        result = watcher.result or {}
+        body = [f"<h1>{html.escape(os.path.basename(watcher.script))}</h1>"]
+        if result.get("error"):
+            body.append(f"<pre>{html.escape(result['error'])}</pre>")
+        for index, output_file in enumerate(watcher.output_files):
+            if os.path.splitext(output_file)[1].lower() in _CONTENT_TYPES:
+                body.append(f'<img src="/output/{index}?v={watcher.version}" alt="{html.escape(output_file)}">')
+            else:
+                body.append(f'<p><a href="/output/{index}">{html.escape(output_file)}</a></p>')
+        return _PAGE.format(title=html.escape(os.path.basename(watcher.script)), body="\n".join(body), version=watcher.version)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
@@ -1,55 +1,143 @@
+import hashlib
+import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 heading_text = '# Do not modify this file directly. It is auto-generated with Python.\n\n'
 
-root_dir = os.path.dirname(os.getcwd())
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 icons_dir = os.path.join(root_dir, "icons")
 providers_dir = os.path.join(root_dir, "architectures", "providers")
+manifest_file = os.path.join(providers_dir, "manifest.json")
+index_file = os.path.join(root_dir, "architectures", "catalog", "index.json")
+
+sys.path.insert(0, root_dir)
+
+from architectures.catalog import build_index  # noqa: E402
+
+# Packages import their modules on first use, using the manifest to know what they contain
+lazy_text = 'from architectures.catalog import lazy_loader\n\n__getattr__, __dir__ = lazy_loader(__name__)\n'
 
 
 def format_text(text):
     return text.replace("-", " ").title().replace(" ", "")
 
 
-init_file = os.path.join(providers_dir, "__init__.py")
-with open(init_file, "w+") as f:
-    f.write(heading_text)
-    f.write('from architectures.core import Node')
+def write_file(path, text):
+    """
+    Write a file only if its contents changed, so unchanged modules keep their mtimes and bytecode caches.
+    """
+    data = text.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
 
-providers = os.listdir(icons_dir)
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
 
-for provider in providers:
-
-    if provider in [".DS_Store"]:
-        continue
 
+def generate_provider(provider):
+    """
+    Write the modules of a provider and return its base class, manifest entries, catalog services and written files.
+    """
     provider_fmt = format_text(provider)
-    with open(init_file, "a+") as f:
-        f.write(f'\n\nclass _{provider_fmt}(Node):\n')
-        f.write(f'    _provider = \"{provider}\"\n')
-        f.write(f'    _icon_dir = \"icons/{provider}\"')
-
-    for subdir, dirs, files in os.walk(os.path.join(icons_dir, provider)):
-        if files:
-            provider_dir = os.path.join(providers_dir, provider)
-            if not os.path.exists(provider_dir):
-                os.mkdir(provider_dir)
-
-            service_type = os.path.split(subdir)[1]
-            service_type_fmt = format_text(service_type)
-
-            service_file = os.path.join(provider_dir, service_type) + ".py"
-            with open(service_file, "w+") as f:
-                f.write(heading_text)
-                f.write(f'from architectures.providers import _{provider_fmt}')
-                f.write(f'\n\nclass _{service_type_fmt}(_{provider_fmt}):\n')
-                f.write(f'    _service_type = \"{service_type}\"\n')
-                f.write(f'    _icon_dir = \"icons/{provider}/{service_type}\"')
-
-            for icon in files:
-                icon_name = icon.split(".")[0]
-                service_fmt = format_text(icon_name)       
-                with open(service_file, 'a+', newline='') as f:
-                    f.write(f'\n\nclass {service_fmt}(_{service_type_fmt}):\n')
-                    f.write(f'    _icon = \"{icon}\"\n')
-                    f.write(f'    _default_label = "{icon_name.replace("-", " ").title()}"')
+    provider_dir = os.path.join(providers_dir, provider)
+    base_text = (f'\n\nclass _{provider_fmt}(Node):\n'
+                 f'    _provider = \"{provider}\"\n'
+                 f'    _icon_dir = \"icons/{provider}\"')
+
+    manifest = {}
+    services = []
+    files = {}
+    for subdir, dirs, icons in os.walk(os.path.join(icons_dir, provider)):
+        dirs.sort()
+        icons = sorted(icon for icon in icons if not icon.startswith("."))
+        if not icons:
+            continue
+
+        service_type = os.path.split(subdir)[1]
+        service_type_fmt = format_text(service_type)
+        service_types = manifest.setdefault(service_type, {})
+
+        lines = [heading_text,
+                 f'from architectures.providers import _{provider_fmt}',
+                 f'\n\nclass _{service_type_fmt}(_{provider_fmt}):\n',
+                 f'    _service_type = \"{service_type}\"\n',
+                 f'    _icon_dir = \"icons/{provider}/{service_type}\"']
+
+        for icon in icons:
+            icon_name = icon.split(".")[0]
+            service_fmt = format_text(icon_name)
+            label = icon_name.replace("-", " ").title()
+            lines.append(f'\n\nclass {service_fmt}(_{service_type_fmt}):\n')
+            lines.append(f'    _icon = \"{icon}\"\n')
+            lines.append(f'    _default_label = "{label}"')
+            service_types[service_fmt] = {"icon": icon, "label": label}
+
+            with open(os.path.join(subdir, icon), "rb") as f:
+                icon_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+            services.append([provider, service_type, service_fmt, label, icon_hash])
+
+        files[os.path.join(provider_dir, service_type) + ".py"] = "".join(lines)
+
+    if files:
+        files[os.path.join(provider_dir, "__init__.py")] = heading_text + lazy_text
+
+    os.makedirs(provider_dir, exist_ok=True)
+    written = [path for path, text in files.items() if write_file(path, text)]
+
+    # Remove the modules of service types whose icons are gone
+    for file in sorted(os.listdir(provider_dir)):
+        path = os.path.join(provider_dir, file)
+        if file.endswith(".py") and path not in files:
+            with open(path, "r", encoding="utf-8") as f:
+                generated = f.read().startswith(heading_text)
+            if generated:
+                os.remove(path)
+                written.append(path)
+
+    return base_text, manifest, services, written
+
+
+def main():
+    providers = sorted(
+        provider for provider in os.listdir(icons_dir)
+        if not provider.startswith(".") and os.path.isdir(os.path.join(icons_dir, provider))
+    )
+
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(generate_provider, providers))
+
+    manifest = {}
+    services = []
+    written = []
+    init_lines = [heading_text, 'from architectures.core import Node']
+    for provider, (base_text, provider_manifest, provider_services, provider_written) in zip(providers, results):
+        init_lines.append(base_text)
+        if provider_manifest:
+            manifest[provider] = provider_manifest
+        services.extend(provider_services)
+        written.extend(provider_written)
+
+    init_lines.append('\n\nfrom architectures.catalog import lookup  # noqa: F401')
+    init_lines.append(f'\n{lazy_text}')
+
+    files = {
+        os.path.join(providers_dir, "__init__.py"): "".join(init_lines),
+        manifest_file: json.dumps({"providers": manifest}, indent=2, sort_keys=True) + "\n",
+        index_file: json.dumps(build_index(services), separators=(",", ":")),
+    }
+    written.extend(path for path, text in files.items() if write_file(path, text))
+
+    for path in written:
+        print(f"Updated {os.path.relpath(path, root_dir)}")
+    print(f"Generated {len(services)} services from {len(providers)} providers, {len(written)} files updated.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import os
+import sys
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root_dir)
+
+from architectures.icons import build_icon_pack  # noqa: E402
+
+icons_dir = os.path.join(root_dir, "icons")
+pack_file = os.path.join(root_dir, "architectures", "icons", "icons.pack")
+
+stats = build_icon_pack(icons_dir, pack_file)
+print(f"Packed {stats['icons']} icons ({stats['distinct']} distinct) into {pack_file} ({stats['size']} bytes).")
@@ -1,7 +1,10 @@
 import setuptools
 import json
+import os
 import requests
 import re
+from setuptools.command.build_py import build_py
+from setuptools.command.sdist import sdist
 
 def get_release_data(user, repo, field=None, regex_pattern=None, group_number=0):
     """
@@ -23,6 +26,32 @@ def get_release_data(user, repo, field=None, regex_pattern=None, group_number=0)
 
 version = get_release_data(user="jsoconno", repo="architectures", field="tag_name", regex_pattern="[0-9]*\.[0-9]*\.[0-9]*")
 
+def pack_icons():
+    """
+    Build the bundled icon pack from the icons directory, failing if there is no pack to ship.
+    """
+    from architectures.icons import build_icon_pack
+
+    root_dir = os.path.dirname(os.path.abspath(__file__))
+    icons_dir = os.path.join(root_dir, "icons")
+    pack_file = os.path.join(root_dir, "architectures", "icons", "icons.pack")
+    if os.path.isdir(icons_dir):
+        build_icon_pack(icons_dir, pack_file)
+    if not os.path.isfile(pack_file):
+        raise RuntimeError(f"The icon pack {pack_file} is missing, run scripts/pack_icons.py before building.")
+
+
+class BuildPyCommand(build_py):
+    def run(self):
+        pack_icons()
+        super().run()
+
+
+class SdistCommand(sdist):
+    def run(self):
+        pack_icons()
+        super().run()
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -36,10 +65,18 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/jsoconno/architectures",
     packages=setuptools.find_packages(),
+    package_data={"architectures.icons": ["*.pack"], "architectures.providers": ["manifest.json"],
+                  "architectures.catalog": ["index.json"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
     python_requires='>=3.7',
+    cmdclass={"build_py": BuildPyCommand, "sdist": SdistCommand},
+    entry_points={
+        "console_scripts": [
+            "architectures=architectures.cli:main",
+        ],
+    },
 )
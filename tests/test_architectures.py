@@ -1,10 +1,28 @@
+import asyncio
+import collections
 import glob
+import json
 import os
+import pickle
+import sys
+import threading
+import urllib.error
+import urllib.request
 import pytest
 
+import architectures.core
+import architectures.icons
+import architectures.themes
 from architectures.core import Graph, Cluster, Node, Edge, Flow
-from architectures.core import wrap_text
+from architectures.core import StateIndex, wrap_text, get_node_obj, get_state, get_state_index, search_state, update_state, set_render_log
+from architectures.icons import IconCache, build_icon_pack, get_icon_packs, register_icon_pack, resolve_icon
+from architectures.catalog import build_index, get_manifest, lookup, search
+from architectures.cli import discover_scripts, main, render_scripts, run_script
+from architectures.render import RenderCache, inline_svg_images, write_lines
+from architectures.server import RenderQueueFull, RenderServer, RenderService, build_graph
 from architectures.themes import Default, LightMode, DarkMode
+from architectures.themes.settings import GraphSettings, NodeSettings
+from architectures.watch import Watcher
 
 from architectures.providers.aws.analytics import Analytics
 from architectures.providers.azure.ai import BatchAi
@@ -22,6 +40,27 @@ def test_wrap_text(test_input, expected):
     assert wrap_text(test_input) == expected
 
 
+def test_inline_svg_images():
+    icon_a = Analytics._icon_dir + "/" + Analytics._icon
+    icon_b = BatchAi._icon_dir + "/" + BatchAi._icon
+    svg = (
+        '<svg width="100pt" height="100pt" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">\n'
+        f'<image xlink:href="{icon_a}" width="72px" height="72px" preserveAspectRatio="xMinYMin meet" x="0" y="0"/>\n'
+        f'<image xlink:href="{icon_a}" width="72px" height="72px" preserveAspectRatio="xMinYMin meet" x="80" y="0"/>\n'
+        f'<image xlink:href="{icon_b}" width="72px" height="72px" preserveAspectRatio="xMinYMin meet" x="160" y="0"/>\n'
+        '<image xlink:href="missing.png" width="72px" height="72px" x="240" y="0"/>\n'
+        '</svg>\n'
+    )
+    inlined = inline_svg_images(svg)
+    assert inlined.count("<symbol ") == 2
+    assert inlined.count("data:image/png;base64,") == 2
+    assert inlined.count('<use xlink:href="#image0" width="72px" height="72px" x=') == 2
+    assert '<use xlink:href="#image1"' in inlined
+    assert 'viewBox="0 0 400 400" preserveAspectRatio="xMinYMin meet"' in inlined
+    assert '<image xlink:href="missing.png"' in inlined
+    assert icon_a not in inlined
+
+
 class TestGraph:
     @classmethod
     def setup_class(cls):
@@ -52,6 +91,98 @@ class TestGraph:
             Node("A")
         assert self.default_ext in glob.glob(graph_name + self.default_ext)[0]
 
+    def test_source(self):
+        with Graph(show=False) as graph:
+            node_a = Node("A")
+            with Cluster() as cluster_a:
+                with Cluster() as cluster_b:
+                    node_b = Node("B")
+            Edge(node_a, node_b)
+        source = graph.source
+        assert source.startswith('digraph "My Architecture" {')
+        assert source.count(f"subgraph {cluster_a.id} {{") == 1
+        assert source.count(f"subgraph {cluster_b.id} {{") == 1
+        assert source.count(f"{node_b.id} [label=B") == 1
+        assert f"{node_a.id} -> {node_b.id}" in source
+
+    def test_no_source_file(self):
+        graph_name = "test_no_source"
+        with Graph(graph_name, show=False):
+            Node("A")
+        assert os.path.exists(graph_name + self.default_ext)
+        assert not os.path.exists(graph_name)
+
+    def test_save_source(self):
+        graph_name = "test_save_source"
+        with Graph(graph_name, show=False, save_source=True) as graph:
+            Node("A")
+        with open(graph_name) as f:
+            assert f.read() == graph.source
+        os.remove(graph_name)
+
+    def test_deterministic_source(self):
+        def build():
+            with Graph(show=False) as graph:
+                node_a = Node("A")
+                Node("A")
+                Node()
+                with Cluster("Tier") as cluster_a:
+                    node_b = Node("B")
+                    with Cluster():
+                        Node("B")
+                Edge(node_a, cluster_a)
+                Flow([node_a, node_b])
+            return graph
+
+        graph = build()
+        assert graph.source == build().source
+        assert "node_a_2 " in graph.source
+        assert "subgraph cluster_tier {" in graph.source
+
+    def test_multiple_formats(self, monkeypatch):
+        graph_name = "test_multiple_formats"
+        calls = []
+        render_lines = architectures.core.render_lines
+
+        def count_render_lines(*args, **kwargs):
+            calls.append(args)
+            return render_lines(*args, **kwargs)
+
+        monkeypatch.setattr("architectures.core.render_lines", count_render_lines)
+        with Graph(graph_name, output_file_format=["png", "svg"], show=False):
+            Node("A")
+        assert len(calls) == 1
+        assert os.path.exists(graph_name + ".png")
+        assert os.path.exists(graph_name + ".svg")
+        os.remove(graph_name + ".svg")
+
+    def test_pipe(self):
+        graph_name = "test_pipe"
+        with Graph(graph_name, show=False, render_on_exit=False) as graph:
+            Node("A")
+        assert not glob.glob(graph_name + "*")
+        assert isinstance(graph.pipe(), bytes)
+        assert graph.pipe("svg")
+
+    def test_output_directory(self, tmp_path):
+        output_directory = tmp_path / "output"
+        with Graph(show=False, save_source=True, output_directory=str(output_directory)):
+            Node("A")
+        assert sorted(os.listdir(output_directory)) == [self.default_graphname, self.default_filename]
+        assert not os.path.exists(self.default_graphname)
+
+    def test_async(self):
+        graph_name = "test_async"
+
+        async def build():
+            async with Graph(graph_name, show=False) as graph:
+                Node("A")
+            return graph, await graph.pipe_async("svg", timeout=60)
+
+        graph, output = asyncio.run(build())
+        assert os.path.exists(graph_name + self.default_ext)
+        assert output
+
     # Do we need this test given the test_theme_overrides test?
     def test_default_theme(self):
         graph_name = "test_theme"
@@ -77,7 +208,31 @@ class TestGraph:
                     graph.theme.cluster_attrs["bgcolor"] == color and
                     graph.theme.node_attrs["color"] == color and
                     graph.theme.edge_attrs["color"] == color and
-                    graph.theme.colors == [color])
+                    list(graph.theme.colors) == [color])
+
+    def test_theme_memoized(self):
+        theme = LightMode(graph_settings={"rankdir": "TB"})
+        assert LightMode(graph_settings={"rankdir": "TB"}) is theme
+        assert LightMode() is LightMode()
+        assert LightMode() is not DarkMode()
+        assert LightMode(graph_settings={"nodesep": 1}) is not LightMode(graph_settings={"nodesep": True})
+        assert pickle.loads(pickle.dumps(theme)) is theme
+        with pytest.raises(AttributeError):
+            theme.colors = []
+        with pytest.raises(TypeError):
+            theme.graph_attrs["rankdir"] = "LR"
+        assert LightMode().graph_attrs["rankdir"] == "LR"
+
+    def test_theme_memo_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(architectures.themes, "_THEMES", collections.OrderedDict())
+        monkeypatch.setattr(architectures.themes, "_MAX_THEMES", 2)
+        first = LightMode(graph_settings={"rankdir": "TB"})
+        second = LightMode(graph_settings={"rankdir": "BT"})
+        # Using the first theme again keeps it, so the second one is forgotten instead
+        assert LightMode(graph_settings={"rankdir": "TB"}) is first
+        LightMode(graph_settings={"rankdir": "RL"})
+        assert LightMode(graph_settings={"rankdir": "TB"}) is first
+        assert LightMode(graph_settings={"rankdir": "BT"}) is not second
 
 
 class TestCluster:
@@ -106,10 +261,118 @@ class TestCluster:
 
             Flow([node_a, cluster_b, cluster_a, node_b])
 
+    def test_cluster_center_node(self):
+        with Graph(show=False):
+            with Cluster() as cluster_a:
+                with Cluster() as cluster_b:
+                    node_a = Node("A")
+                    node_b = Node("B")
+                    node_c = Node("C")
+            with Cluster() as cluster_c:
+                pass
+            assert get_node_obj(cluster_b) is node_b
+            assert get_node_obj(cluster_a) is node_b
+            assert get_node_obj(cluster_c) is cluster_c
+
     def test_cluster_graph_context(self):
         with pytest.raises(EnvironmentError):
             Cluster("A")
 
+    def test_cluster_attrs(self):
+        theme = LightMode(color_settings=["#111111", "#222222"])
+        with Graph(theme=theme, show=False, render_on_exit=False):
+            with Cluster("A") as cluster_a:
+                with Cluster("B", hide_border=True) as cluster_b:
+                    with Cluster("C", fontsize="20") as cluster_c:
+                        pass
+        assert cluster_a.graph_attr["bgcolor"] == "#111111"
+        assert cluster_b.graph_attr["bgcolor"] == "invis"
+        assert cluster_b.graph_attr["penwidth"] == "0"
+        assert cluster_c.graph_attr["bgcolor"] == "#111111"
+        assert cluster_c.graph_attr["fontsize"] == "20"
+        assert list(cluster_a.graph_attr)[-1] == "label"
+        assert theme.get_cluster_attrs(3) is theme.get_cluster_attrs(1)
+        assert theme.get_cluster_attrs(0)["label"] == ""
+
+
+class TestState:
+    @classmethod
+    def setup_class(cls):
+        cls.default_graphname = "my-architecture"
+        cls.default_ext = ".png"
+        cls.default_filename = cls.default_graphname + cls.default_ext
+
+    @classmethod
+    def teardown_class(cls):
+        for graph_image in glob.glob(f"*{cls.default_ext}"):
+            os.remove(graph_image)
+
+    def test_state_index(self):
+        with Graph(show=False) as graph:
+            node_a = Node("A")
+            with Cluster() as cluster_a:
+                node_b = Node("B")
+                with Cluster() as cluster_b:
+                    node_c = Node("C")
+            index = get_state_index()
+            assert index.children(graph) == [node_a, cluster_a]
+            assert index.children(cluster_a) == [node_b, cluster_b]
+            assert index.parent(node_c) is cluster_b
+            assert index.parent(cluster_a) is graph
+
+    def test_state_interleaved_graphs(self):
+        graph_a = Graph("a", show=False, render_on_exit=False)
+        graph_b = Graph("b", show=False, render_on_exit=False)
+        with graph_a:
+            node_a = Node("A")
+            with Cluster() as cluster_a:
+                node_b = Node("B")
+        with graph_b:
+            node_c = Node("C")
+        with graph_a:
+            node_d = Node("D")
+            assert get_state() == {graph_a: [node_a, {cluster_a: [node_b]}, node_d]}
+            Edge(node_a, cluster_a)
+        assert graph_b._state.to_dict() == {graph_b: [node_c]}
+
+    def test_state_compatibility_view(self):
+        with Graph(show=False) as graph:
+            node_a = Node("A")
+            with Cluster() as cluster_a:
+                node_b = Node("B")
+            assert get_state() == {graph: [node_a, {cluster_a: [node_b]}]}
+            assert search_state(get_state(), cluster_a) == [node_b]
+
+    def test_search_state(self):
+        with Graph(show=False) as graph:
+            node_a = Node("A")
+            with Cluster() as cluster_a:
+                node_b = Node("B")
+                with Cluster() as cluster_b:
+                    node_c = Node("C")
+            # Indexes return the direct children, nested dicts return clusters as dicts
+            assert search_state(get_state_index(), graph) == [node_a, cluster_a]
+            assert search_state(get_state_index(), cluster_b) == [node_c]
+            assert search_state(get_state(), graph) == [node_a, {cluster_a: [node_b, {cluster_b: [node_c]}]}]
+            assert search_state(get_state(), cluster_b) == [node_c]
+
+    def test_update_state(self):
+        with Graph(show=False) as graph:
+            node_a = Node("A")
+            with Cluster() as cluster_a:
+                node_b = Node("B")
+                with Cluster() as cluster_b:
+                    node_c = Node("C")
+            state = {graph: [node_a, {cluster_a: [node_b, {cluster_b: [node_c]}]}]}
+            index = update_state({graph: [node_a]}, graph, {cluster_a: [node_b, {cluster_b: [node_c]}]})
+            assert index.to_dict() == state
+            assert index.parent(node_c) is cluster_b
+
+            with pytest.raises(TypeError):
+                update_state(StateIndex(graph), graph, {node_a: [node_b]})
+            with pytest.raises(ValueError):
+                update_state(StateIndex(graph), graph, {cluster_a: [], cluster_b: []})
+
 
 class TestNode:
     @classmethod
@@ -123,10 +386,95 @@ class TestNode:
         for graph_image in glob.glob(f"*{cls.default_ext}"):
             os.remove(graph_image)
 
+    def test_node_default_attributes(self):
+        with Graph(theme=LightMode(), show=False) as graph:
+            node_a = Node("A", fontcolor="#FF0000")
+        node_line = next(line for line in graph.source.splitlines() if line.strip().startswith(node_a.id))
+        assert "fontcolor=\"#FF0000\"" in node_line
+        assert "fontname" not in node_line
+        assert "shape" not in node_line
+
     def test_node_graph_context(self):
         with pytest.raises(EnvironmentError):
             Node("A")
 
+    def test_node_icon_path(self, monkeypatch):
+        checks = []
+        isfile = os.path.isfile
+
+        def count_isfile(path):
+            checks.append(path)
+            return isfile(path)
+
+        monkeypatch.setattr(architectures.icons, "_ICON_PATHS", {})
+        monkeypatch.setattr(architectures.icons, "_BUNDLED_PACKS", [])
+        monkeypatch.setattr(architectures.icons, "_BUNDLED_PACK", os.devnull + ".pack")
+        monkeypatch.setattr("architectures.icons.os.path.isfile", count_isfile)
+        with Graph(theme=LightMode(), show=False, render_on_exit=False):
+            nodes = [Analytics() for i in range(3)]
+        assert len(checks) == 1
+        assert nodes[0].node_attrs["image"] == nodes[2].node_attrs["image"] == checks[0]
+        assert os.path.isfile(checks[0])
+
+    def test_node_icon_pack(self, tmp_path, monkeypatch):
+        icons = tmp_path / "icons" / "aws" / "analytics"
+        icons.mkdir(parents=True)
+        with open(os.path.join(architectures.icons._ICON_ROOT, Analytics._icon_dir, Analytics._icon), "rb") as f:
+            data = f.read()
+        (icons / "analytics.png").write_bytes(data)
+        (icons / "copy.png").write_bytes(data)
+
+        stats = build_icon_pack(tmp_path / "icons", tmp_path / "icons.pack")
+        assert stats["icons"] == 2
+        assert stats["distinct"] == 1
+
+        monkeypatch.setattr(architectures.icons, "_ICON_PATHS", {})
+        monkeypatch.setattr(architectures.icons, "_BUNDLED_PACKS", [])
+        monkeypatch.setattr(architectures.icons, "_BUNDLED_PACK", os.devnull + ".pack")
+        with register_icon_pack(str(tmp_path / "icons.pack"), tmp_path / "cache") as pack:
+            assert pack.names == ["aws/analytics/analytics.png", "aws/analytics/copy.png"]
+            assert pack.extract("aws/analytics/analytics.png") == pack.extract("aws/analytics/copy.png")
+            with Graph(theme=LightMode(), show=False, render_on_exit=False):
+                node = Analytics()
+            image = node.node_attrs["image"]
+            assert image.startswith(str(tmp_path / "cache"))
+            with open(image, "rb") as f:
+                assert f.read() == data
+
+        # Closing the pack unregisters it, so icons are no longer read from the closed pack
+        assert get_icon_packs() == []
+        assert resolve_icon(Analytics._icon_dir, Analytics._icon) == os.path.join(
+            architectures.icons._ICON_ROOT, Analytics._icon_dir, Analytics._icon
+        )
+
+    def test_node_icon_bundled_pack(self, tmp_path, monkeypatch):
+        pack_file = tmp_path / "icons.pack"
+        build_icon_pack(os.path.join(architectures.icons._ICON_ROOT, "icons"), pack_file)
+        monkeypatch.setattr(architectures.icons, "_BUNDLED_PACK", str(pack_file))
+        monkeypatch.setattr(architectures.icons, "_BUNDLED_PACKS", [])
+        monkeypatch.setattr(architectures.icons, "_ICON_PACKS", [])
+        monkeypatch.setattr(architectures.icons, "_ICON_PATHS", {})
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+        icon_path = resolve_icon(Analytics._icon_dir, Analytics._icon)
+        assert icon_path.startswith(str(tmp_path / "cache" / "architectures" / "icons" / "extracted"))
+        with open(icon_path, "rb") as f, open(os.path.join(architectures.icons._ICON_ROOT, Analytics._icon_dir, Analytics._icon), "rb") as original:
+            assert f.read() == original.read()
+        architectures.icons._BUNDLED_PACKS[0].close()
+
+    def test_node_icon_cache(self, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+        icon_cache = IconCache(tmp_path)
+        with Graph(theme=LightMode(), show=False, render_on_exit=False, icon_cache=icon_cache) as graph:
+            node_a = Analytics()
+            node_b = Analytics()
+        image = node_a.node_attrs["image"]
+        assert image == node_b.node_attrs["image"]
+        assert image.startswith(str(tmp_path))
+        with Image.open(image) as icon:
+            assert icon.size == (96, 96)
+        assert image in set(graph._iter_files())
+
 
 class TestEdge:
     @classmethod
@@ -269,6 +617,426 @@ class TestFlow:
                 Flow([node_a])
 
 
+class TestSettings:
+    def test_settings_checks(self):
+        settings = GraphSettings(rankdir="LR", fontsize=12.0, compound=True, rotate=90)
+        assert settings.get_attributes()["fontsize"] == "12.0"
+        assert GraphSettings(rankdir="").get_attribute("rankdir") == ""
+        with pytest.raises(ValueError, match="rankdir"):
+            GraphSettings(rankdir="XY")
+        with pytest.raises(TypeError, match="compound"):
+            GraphSettings(compound="true")
+        with pytest.raises(TypeError, match="fontsize"):
+            NodeSettings(fontsize=12)
+        with pytest.raises(ValueError, match="rotate"):
+            GraphSettings(rotate=400)
+        assert "rankdir" in GraphSettings._get_validators()
+
+
+class TestRenderCache:
+    @classmethod
+    def setup_class(cls):
+        cls.default_graphname = "my-architecture"
+        cls.default_ext = ".png"
+        cls.default_filename = cls.default_graphname + cls.default_ext
+
+    @classmethod
+    def teardown_class(cls):
+        for graph_image in glob.glob(f"*{cls.default_ext}"):
+            os.remove(graph_image)
+
+    def test_cache_hit(self, tmp_path, monkeypatch):
+        graph_name = "test_cache"
+        cache = RenderCache(tmp_path)
+        with Graph(graph_name, show=False, cache=cache) as graph:
+            Node("A")
+        os.remove(graph_name + self.default_ext)
+
+        def render_lines(*args, **kwargs):
+            raise AssertionError("The graph was rendered again")
+
+        monkeypatch.setattr("architectures.core.render_lines", render_lines)
+        graph.render()
+        assert os.path.exists(graph_name + self.default_ext)
+
+    def test_cache_key(self, tmp_path):
+        cache = RenderCache(tmp_path)
+        icon = tmp_path / "icon.png"
+        icon.write_bytes(b"a")
+        key = cache.key(["digraph {}"], "png", files=[str(icon)])
+        assert key == cache.key(["digraph {}"], "png", files=[str(icon)])
+        assert key != cache.key(["digraph {}"], "svg", files=[str(icon)])
+        icon.write_bytes(b"bb")
+        assert key != cache.key(["digraph {}"], "png", files=[str(icon)])
+
+    def test_layout_cache(self, tmp_path, monkeypatch):
+        cache = RenderCache(tmp_path, layouts=True)
+
+        def build(theme):
+            with Graph(theme=theme, show=False, cache=cache, render_on_exit=False) as graph:
+                node_a = Node("A")
+                with Cluster("B") as cluster_b:
+                    node_c = Node("C")
+                Edge(node_a, cluster_b)
+            return graph, node_a, cluster_b
+
+        light, node_a, cluster_b = build(LightMode())
+        dark = build(DarkMode())[0]
+        assert light.source != dark.source
+
+        layout = {
+            "bb": "0,0,200,100",
+            "objects": [{"name": cluster_b.id, "bb": "100,0,200,100"}, {"name": node_a.id, "pos": "36,50"}],
+            "edges": [{"id": "e0", "pos": "e,100,50 72,50"}],
+        }
+        calls = []
+
+        def pipe_lines(lines, output_file_format, engine="dot"):
+            calls.append("".join(lines))
+            return json.dumps(layout).encode("utf-8")
+
+        monkeypatch.setattr("architectures.core.pipe_lines", pipe_lines)
+        assert light._get_layout() == dark._get_layout()
+        assert len(calls) == 1
+        assert "#17202A" not in calls[0] and "#FFFFFF" not in calls[0]
+
+        source = "".join(dark._iter_source(layout=dark._get_layout()))
+        assert 'pos="36,50"' in source
+        assert 'bb="100,0,200,100"' in source
+        assert 'pos="e,100,50 72,50"' in source
+        assert "#17202A" in source
+
+    def test_layout_cache_async_deadline(self, tmp_path, monkeypatch):
+        cache = RenderCache(tmp_path, layouts=True)
+        with Graph(show=False, cache=cache, render_on_exit=False, output_directory=str(tmp_path)) as graph:
+            Node("A")
+        timeouts = []
+
+        async def pipe_lines_async(lines, output_file_format, engine="dot", timeout=None):
+            timeouts.append(timeout)
+            await asyncio.sleep(0.3)
+            return b"{}"
+
+        async def render_lines_async(lines, output_files, output_file_formats, timeout=None, **kwargs):
+            timeouts.append(timeout)
+            for output_file in output_files:
+                with open(output_file, "wb") as f:
+                    f.write(b"x")
+
+        monkeypatch.setattr("architectures.core.pipe_lines_async", pipe_lines_async)
+        monkeypatch.setattr("architectures.core.render_lines_async", render_lines_async)
+
+        # Laying the graph out uses up the whole timeout, so drawing it is never started
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(graph.render_async(timeout=0.2))
+        assert len(timeouts) == 1 and timeouts[0] <= 0.2
+
+        # The layout was cached by the first render, so only drawing is left
+        timeouts.clear()
+        asyncio.run(graph.render_async(timeout=60))
+        assert len(timeouts) == 1 and timeouts[0] <= 60
+        assert os.path.exists(graph.output_files[0])
+
+    def test_write_lines_failure(self, tmp_path):
+        def lines():
+            yield "digraph {\n"
+            raise RuntimeError()
+
+        output_file = tmp_path / "graph.gv"
+        with pytest.raises(RuntimeError):
+            write_lines(lines(), str(output_file))
+        # Neither a partial file nor the temporary file is left behind
+        assert os.listdir(tmp_path) == []
+        assert write_lines(["digraph {}\n"], str(output_file)) == str(output_file)
+        assert output_file.read_text() == "digraph {}\n"
+
+    def test_cache_eviction(self, tmp_path):
+        cache = RenderCache(tmp_path / "cache", max_size=10)
+        output_file = tmp_path / "output.png"
+        output_file.write_bytes(b"12345678")
+        cache.put("a" * 64, str(output_file))
+        cache.put("b" * 64, str(output_file))
+        assert not cache.get("a" * 64, str(tmp_path / "a.png"))
+        assert cache.get("b" * 64, str(tmp_path / "b.png"))
+
+    def test_cache_eviction_scans(self, tmp_path, monkeypatch):
+        scans = []
+        walk = os.walk
+
+        def count_walk(path):
+            scans.append(path)
+            return walk(path)
+
+        monkeypatch.setattr("architectures.render.os.walk", count_walk)
+        cache = RenderCache(tmp_path / "cache", max_size=100)
+        for i in range(10):
+            cache.write(f"{i:064x}", b"1234567890")
+        # The cache is only scanned to count its size until it goes over the limit
+        assert len(scans) == 1
+        cache.write("a" * 64, b"1234567890")
+        assert len(scans) == 2
+        assert sum(cache.read(f"{i:064x}") is not None for i in range(10)) == 8
+        cache.write("b" * 64, b"1")
+        assert len(scans) == 2
+
+
+class TestCatalog:
+    def test_lookup(self):
+        from architectures.providers.aws.compute import Batch
+        assert lookup("aws", "compute", "Batch") is Batch
+        assert lookup("aws.compute.Batch") is Batch
+        assert get_manifest()["aws"]["compute"]["Batch"] == {"icon": "batch.png", "label": "Batch"}
+        with pytest.raises(ValueError):
+            lookup("aws", "compute", "Missing")
+        with pytest.raises(ValueError):
+            lookup("aws", "compute")
+
+    def test_lazy_modules(self):
+        import architectures.providers as providers
+        assert providers.aws.compute.Batch is lookup("aws.compute.Batch")
+        assert "compute" in dir(providers.aws)
+        assert "Batch" in dir(providers.aws.compute)
+        with pytest.raises(AttributeError):
+            providers.aws.missing
+
+    def test_search(self):
+        results = search("bach", limit=None)
+        assert "aws.compute.Batch" in [result["name"] for result in results]
+        assert search("batch")[0]["name"] == "aws.compute.Batch"
+        assert all(result["provider"] == "gcp" for result in search("sql", provider="gcp"))
+        assert search("") == []
+
+        index = build_index([["aws", "compute", "Batch", "Batch", "0"], ["gcp", "compute", "Gke", "Gke", "1"]])
+        assert index["services"][0][2] == "Batch"
+        assert index["trigrams"][" ba"] == [0]
+
+
+class TestCli:
+    script = "from architectures.core import Graph, Node\n\nwith Graph('{name}'):\n    Node('A')\n"
+
+    def test_discover_scripts(self, tmp_path):
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "a.py").write_text("")
+        (tmp_path / "nested" / "b.py").write_text("")
+        (tmp_path / "__init__.py").write_text("")
+        (tmp_path / "c.txt").write_text("")
+        assert discover_scripts([str(tmp_path)]) == [str(tmp_path / "a.py"), str(tmp_path / "nested" / "b.py")]
+
+    def test_render(self, tmp_path):
+        (tmp_path / "a.py").write_text(self.script.format(name="A"))
+        (tmp_path / "b.py").write_text(self.script.format(name="B"))
+        (tmp_path / "c.py").write_text("raise ValueError()")
+        output_directory = tmp_path / "output"
+        summary_file = tmp_path / "summary.json"
+        assert main(["render", str(tmp_path), "-j", "2", "-o", str(output_directory), "-s", str(summary_file)]) == 1
+        assert sorted(os.listdir(output_directory)) == ["a.png", "b.png"]
+        summary = json.loads(summary_file.read_text())
+        assert summary["scripts"] == 3
+        assert summary["failures"] == 1
+
+    def test_render_scripts_modules(self, tmp_path):
+        # Scripts in different directories import their own helper of the same name
+        script = "from cli_helper import LABEL\nfrom architectures.core import Graph, Node\n\nwith Graph(LABEL):\n    Node('A')\n"
+        for name in ("one", "two"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "cli_helper.py").write_text(f"LABEL = '{name}'\n")
+            (tmp_path / name / "diagram.py").write_text(script)
+        output_directory = tmp_path / "output"
+        scripts = [str(tmp_path / name / "diagram.py") for name in ("one", "two")]
+        results = render_scripts(scripts, jobs=1, output_directory=str(output_directory))
+        assert [result["success"] for result in results] == [True, True]
+        assert [result["output_files"] for result in results] == [
+            [str(output_directory / "one.png")], [str(output_directory / "two.png")]
+        ]
+        assert "cli_helper" not in sys.modules
+
+    def test_render_scripts_duplicate_outputs(self, tmp_path):
+        (tmp_path / "a.py").write_text(self.script.format(name="Same"))
+        (tmp_path / "b.py").write_text(self.script.format(name="Same"))
+        (tmp_path / "c.py").write_text(self.script.format(name="Other"))
+        results = render_scripts(discover_scripts([str(tmp_path)]), jobs=2, output_directory=str(tmp_path / "output"))
+        assert [result["success"] for result in results] == [False, False, True]
+        assert "is written by more than one script" in results[0]["error"]
+
+    def test_run_script_exit(self, tmp_path, monkeypatch):
+        (tmp_path / "a.py").write_text("import sys\nsys.exit()\n")
+        (tmp_path / "b.py").write_text("import sys\nsys.exit(0)\n")
+        (tmp_path / "c.py").write_text("import sys\nsys.exit(2)\n")
+        (tmp_path / "d.py").write_text("raise KeyboardInterrupt()\n")
+        results = render_scripts([str(tmp_path / f"{name}.py") for name in "abc"], jobs=1)
+        assert [result["success"] for result in results] == [True, True, False]
+        with pytest.raises(KeyboardInterrupt):
+            run_script(str(tmp_path / "d.py"))
+
+    def test_search(self, capsys):
+        assert main(["search", "lambda", "-p", "aws", "--json"]) == 0
+        assert json.loads(capsys.readouterr().out)[0]["name"] == "aws.compute.Lambda"
+        assert main(["search", "zzzz"]) == 1
+
+
+class TestWatch:
+    script = "from watched_helper import LABEL\nfrom architectures.core import Graph, Node\n\nwith Graph('Watched'):\n    Node(LABEL)\n"
+
+    def test_watch(self, tmp_path):
+        helper = tmp_path / "watched_helper.py"
+        helper.write_text("LABEL = 'A'\n")
+        script = tmp_path / "diagram.py"
+        script.write_text(self.script)
+        output_directory = tmp_path / "output"
+
+        watcher = Watcher(str(script), str(output_directory))
+        assert watcher.run()["success"]
+        assert str(helper) in watcher.files
+        assert watcher.output_files == [str(output_directory / "watched.png")]
+        assert watcher.run()["unchanged"]
+        assert not watcher.changed()
+
+        helper.write_text("LABEL = 'B'\n")
+        os.utime(helper, (0, 0))
+        assert watcher.changed()
+        result = watcher.run()
+        assert result["success"] and not result["unchanged"]
+
+    def test_render_log(self, tmp_path, monkeypatch):
+        icon = tmp_path / "icon.png"
+        icon.write_bytes(b"icon")
+        renders = []
+        render_lines = architectures.core.render_lines
+
+        def counted_render_lines(*args, **kwargs):
+            renders.append(args)
+            return render_lines(*args, **kwargs)
+
+        def failed_render_lines(*args, **kwargs):
+            raise RuntimeError("Graphviz failed")
+
+        def render(label):
+            with Graph("Logged", show=False, output_directory=str(tmp_path)):
+                Node(label, image=str(icon))
+
+        render_log = {}
+        set_render_log(render_log)
+        try:
+            monkeypatch.setattr(architectures.core, "render_lines", counted_render_lines)
+            render("A")
+            render("A")
+            assert len(renders) == 1
+
+            # A failed render leaves the earlier output in place but is never treated as up to date
+            monkeypatch.setattr(architectures.core, "render_lines", failed_render_lines)
+            with pytest.raises(RuntimeError):
+                render("B")
+            assert not render_log
+            monkeypatch.setattr(architectures.core, "render_lines", counted_render_lines)
+            render("B")
+            assert len(renders) == 2
+
+            # Changing a referenced icon in place renders the graph again
+            icon.write_bytes(b"changed icon")
+            os.utime(icon, (0, 0))
+            render("B")
+            assert len(renders) == 3
+        finally:
+            set_render_log(None)
+
+
+class TestServer:
+    spec = {
+        "name": "Service",
+        "theme": "LightMode",
+        "nodes": ["A"],
+        "clusters": [{"label": "Tier", "id": "tier", "nodes": [{"label": "B", "service": "aws.compute.Batch"}]}],
+        "edges": [{"start": "A", "end": "tier", "color": "red"}],
+    }
+
+    def test_build_graph(self):
+        source = build_graph(self.spec).source
+        assert "subgraph cluster_tier {" in source
+        assert architectures.icons.resolve_icon("icons/aws/compute", "batch.png") in source
+        assert "color=red" in source
+        with pytest.raises(ValueError):
+            build_graph({"edges": [{"start": "A", "end": "B"}]})
+        with pytest.raises(ValueError):
+            build_graph({"nodes": [{"label": "A", "service": "aws.compute.Missing"}]})
+
+    def test_build_graph_attrs(self, tmp_path):
+        # Attributes only set DOT graph attributes, never the options of the graph object
+        graph = build_graph({"attrs": {"rankdir": "TB", "output_directory": str(tmp_path)}, "nodes": ["A"]})
+        assert graph.graph_attr["rankdir"] == "TB"
+        assert graph.output_directory != str(tmp_path)
+        invalid_specs = [
+            {"attrs": {"imagepath": "/"}},
+            {"attrs": ["rankdir"]},
+            {"attrs": {"label": {"nested": True}}},
+            {"nodes": [{"label": "A", "image": "/etc/passwd"}]},
+            {"nodes": [{"label": "<<IMG SRC='/etc/passwd'/>>"}]},
+            {"clusters": [{"label": "A", "fontpath": "/"}]},
+            {"nodes": ["A"], "edges": [{"start": "A", "end": "A", "shapefile": "/"}]},
+            {"nodes": ["A"], "output_file_format": "png"},
+        ]
+        for spec in invalid_specs:
+            with pytest.raises(ValueError):
+                build_graph(spec)
+        assert not os.listdir(tmp_path)
+
+    def test_queue_limit(self):
+        service = RenderService(workers=1, max_queue=1, cache=False)
+        service.submit("digraph {}", "svg")
+        with pytest.raises(RenderQueueFull):
+            service.submit("digraph {}", "svg")
+        with pytest.raises(ValueError):
+            service.submit("digraph {}", "svg", engine="rm")
+        stats = service.stats()
+        assert stats["submitted"] == 1
+        assert stats["rejected"] == 1
+        assert stats["queued"] == 1
+
+    def test_http(self):
+        with RenderService(workers=1, cache=False) as service:
+            with RenderServer(("127.0.0.1", 0), service, quiet=True) as server:
+                thread = threading.Thread(target=server.serve_forever, daemon=True)
+                thread.start()
+                url = f"http://127.0.0.1:{server.server_address[1]}"
+                try:
+                    with urllib.request.urlopen(f"{url}/stats") as response:
+                        assert json.loads(response.read())["workers"] == 1
+                    request = urllib.request.Request(f"{url}/render", data=b'{"nodes": 1}',
+                                                     headers={"Content-Type": "application/json"})
+                    with pytest.raises(urllib.error.HTTPError) as error:
+                        urllib.request.urlopen(request)
+                    assert error.value.code == 400
+
+                    # Raw DOT source is only rendered by servers that allow it
+                    for data, headers in ((b"digraph {}", {}),
+                                          (b'{"source": "digraph {}"}', {"Content-Type": "application/json"})):
+                        request = urllib.request.Request(f"{url}/render?format=svg", data=data, headers=headers)
+                        with pytest.raises(urllib.error.HTTPError) as error:
+                            urllib.request.urlopen(request)
+                        assert error.value.code == 403
+                    server.allow_source = True
+                    request = urllib.request.Request(f"{url}/render?format=svg", data=b"digraph {}")
+                    with urllib.request.urlopen(request) as response:
+                        assert response.status == 200
+                finally:
+                    server.shutdown()
+
+    def test_http_deadline(self):
+        # The service is never started, so the job stays queued past its deadline
+        service = RenderService(workers=1, cache=False)
+        with RenderServer(("127.0.0.1", 0), service, quiet=True) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            try:
+                request = urllib.request.Request(f"{url}/render?format=svg&timeout=0.2", data=b'{"nodes": ["A"]}',
+                                                 headers={"Content-Type": "application/json"})
+                with pytest.raises(urllib.error.HTTPError) as error:
+                    urllib.request.urlopen(request, timeout=10)
+                assert error.value.code == 504
+            finally:
+                server.shutdown()
+
+
 # Consider if we want to move testing providers to another file and
 # auto-generate tests for each provider.
 # class TestProviders: